@@ -0,0 +1,53 @@
+"""
+Measures the time to define many DataStruct classes (as a large format module would at import); with & without the layout cache.
+
+Classes are finalized lazily; `define` is the import cost, `finalize` is the deferred cost of using every class (via `finalize_all`).
+Each measurement runs in a fresh interpreter; the cache is measured cold (computed & written) and warm (loaded).
+
+Usage: python benchmarks/import_time.py [class_count]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+DEFINE_CLASSES = """
+import time
+start = time.perf_counter()
+from structlib.typedefs.datastruct import DataStruct, finalize_all
+from structlib.typedefs import integer, floating
+from structlib.typedefs.array import Array
+from structlib.typedefs.padding import Padding
+from structlib.typedefs.strings import StringBuffer
+
+classes = []  # Keep the classes alive; as a module would
+for i in range({count}):
+    members = [integer.UInt8, integer.Int32, floating.Float64, StringBuffer(1 + i), Array(4, integer.UInt16), Padding(2), integer.UInt16, floating.Float32, integer.Int64]
+    annotations = {{f"field_{{j}}": t for j, t in enumerate(members)}}
+    classes.append(type(f"Record{{i}}", (DataStruct,), {{"__annotations__": annotations, "__module__": __name__}}))
+defined = time.perf_counter()
+finalize_all()
+print(defined - start, time.perf_counter() - defined)
+"""
+
+
+def measure(count: int, cache_dir: str = None) -> str:
+    env = dict(os.environ)
+    env.pop("STRUCTLIB_LAYOUT_CACHE", None)
+    if cache_dir is not None:
+        env["STRUCTLIB_LAYOUT_CACHE"] = cache_dir
+    output = subprocess.check_output([sys.executable, "-c", DEFINE_CLASSES.format(count=count)], env=env)
+    define, finalize = (float(part) for part in output.split())
+    return f"define {define * 1e3:8.1f}ms; finalize {finalize * 1e3:8.1f}ms"
+
+
+def main(count: int):
+    print(f"{count} DataStruct classes")
+    print(f"no cache:   {measure(count)}")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        print(f"cold cache: {measure(count, cache_dir)}")
+        print(f"warm cache: {measure(count, cache_dir)}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,36 @@
+"""
+Measures `parallel_pack_buffer` scaling against a single-threaded `iter_pack`.
+
+Usage: python benchmarks/parallel_pack.py [element_count] [max_workers]
+"""
+import os
+import sys
+import time
+
+from structlib.parallel import parallel_pack_buffer
+from structlib.typedefs import floating
+
+
+def main(element_count: int, max_workers: int):
+    typedef = floating.Float64
+    samples = [i / 3 for i in range(element_count)]
+    print(f"{element_count} elements; {os.cpu_count()} cores")
+
+    start = time.perf_counter()
+    expected = typedef.iter_pack(*samples)
+    baseline = time.perf_counter() - start
+    print(f"serial: {baseline:.3f}s")
+
+    workers = 1
+    while workers <= max_workers:
+        buffer = bytearray(len(expected))
+        start = time.perf_counter()
+        parallel_pack_buffer(typedef, buffer, *samples, workers=workers)
+        elapsed = time.perf_counter() - start
+        assert buffer == expected
+        print(f"workers={workers}: {elapsed:.3f}s ({baseline / elapsed:.2f}x)")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000, int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count())
@@ -0,0 +1,39 @@
+"""
+Measures `parallel_iter_unpack` scaling against a single-process `iter_unpack`.
+
+Usage: python benchmarks/parallel_unpack.py [record_count] [max_workers]
+"""
+import os
+import sys
+import time
+
+from structlib.parallel import parallel_iter_unpack
+from structlib.protocols.typedef import size_of
+from structlib.typedefs import integer, floating
+from structlib.typedefs.structure import Struct
+
+RECORD = Struct(integer.UInt32, integer.Int16, floating.Float32, floating.Float64)
+
+
+def main(record_count: int, max_workers: int):
+    packed = RECORD.struct_pack(1, -2, 0.5, 0.25) * record_count
+    size = size_of(RECORD)
+    print(f"{record_count} records ({len(packed)} bytes); {os.cpu_count()} cores")
+
+    start = time.perf_counter()
+    expected = tuple(RECORD.struct_unpack(packed[i * size:(i + 1) * size]) for i in range(record_count))
+    baseline = time.perf_counter() - start
+    print(f"serial: {baseline:.3f}s")
+
+    workers = 1
+    while workers <= max_workers:
+        start = time.perf_counter()
+        result = parallel_iter_unpack(RECORD, packed, record_count, workers=workers)
+        elapsed = time.perf_counter() - start
+        assert result == expected
+        print(f"workers={workers}: {elapsed:.3f}s ({baseline / elapsed:.2f}x)")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000, int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count())
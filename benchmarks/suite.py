@@ -0,0 +1,335 @@
+"""
+Measures pack/unpack throughput of each typedef in every access mode; compared against an equivalent stdlib `struct` format where one exists.
+
+Uses `timeit` so it runs offline without extra dependencies.
+Results are stored as JSON; pass a previous result to `--compare` to report regressions.
+
+`--memory` runs the same workloads under `tracemalloc` instead of timing them; reporting (per operation) the peak memory
+allocated while running & the memory (and number of blocks) still allocated afterwards (E.G. the results), then totals per typedef.
+
+Usage: python benchmarks/suite.py [--output results.json] [--compare baseline.json] [--filter Integer] [--quick] [--memory]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import re
+import struct
+import sys
+import time
+import timeit
+import tracemalloc
+from dataclasses import dataclass, field
+from io import BytesIO
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from structlib.protocols.packing import IterPackable, StructPackable, iter_pack, iter_unpack, iter_pack_buffer, iter_unpack_buffer, iter_pack_stream, iter_unpack_stream, pack, unpack, pack_buffer, unpack_buffer, pack_stream, unpack_stream
+from structlib.protocols.typedef import TypeDefSizable, size_of
+from structlib.typedefs import integer, floating, boolean
+from structlib.typedefs.array import Array
+from structlib.typedefs.datastruct import DataStruct
+from structlib.typedefs.strings import StringBuffer, PascalString
+from structlib.typedefs.structure import Struct
+
+MODES = ("pack", "unpack", "pack_buffer", "unpack_buffer", "pack_stream", "unpack_stream")
+COUNTS = (1, 64, 1024)
+QUICK_COUNTS = (1, 64)
+
+
+class Record(DataStruct):
+    a: integer.UInt8
+    b: integer.UInt16
+    c: floating.Float32
+
+
+@dataclass
+class Subject:
+    """
+    A typedef to benchmark; `sample(i)` generates the i-th value, `stdlib` is the equivalent struct format (per element) if one exists.
+    """
+    name: str
+    typedef: Any
+    sample: Callable[[int], Any]
+    stdlib: Optional[str] = None
+    stdlib_args: Callable[[Any], Sequence[Any]] = lambda v: (v,)
+
+
+SUBJECTS = [
+    Subject("IntegerDefinition", integer.Int32, lambda i: i - 512, "i"),
+    Subject("FloatDefinition", floating.Float64, lambda i: i / 3, "d"),
+    Subject("BooleanDefinition", boolean.Boolean, lambda i: i % 3 == 0, "?"),
+    Subject("StringBuffer", StringBuffer(16), lambda i: f"name_{i}", "16s", lambda v: (v.encode(),)),
+    Subject("PascalString", PascalString(integer.UInt8), lambda i: f"name_{i}"),
+    Subject("Array", Array(4, integer.UInt16), lambda i: [i % 7, i % 11, i % 13, i % 17], "4H", tuple),
+    Subject("Struct", Struct(integer.UInt8, integer.UInt16, floating.Float32), lambda i: (i % 256, i, i / 4), "BxHf", tuple),
+    Subject("DataStruct", Record, lambda i: Record.__typedef_tuple2dclass__(i % 256, i, i / 4), "BxHf", lambda v: v.__typedef_dclass2tuple__()),
+]
+
+
+@dataclass
+class Case:
+    name: str
+    func: Callable[[], Any]
+    items: int
+    bytes: int
+    baseline: Optional[Callable[[], Any]] = None
+
+
+@dataclass
+class Result:
+    seconds: float
+    items_per_second: float
+    bytes_per_second: float
+    baseline_seconds: Optional[float] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def baseline_ratio(self) -> Optional[float]:
+        return self.seconds / self.baseline_seconds if self.baseline_seconds else None
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"seconds": self.seconds, "items_per_second": self.items_per_second, "bytes_per_second": self.bytes_per_second, "baseline_seconds": self.baseline_seconds, "baseline_ratio": self.baseline_ratio, **self.extra}
+
+
+def _single_ops(typedef: Any, values: List[Any]) -> Tuple[Dict[str, Callable[[], Any]], int]:
+    # Typedefs which aren't IterPackable (or a count of 1) are packed one element at a time; as callers would
+    is_struct = isinstance(typedef, StructPackable)
+    args = [tuple(v) if is_struct else (v,) for v in values]
+    packed = [pack(typedef, *a) for a in args]
+    blob = bytearray()
+    for a in args:
+        pack_buffer(typedef, blob, *a, offset=len(blob), origin=0)
+    blob = bytes(blob)
+
+    def do_pack():
+        return [pack(typedef, *a) for a in args]
+
+    def do_unpack():
+        return [unpack(typedef, p) for p in packed]
+
+    def do_pack_buffer():
+        buffer = bytearray(len(blob))
+        offset = 0
+        for a in args:
+            offset += pack_buffer(typedef, buffer, *a, offset=offset, origin=0)
+        return buffer
+
+    def do_unpack_buffer():
+        offset, results = 0, []
+        for _ in args:
+            read, result = unpack_buffer(typedef, blob, offset=offset, origin=0)
+            offset += read
+            results.append(result)
+        return results
+
+    def do_pack_stream():
+        with BytesIO() as stream:
+            for a in args:
+                pack_stream(typedef, stream, *a, origin=0)
+
+    def do_unpack_stream():
+        with BytesIO(blob) as stream:
+            return [unpack_stream(typedef, stream, origin=0) for _ in args]
+
+    return {"pack": do_pack, "unpack": do_unpack, "pack_buffer": do_pack_buffer, "unpack_buffer": do_unpack_buffer, "pack_stream": do_pack_stream, "unpack_stream": do_unpack_stream}, len(blob)
+
+
+def _iter_ops(typedef: Any, values: List[Any]) -> Tuple[Dict[str, Callable[[], Any]], int]:
+    count = len(values)
+    blob = bytes(iter_pack(typedef, *values))
+
+    def do_pack_buffer():
+        buffer = bytearray(len(blob))
+        return iter_pack_buffer(typedef, buffer, *values, offset=0, origin=0)
+
+    def do_pack_stream():
+        with BytesIO() as stream:
+            return iter_pack_stream(typedef, stream, *values, origin=0)
+
+    def do_unpack_stream():
+        with BytesIO(blob) as stream:
+            return iter_unpack_stream(typedef, stream, count, origin=0)
+
+    return {
+        "pack": lambda: iter_pack(typedef, *values),
+        "unpack": lambda: iter_unpack(typedef, blob, count),
+        "pack_buffer": do_pack_buffer,
+        "unpack_buffer": lambda: iter_unpack_buffer(typedef, blob, count, offset=0, origin=0),
+        "pack_stream": do_pack_stream,
+        "unpack_stream": do_unpack_stream,
+    }, len(blob)
+
+
+def _stdlib_ops(fmt: str, args: List[Any], count: int) -> Dict[str, Callable[[], Any]]:
+    layout = struct.Struct("<" + fmt * count)
+    flat = [arg for element in args for arg in element]
+    blob = layout.pack(*flat)
+
+    def do_pack_buffer():
+        buffer = bytearray(layout.size)
+        layout.pack_into(buffer, 0, *flat)
+        return buffer
+
+    def do_pack_stream():
+        with BytesIO() as stream:
+            stream.write(layout.pack(*flat))
+
+    def do_unpack_stream():
+        with BytesIO(blob) as stream:
+            return layout.unpack(stream.read(layout.size))
+
+    return {
+        "pack": lambda: layout.pack(*flat),
+        "unpack": lambda: layout.unpack(blob),
+        "pack_buffer": do_pack_buffer,
+        "unpack_buffer": lambda: layout.unpack_from(blob, 0),
+        "pack_stream": do_pack_stream,
+        "unpack_stream": do_unpack_stream,
+    }
+
+
+def build_cases(counts: Sequence[int] = COUNTS, pattern: str = None) -> List[Case]:
+    cases = []
+    for subject in SUBJECTS:
+        for count in counts:
+            values = [subject.sample(i) for i in range(count)]
+            if count > 1 and isinstance(subject.typedef, IterPackable):
+                ops, size = _iter_ops(subject.typedef, values)
+            else:
+                ops, size = _single_ops(subject.typedef, values)
+            baselines = {}
+            # Only compare layouts which match byte-for-byte; over-aligned arrays of elements aren't equivalent
+            if subject.stdlib is not None and (not isinstance(subject.typedef, TypeDefSizable) or struct.calcsize("<" + subject.stdlib) == size_of(subject.typedef)):
+                baselines = _stdlib_ops(subject.stdlib, [subject.stdlib_args(v) for v in values], count)
+            for mode in MODES:
+                name = f"{subject.name}/{mode}/{count}"
+                if pattern is not None and not re.search(pattern, name):
+                    continue
+                cases.append(Case(name, ops[mode], count, size, baselines.get(mode)))
+    return cases
+
+
+def measure(func: Callable[[], Any], repeat: int, min_time: float) -> float:
+    """
+    Returns the fastest time (in seconds) of a single call; the best of `repeat` runs, each lasting roughly `min_time`.
+    """
+    timer = timeit.Timer(func)
+    loops = 1
+    while True:  # Like Timer.autorange; but with a configurable minimum time
+        elapsed = timer.timeit(loops)
+        if elapsed >= min_time:
+            break
+        loops *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+    return min(timer.repeat(repeat, loops)) / loops
+
+
+def run(cases: List[Case], repeat: int, min_time: float, log=print) -> Dict[str, Result]:
+    results = {}
+    for case in cases:
+        seconds = measure(case.func, repeat, min_time)
+        baseline_seconds = measure(case.baseline, repeat, min_time) if case.baseline is not None else None
+        result = results[case.name] = Result(seconds, case.items / seconds, case.bytes / seconds, baseline_seconds)
+        ratio = f"{result.baseline_ratio:8.1f}x struct" if baseline_seconds else ""
+        log(f"{case.name:40} {seconds * 1e6:12.2f} us {result.items_per_second:14,.0f} items/s {ratio}")
+    return results
+
+
+def measure_memory(func: Callable[[], Any], loops: int) -> Dict[str, float]:
+    """
+    Runs `func` under tracemalloc; returns the peak bytes allocated during a call, and the bytes & blocks retained after a call (averaged over `loops`).
+    """
+    func()  # Warm up; exclude one-time allocations (E.G. caches)
+    tracemalloc.start()
+    try:
+        results = []
+        before = tracemalloc.take_snapshot()
+        peak = 0
+        for _ in range(loops):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            results.append(func())
+            _, call_peak = tracemalloc.get_traced_memory()
+            peak = max(peak, call_peak - current)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    # The snapshot taken by `before` isn't traced, but the results list is; which is negligible for a small `loops`
+    diff = after.compare_to(before, "filename")
+    retained_bytes = sum(stat.size_diff for stat in diff)
+    retained_blocks = sum(stat.count_diff for stat in diff)
+    return {"peak_bytes": peak, "retained_bytes": retained_bytes / loops, "retained_blocks": retained_blocks / loops}
+
+
+def run_memory(cases: List[Case], loops: int, log=print) -> Dict[str, Dict[str, float]]:
+    results = {}
+    totals: Dict[str, Dict[str, float]] = {}
+    for case in cases:
+        result = results[case.name] = measure_memory(case.func, loops)
+        if case.baseline is not None:
+            result["baseline_peak_bytes"] = measure_memory(case.baseline, loops)["peak_bytes"]
+        result["peak_bytes_per_item"] = result["peak_bytes"] / case.items
+        log(f"{case.name:40} {result['peak_bytes']:12,.0f} peak B {result['retained_bytes']:12,.0f} retained B {result['retained_blocks']:10,.1f} blocks")
+        typedef_totals = totals.setdefault(case.name.split("/")[0], {"peak_bytes": 0, "retained_bytes": 0, "retained_blocks": 0})
+        for key in typedef_totals:
+            typedef_totals[key] += result[key]
+    log("")
+    for name, total in totals.items():
+        log(f"{name:40} {total['peak_bytes']:12,.0f} peak B {total['retained_bytes']:12,.0f} retained B {total['retained_blocks']:10,.1f} blocks")
+    return results
+
+
+def compare(results: Dict[str, Dict[str, Any]], previous: Dict[str, Dict[str, Any]], threshold: float, metric: str = "seconds") -> List[str]:
+    """
+    Returns the names of cases where `metric` is worse than the previous run by more than `threshold` (relative).
+    """
+    regressions = []
+    for name, result in results.items():
+        old = previous.get(name)
+        if old is not None and metric in old and result[metric] > old[metric] * (1 + threshold):
+            regressions.append(name)
+    return regressions
+
+
+def metadata() -> Dict[str, Any]:
+    return {"python": sys.version, "implementation": platform.python_implementation(), "platform": platform.platform(), "timestamp": time.time()}
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark structlib typedefs against the stdlib struct module.")
+    parser.add_argument("--output", help="Write results to this JSON file.")
+    parser.add_argument("--compare", help="A previous JSON result; exits with 1 if any case regressed.")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Relative slowdown considered a regression.")
+    parser.add_argument("--filter", help="Only run cases whose name matches this regex.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--min-time", type=float, default=0.05, help="Minimum seconds per repeat.")
+    parser.add_argument("--quick", action="store_true", help="Fewer sizes & shorter runs; for smoke testing.")
+    parser.add_argument("--memory", action="store_true", help="Measure allocations with tracemalloc instead of time.")
+    parser.add_argument("--memory-loops", type=int, default=8, help="Calls per case when measuring allocations.")
+    args = parser.parse_args(argv)
+
+    counts = QUICK_COUNTS if args.quick else COUNTS
+    min_time = 0.005 if args.quick else args.min_time
+    cases = build_cases(counts, args.filter)
+    if args.memory:
+        metric, unit, scale = "peak_bytes", "B", 1
+        results = run_memory(cases, args.memory_loops)
+    else:
+        metric, unit, scale = "seconds", "us", 1e6
+        results = {name: result.to_json() for name, result in run(cases, args.repeat, min_time).items()}
+
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump({"metadata": {**metadata(), "mode": "memory" if args.memory else "time"}, "results": results}, handle, indent=2)
+    if args.compare:
+        with open(args.compare) as handle:
+            previous = json.load(handle)["results"]
+        regressions = compare(results, previous, args.threshold, metric)
+        for name in regressions:
+            print(f"REGRESSION {name}: {previous[name][metric] * scale:.2f} {unit} -> {results[name][metric] * scale:.2f} {unit}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
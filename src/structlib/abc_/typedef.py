@@ -1,13 +1,61 @@
 from __future__ import annotations
 
 from copy import copy
-from typing import TypeVar
+from typing import TypeVar, Optional, Callable, Any, Tuple
+from weakref import WeakValueDictionary
 
 from structlib.byteorder import ByteOrder
 from structlib.protocols.typedef import TypeDefAlignable, TypeDefByteOrder, TypeDefSizable
 
 T = TypeVar("T")
 
+# Derived typedefs organized by (id(root), alignment, byteorder)
+#   Derived typedefs hold a reference to their root (`__typedef_root__`); so the root's id can't be reused while an entry exists
+_DERIVED_TYPEDEFS: WeakValueDictionary[Tuple[int, Optional[int], Optional[ByteOrder]], Any] = WeakValueDictionary()
+
+
+def intern_derived(typedef: T, alignment: Optional[int], byteorder: Optional[ByteOrder], derive: Callable[[T], T]) -> T:
+    """
+    Returns the typedef derived from `typedef` with the given alignment & byteorder.
+
+    Derived typedefs are interned; deriving the same alignment & byteorder from a typedef (or any typedef derived from it) returns the same instance.
+    `derive` is only called if the typedef doesn't exist yet.
+    """
+    root = vars(typedef).get("__typedef_root__", typedef)  # vars; DataStruct subclasses shouldn't inherit their parent's root
+    if getattr(root, "__typedef_alignment__", None) == alignment and getattr(root, "__typedef_byteorder__", None) == byteorder:
+        return root
+    key = (id(root), alignment, byteorder)
+    derived = _DERIVED_TYPEDEFS.get(key)
+    if derived is None:
+        derived = derive(typedef)
+        derived.__typedef_root__ = root
+        _DERIVED_TYPEDEFS[key] = derived
+    return derived
+
+
+def copy_with(**attrs: Any) -> Callable[[T], T]:
+    """
+    Returns a `derive` function (for `intern_derived`) which copies the typedef and sets the attributes.
+    """
+
+    def derive(typedef: T) -> T:
+        inst = copy(typedef)
+        for name, value in attrs.items():
+            setattr(inst, name, value)
+        return inst
+
+    return derive
+
+
+def derive_backing(typedef: T, backing: Any) -> T:
+    """
+    Returns the typedef with its `_backing` typedef replaced; for wrappers which take their alignment & byteorder from `_backing` (E.G. Arrays & Enums).
+
+    Interned like any other derived typedef; `backing` should be derived from the current `_backing` (via `align_as` / `byteorder_as`).
+    """
+    byteorder = getattr(backing, "__typedef_byteorder__", None)  # Backings without a byteorder; E.G. an Array of Structs
+    return intern_derived(typedef, backing.__typedef_alignment__, byteorder, copy_with(_backing=backing))
+
 
 class TypeDefAlignableABC(TypeDefAlignable):
     def __init__(self, alignment: int):
@@ -17,9 +65,8 @@ class TypeDefAlignableABC(TypeDefAlignable):
         if self.__typedef_alignment__ == alignment:
             return self
         else:
-            inst = copy(self)
-            inst.__typedef_alignment__ = alignment
-            return inst
+            byteorder = getattr(self, "__typedef_byteorder__", None)
+            return intern_derived(self, alignment, byteorder, copy_with(__typedef_alignment__=alignment))
 
 
 class TypeDefSizableABC(TypeDefSizable):
@@ -35,7 +82,6 @@ class TypeDefByteOrderABC(TypeDefByteOrder):
         if self.__typedef_byteorder__ == byteorder:
             return self
         else:
-            inst = copy(self)
-            inst.__typedef_byteorder__ = byteorder
-            return inst
+            alignment = getattr(self, "__typedef_alignment__", None)
+            return intern_derived(self, alignment, byteorder, copy_with(__typedef_byteorder__=byteorder))
 
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import ctypes
+import sys
+from typing import Any, List, Optional, Tuple, Type
+
+from structlib.errors import VarSizeError, UnpackBufferSizeError
+from structlib.protocols.typedef import TypeDefSizable, size_of, native_size_of, align_of, byteorder_of, calculate_padding
+from structlib.typedefs.array import FixedCollection
+from structlib.typedefs.boolean import BooleanDefinition
+from structlib.typedefs.datastruct import TypeDefDataclass
+from structlib.typedefs.enumeration import EnumDefinition
+from structlib.typedefs.fixedpoint import ScaledIntegerDefinition
+from structlib.typedefs.floating import FloatDefinition
+from structlib.typedefs.integer import IntegerDefinition
+from structlib.typedefs.strings import StringBuffer
+from structlib.typedefs.structure import Struct
+from structlib.typing_ import WritableBuffer
+from structlib.utils import WeakIdCache
+
+CType = Type[Any]  # A ctypes type; simple types, arrays & structures
+
+_INTEGER_CTYPES = {
+    (1, True): ctypes.c_int8, (2, True): ctypes.c_int16, (4, True): ctypes.c_int32, (8, True): ctypes.c_int64,
+    (1, False): ctypes.c_uint8, (2, False): ctypes.c_uint16, (4, False): ctypes.c_uint32, (8, False): ctypes.c_uint64,
+}
+_FLOAT_CTYPES = {4: ctypes.c_float, 8: ctypes.c_double}
+_STRUCTURE_BASES = {"little": ctypes.LittleEndianStructure, "big": ctypes.BigEndianStructure}
+
+# Generated types organized by typedef; entries are removed once their typedef is collected
+_CTYPES = WeakIdCache()
+
+
+def _ordered(ctype: CType, byteorder: str) -> CType:
+    if byteorder == sys.byteorder:
+        return ctype
+    return getattr(ctype, "__ctype_be__" if byteorder == "big" else "__ctype_le__")
+
+
+def _leaf_byteorder(typedef: Any) -> Optional[str]:
+    # The byteorder of a primitive member; None if it has no byteorder (single bytes, booleans, strings & nested structs)
+    if isinstance(typedef, FixedCollection):
+        return _leaf_byteorder(typedef._backing)
+    elif isinstance(typedef, (IntegerDefinition, FloatDefinition, EnumDefinition, ScaledIntegerDefinition)) and native_size_of(typedef) > 1:
+        return byteorder_of(typedef)
+    return None
+
+
+def _make_structure(name: str, typedef: Any, members: List[Tuple[str, CType, int]]) -> CType:
+    """
+    Builds a packed structure; members are placed at their offsets by explicit padding fields, so the layout doesn't depend on the C compiler's rules.
+    """
+    byteorders = {_leaf_byteorder(t) for t in _members_of(typedef)} - {None}
+    fields = []
+    position = 0
+    for field_name, ctype, offset in members:
+        if offset > position:
+            fields.append((f"_pad_{len(fields)}", ctypes.c_uint8 * (offset - position)))
+        fields.append((field_name, ctype))
+        position = offset + ctypes.sizeof(ctype)
+    size = size_of(typedef)
+    if size > position:
+        fields.append((f"_pad_{len(fields)}", ctypes.c_uint8 * (size - position)))
+    # Packed; `_layout_` is explicit since Python 3.14 deprecates `_pack_` without it (ignored by older versions)
+    attrs = {"_pack_": 1, "_layout_": "ms", "_fields_": fields}
+    if len(byteorders) == 1:
+        try:
+            return type(name, (_STRUCTURE_BASES[byteorders.pop()],), attrs)
+        except TypeError:
+            pass  # A member has no other-endian variant (E.G. c_bool); members are already ordered, so a native structure is equivalent
+    return type(name, (ctypes.Structure,), attrs)
+
+
+def _members_of(typedef: Any) -> Tuple[Any, ...]:
+    struct = typedef.__typedef_dclass_struct_packable__ if isinstance(typedef, TypeDefDataclass) else typedef
+    if isinstance(struct, Struct):
+        return struct._types
+    return typedef,
+
+
+def _struct_ctype(name: str, typedef: Any, struct: Struct, names: List[str]) -> CType:
+    if struct._offsets is None:
+        raise VarSizeError()
+    members = []
+    for t, offset, is_const in zip(struct._types, struct._offsets, struct._const_members):
+        if is_const:
+            continue  # Const members (E.G. Padding) are left as padding fields
+        members.append((names[len(members)], _native_ctype(t), offset))
+    return _make_structure(name, typedef, members)
+
+
+def _native_ctype(typedef: Any) -> CType:
+    """
+    The ctype of the typedef's value; excluding any padding from over-alignment.
+    """
+    if not isinstance(typedef, TypeDefSizable):
+        raise VarSizeError()
+    if isinstance(typedef, IntegerDefinition):
+        ctype = _INTEGER_CTYPES.get((native_size_of(typedef), typedef._signed))
+        if ctype is None:
+            raise TypeError(f"Cannot convert `{typedef}` to a ctype; ctypes doesn't support '{native_size_of(typedef) * 8}' bit integers!")
+        return _ordered(ctype, byteorder_of(typedef))
+    elif isinstance(typedef, FloatDefinition):
+        ctype = _FLOAT_CTYPES.get(native_size_of(typedef))
+        if ctype is None:
+            raise TypeError(f"Cannot convert `{typedef}` to a ctype; ctypes doesn't support '{native_size_of(typedef) * 8}' bit floats!")
+        return _ordered(ctype, byteorder_of(typedef))
+    elif isinstance(typedef, BooleanDefinition):
+        return ctypes.c_bool
+    elif isinstance(typedef, StringBuffer):
+        return ctypes.c_char * native_size_of(typedef)
+    elif isinstance(typedef, (EnumDefinition, ScaledIntegerDefinition)):
+        return _native_ctype(typedef._backing)  # Stored as the raw integer
+    elif isinstance(typedef, FixedCollection):
+        return to_ctypes(typedef._backing) * typedef._args
+    elif isinstance(typedef, Struct):
+        names = [f"f{i}" for i in range(len(typedef._types) - sum(typedef._const_members))]
+        return _struct_ctype("Struct", typedef, typedef, names)
+    elif isinstance(typedef, TypeDefDataclass):
+        struct = typedef.__typedef_dclass_struct_packable__
+        return _struct_ctype(typedef.__name__, typedef, struct, list(typedef.__typedef_dclass_name_order__))
+    else:
+        raise TypeError(f"Cannot convert `{typedef}` to a ctype!")
+
+
+def _build_ctype(typedef: Any) -> CType:
+    ctype = _native_ctype(typedef)
+    if ctypes.sizeof(ctype) != size_of(typedef):
+        ctype = _make_structure(f"Aligned_{getattr(ctype, '__name__', 'value')}", typedef, [("value", ctype, 0)])
+    return ctype
+
+
+def to_ctypes(typedef: Any) -> CType:
+    """
+    Converts a fixed-size typedef to an equivalent ctypes type; `ctypes.sizeof` of the type is `size_of(typedef)`.
+
+    Structs & DataStructs become `ctypes.Structure` subclasses (`LittleEndianStructure` / `BigEndianStructure` if all members share a byteorder).
+    Struct fields are named `f0`, `f1`, ...; DataStruct fields use the attribute names.
+    Alignment is reproduced by explicit padding fields (`_pad_N`), so the structures are packed.
+    Over-aligned primitives become a structure with a single field (`value`).
+    Enums & scaled integers are exposed as their raw integer values; strings as their raw (encoded) bytes.
+
+    Generated types are cached; converting the same typedef returns the same type.
+
+    :raises VarSizeError: The typedef (or one of its members) is not fixed-size.
+    :raises TypeError: The typedef has no ctypes equivalent.
+    """
+    ctype = _CTYPES.get(typedef)
+    if ctype is None:
+        ctype = _build_ctype(typedef)
+        _CTYPES.put(typedef, ctype)
+    return ctype
+
+
+def view_ctypes(typedef: Any, buffer: WritableBuffer, offset: int = 0, *, origin: int = 0, count: int = None) -> Any:
+    """
+    Views the buffer as a ctypes instance of `to_ctypes(typedef)`; reading/writing fields reads/writes the buffer directly.
+
+    The buffer must be writable (E.G. bytearray, writable mmap, shared memory) and must not be resized while the view is alive.
+
+    :param offset: The offset of the record; the record is aligned relative to the origin.
+    :param origin: The origin of the buffer; alignment is relative to the origin.
+    :param count: If specified, views `count` consecutive records as a ctypes array.
+    """
+    ctype = to_ctypes(typedef)
+    if count is not None:
+        ctype = ctype * count
+    start = origin + offset + calculate_padding(align_of(typedef), offset)
+    required = start + ctypes.sizeof(ctype)
+    if len(buffer) < required:
+        raise UnpackBufferSizeError(view_ctypes.__name__, len(buffer), required)
+    return ctype.from_buffer(buffer, start)
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from typing import Any, List
+
+from structlib.errors import VarSizeError, UnpackBufferSizeError, FixedBufferSizeError
+from structlib.io import bufferio
+from structlib.protocols.typedef import TypeDefSizable, size_of, native_size_of, align_of, byteorder_of, calculate_padding
+from structlib.typedefs.array import FixedCollection
+from structlib.typedefs.boolean import BooleanDefinition
+from structlib.typedefs.datastruct import TypeDefDataclass
+from structlib.typedefs.enumeration import EnumDefinition
+from structlib.typedefs.fixedpoint import ScaledIntegerDefinition
+from structlib.typedefs.floating import FloatDefinition
+from structlib.typedefs.integer import IntegerDefinition
+from structlib.typedefs.strings import StringBuffer
+from structlib.typedefs.structure import Struct
+from structlib.typing_ import ReadableBuffer, WritableBuffer
+
+try:
+    import numpy
+except ImportError:  # numpy is optional; only this module requires it
+    numpy = None
+
+_BYTEORDER_CHARS = {"little": "<", "big": ">"}
+
+
+def _require_numpy():
+    if numpy is None:
+        raise ImportError("NumPy interop requires numpy; install it via `pip install numpy`!")
+
+
+def _byteorder_char(typedef: Any) -> str:
+    if native_size_of(typedef) == 1:
+        return "|"  # Single bytes have no byteorder
+    return _BYTEORDER_CHARS[byteorder_of(typedef)]
+
+
+def _struct_dtype(struct: Struct, names: List[str]) -> numpy.dtype:
+    if struct._offsets is None:
+        raise VarSizeError()
+    formats, offsets = [], []
+    for t, offset, is_const in zip(struct._types, struct._offsets, struct._const_members):
+        if is_const:
+            continue  # Const members (E.G. Padding) are left as gaps in the layout
+        formats.append(_native_dtype(t))
+        offsets.append(offset)
+    return numpy.dtype({"names": names, "formats": formats, "offsets": offsets, "itemsize": size_of(struct)})
+
+
+def _native_dtype(typedef: Any) -> numpy.dtype:
+    """
+    The dtype of the typedef's value; excluding any padding from over-alignment.
+    """
+    if not isinstance(typedef, TypeDefSizable):
+        raise VarSizeError()
+    if isinstance(typedef, IntegerDefinition):
+        size = native_size_of(typedef)
+        if size not in (1, 2, 4, 8):
+            raise TypeError(f"Cannot convert `{typedef}` to a numpy dtype; numpy doesn't support '{size * 8}' bit integers!")
+        return numpy.dtype(f"{_byteorder_char(typedef)}{'i' if typedef._signed else 'u'}{size}")
+    elif isinstance(typedef, FloatDefinition):
+        return numpy.dtype(f"{_byteorder_char(typedef)}f{native_size_of(typedef)}")
+    elif isinstance(typedef, BooleanDefinition):
+        return numpy.dtype("?")
+    elif isinstance(typedef, StringBuffer):
+        return numpy.dtype(f"S{native_size_of(typedef)}")
+    elif isinstance(typedef, (EnumDefinition, ScaledIntegerDefinition)):
+        return _native_dtype(typedef._backing)  # Stored as the raw integer
+    elif isinstance(typedef, FixedCollection):
+        return numpy.dtype((to_numpy_dtype(typedef._backing), (typedef._args,)))
+    elif isinstance(typedef, Struct):
+        names = [f"f{i}" for i in range(len(typedef._types) - sum(typedef._const_members))]
+        return _struct_dtype(typedef, names)
+    elif isinstance(typedef, TypeDefDataclass):
+        struct = typedef.__typedef_dclass_struct_packable__
+        return _struct_dtype(struct, list(typedef.__typedef_dclass_name_order__))
+    else:
+        raise TypeError(f"Cannot convert `{typedef}` to a numpy dtype!")
+
+
+def to_numpy_dtype(typedef: Any) -> numpy.dtype:
+    """
+    Converts a fixed-size typedef to an equivalent numpy dtype; the itemsize of the dtype is `size_of(typedef)`.
+
+    Structs & DataStructs become structured dtypes with explicit offsets (Struct fields are named `f0`, `f1`, ...; DataStruct fields use the attribute names).
+    Padding members are left as gaps. Over-aligned primitives become a structured dtype with a single field (`f0`).
+    Enums & scaled integers are exposed as their raw integer values; strings as their raw (encoded) bytes.
+
+    :raises VarSizeError: The typedef (or one of its members) is not fixed-size.
+    :raises TypeError: The typedef has no numpy equivalent.
+    """
+    _require_numpy()
+    dtype = _native_dtype(typedef)
+    size = size_of(typedef)
+    if dtype.itemsize != size:
+        dtype = numpy.dtype({"names": ["f0"], "formats": [dtype], "offsets": [0], "itemsize": size})
+    return dtype
+
+
+def unpack_numpy(typedef: Any, buffer: ReadableBuffer, count: int, *, offset: int = 0, origin: int = 0) -> numpy.ndarray:
+    """
+    Unpacks `count` consecutive records as a numpy array which views the buffer; nothing is copied.
+
+    The array is writable if the buffer is (E.G. bytearray, writable mmap); writes go directly to the buffer.
+
+    :param offset: The offset of the first record; the first record is aligned relative to the origin.
+    :param origin: The origin of the buffer; alignment is relative to the origin.
+    """
+    dtype = to_numpy_dtype(typedef)
+    start = origin + offset + calculate_padding(align_of(typedef), offset)
+    view = memoryview(buffer).cast("B")
+    required = start + dtype.itemsize * count
+    if len(view) < required:
+        raise UnpackBufferSizeError(unpack_numpy.__name__, len(view), required)
+    return numpy.frombuffer(view, dtype=dtype, count=count, offset=start)
+
+
+def _to_layout(typedef: Any, array: Any) -> numpy.ndarray:
+    dtype = to_numpy_dtype(typedef)
+    array = numpy.asarray(array)
+    if array.dtype == dtype:
+        if dtype.names is None:
+            return numpy.ascontiguousarray(array)
+        # Copy field by field; gaps (padding) in the source may contain garbage
+    result = numpy.zeros(len(array), dtype=dtype)
+    if dtype.names is None:
+        result[...] = array
+    elif array.dtype.names is None:
+        result[dtype.names[0]] = array  # Over-aligned primitive
+    else:
+        for name in dtype.names:
+            result[name] = array[name]
+    return result
+
+
+def pack_numpy(typedef: Any, array: Any) -> bytes:
+    """
+    Packs a numpy array as consecutive records; the inverse of `unpack_numpy`.
+
+    Structured arrays are matched to the typedef's fields by name; padding is zero-filled.
+    """
+    return _to_layout(typedef, array).tobytes()
+
+
+def pack_numpy_buffer(typedef: Any, buffer: WritableBuffer, array: Any, *, offset: int = 0, origin: int = 0) -> int:
+    """
+    Packs a numpy array as consecutive records into a buffer.
+
+    :param buffer: The output buffer; a bytearray is grown to fit, other buffers (E.G. mmap) must be large enough.
+    :param offset: The offset of the first record; the first record is aligned relative to the origin.
+    :param origin: The origin of the buffer; alignment is relative to the origin.
+    :returns: The number of bytes written (including padding).
+    """
+    packed = _to_layout(typedef, array).view(numpy.uint8)
+    prefix_padding = calculate_padding(align_of(typedef), offset)
+    start = origin + offset + prefix_padding
+    required = start + len(packed)
+    if len(buffer) < required:
+        if not isinstance(buffer, bytearray):
+            raise FixedBufferSizeError(len(buffer), required)
+        buffer.extend(bytes(required - len(buffer)))
+    bufferio.apply_padding_to_buffer(buffer, prefix_padding, offset, origin)
+    memoryview(buffer)[start:required] = packed
+    return prefix_padding + len(packed)
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import struct
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+
+from structlib.byteorder import NativeEndian, LittleEndian, BigEndian, NetworkEndian
+from structlib.errors import VarSizeError
+from structlib.protocols.typedef import TypeDefSizable, size_of, native_size_of, byteorder_of
+from structlib.typedefs.array import FixedCollection, Array
+from structlib.typedefs.boolean import BooleanDefinition, Boolean
+from structlib.typedefs.datastruct import TypeDefDataclass
+from structlib.typedefs.enumeration import EnumDefinition
+from structlib.typedefs.fixedpoint import ScaledIntegerDefinition
+from structlib.typedefs.floating import FloatDefinition
+from structlib.typedefs.integer import IntegerDefinition
+from structlib.typedefs.padding import Padding
+from structlib.typedefs.strings import StringBuffer
+from structlib.typedefs.structure import Struct
+from structlib.utils import WeakIdCache
+
+# (offset, format code [including repeat count], size, byteorder [None if the code has no byteorder])
+_Field = Tuple[int, str, int, Optional[str]]
+
+_INTEGER_CODES = {1: "b", 2: "h", 4: "i", 8: "q"}
+_FLOAT_CODES = {2: "e", 4: "f", 8: "d"}
+_BYTEORDER_PREFIXES = {LittleEndian: "<", BigEndian: ">"}
+
+# Compiled structs organized by typedef; entries are removed once their typedef is collected
+_STRUCTS = WeakIdCache()
+
+
+def _counted(count: int, code: str) -> str:
+    return code if count == 1 else f"{count}{code}"
+
+
+def _primitive_code(typedef: Any) -> Optional[str]:
+    """
+    The format code of a primitive (excluding padding); None if the typedef isn't a primitive.
+    """
+    if isinstance(typedef, IntegerDefinition):
+        code = _INTEGER_CODES.get(native_size_of(typedef))
+        if code is None:
+            raise TypeError(f"Cannot convert `{typedef}` to a struct format; struct doesn't support '{native_size_of(typedef) * 8}' bit integers!")
+        return code if typedef._signed else code.upper()
+    elif isinstance(typedef, FloatDefinition):
+        return _FLOAT_CODES[native_size_of(typedef)]
+    elif isinstance(typedef, BooleanDefinition):
+        return "?"
+    elif isinstance(typedef, StringBuffer):
+        return f"{native_size_of(typedef)}s"
+    elif isinstance(typedef, (EnumDefinition, ScaledIntegerDefinition)):
+        return _primitive_code(typedef._backing)  # Stored as the raw integer
+    return None
+
+
+def _fields_of(typedef: Any, offset: int, fields: List[_Field]):
+    if not isinstance(typedef, TypeDefSizable):
+        raise VarSizeError()
+    code = _primitive_code(typedef)
+    if code is not None:
+        has_byteorder = not isinstance(typedef, (BooleanDefinition, StringBuffer)) and native_size_of(typedef) > 1
+        fields.append((offset, code, native_size_of(typedef), byteorder_of(typedef) if has_byteorder else None))
+    elif isinstance(typedef, FixedCollection):
+        backing, count = typedef._backing, typedef._args
+        stride = size_of(backing)
+        backing_code = _primitive_code(backing)
+        if backing_code is not None and stride == native_size_of(backing) and not isinstance(backing, StringBuffer):
+            # Tightly packed primitives; a single repeated code
+            start = len(fields)
+            _fields_of(backing, offset, fields)
+            _, _, _, byteorder = fields.pop(start)
+            fields.append((offset, _counted(count, backing_code), stride * count, byteorder))
+        else:
+            for i in range(count):
+                _fields_of(backing, offset + i * stride, fields)
+    elif isinstance(typedef, (Struct, TypeDefDataclass)):
+        packable = typedef.__typedef_dclass_struct_packable__ if isinstance(typedef, TypeDefDataclass) else typedef
+        if packable._offsets is None:
+            raise VarSizeError()
+        for t, member_offset, is_const in zip(packable._types, packable._offsets, packable._const_members):
+            if not is_const:  # Const members (E.G. Padding) are emitted as padding
+                _fields_of(t, offset + member_offset, fields)
+    else:
+        raise TypeError(f"Cannot convert `{typedef}` to a struct format!")
+
+
+def to_struct_format(typedef: Any) -> str:
+    """
+    Converts a fixed-size typedef to an equivalent `struct` format string; `struct.calcsize` of the format is `size_of(typedef)`.
+
+    The format uses standard sizes (no native alignment); alignment padding is emitted as `x` pad bytes.
+    Arrays of primitives use repeat counts, StringBuffers use `s`. Nested Structs/DataStructs are flattened,
+    so unpacking the format returns a flat tuple of values (strings as bytes, enums & scaled integers as raw integers).
+
+    :raises VarSizeError: The typedef (or one of its members) is not fixed-size.
+    :raises TypeError: The typedef has no format equivalent; E.G. 128 bit integers, or members with differing byteorders.
+    """
+    fields: List[_Field] = []
+    _fields_of(typedef, 0, fields)
+    byteorders = {byteorder for _, _, _, byteorder in fields if byteorder is not None}
+    if len(byteorders) > 1:
+        raise TypeError(f"Cannot convert `{typedef}` to a struct format; a format can only have one byteorder!")
+    byteorder = byteorders.pop() if byteorders else NativeEndian
+    parts = [_BYTEORDER_PREFIXES[byteorder]]
+    position = 0
+    for offset, code, size, _ in fields:
+        if offset > position:
+            parts.append(_counted(offset - position, "x"))
+        parts.append(code)
+        position = offset + size
+    size = size_of(typedef)
+    if size > position:
+        parts.append(_counted(size - position, "x"))
+    return "".join(parts)
+
+
+def to_struct(typedef: Any) -> struct.Struct:
+    """
+    A compiled `struct.Struct` of `to_struct_format(typedef)`; cached per typedef.
+    """
+    compiled = _STRUCTS.get(typedef)
+    if compiled is None:
+        compiled = struct.Struct(to_struct_format(typedef))
+        _STRUCTS.put(typedef, compiled)
+    return compiled
+
+
+_PREFIXES = {"@": NativeEndian, "=": NativeEndian, "<": LittleEndian, ">": BigEndian, "!": NetworkEndian}
+_CODES = "xcbB?hHiIlLqQnNefdspP"
+
+
+def _parse_format(fmt: str) -> Tuple[str, List[Tuple[int, str]]]:
+    fmt = "".join(fmt.split())  # Whitespace is ignored between codes
+    prefix = fmt[0] if fmt and fmt[0] in _PREFIXES else "@"
+    body = fmt[1:] if fmt and fmt[0] in _PREFIXES else fmt
+    items = []
+    digits = ""
+    for char in body:
+        if char.isdigit():
+            digits += char
+        elif char in _CODES:
+            items.append((int(digits) if digits else 1, char))
+            digits = ""
+        else:
+            raise struct.error(f"bad char in struct format: '{char}'")
+    if digits:
+        raise struct.error("repeat count given without format specifier")
+    return prefix, items
+
+
+@lru_cache(maxsize=256)
+def from_struct_format(fmt: str) -> Struct:
+    """
+    Builds an equivalent Struct from a `struct` format string; the result is cached, so equal formats return the same Struct.
+
+    Native formats (`@` or no prefix) use natural alignment; other prefixes use an alignment of 1 (standard sizes).
+    Repeated codes become Arrays (`s` becomes a StringBuffer, `x` becomes Padding).
+    Note that struct doesn't pad the end of native formats to the struct's alignment; the Struct does.
+
+    :raises struct.error: The format is invalid.
+    :raises TypeError: The format contains codes without a typedef equivalent (`p` & `P`).
+    """
+    prefix, items = _parse_format(fmt)
+    native = prefix == "@"
+    byteorder = _PREFIXES[prefix]
+    size_prefix = "@" if native else "<"  # Native formats may use native sizes; E.G. 'l'
+    alignment = None if native else 1  # None; natural alignment
+    types = []
+    for count, code in items:
+        if code in "pP":
+            raise TypeError(f"Cannot convert '{code}' to a typedef!")
+        if code == "x":
+            types.append(Padding(count))
+            continue
+        if code in "sc":
+            t = StringBuffer(count if code == "s" else 1)
+            count = 1 if code == "s" else count
+        elif code == "?":
+            t = Boolean if native else BooleanDefinition(alignment=alignment)
+        elif code in "efd":
+            t = FloatDefinition(struct.calcsize(size_prefix + code) * 8, alignment=alignment, byteorder=byteorder)
+        else:
+            t = IntegerDefinition(struct.calcsize(size_prefix + code), code.islower(), alignment=alignment, byteorder=byteorder)
+        types.append(t if count == 1 else Array(count, t))
+    return Struct(*types, alignment=alignment)
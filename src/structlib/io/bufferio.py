@@ -51,6 +51,20 @@ def read(buffer: ReadableBuffer, data_size: int, alignment: int, offset: int, or
     return prefix_padding + data_size + postfix_padding, buffer[buffer_offset:buffer_offset + data_size]
 
 
+def skip(data_size: int, alignment: int, offset: int) -> int:
+    """
+    Calculates the bytes `read` would consume, without reading (or copying) the data.
+
+    :param data_size:
+    :param alignment:
+    :param offset:
+    :return:
+    """
+    prefix_padding = calculate_padding(alignment, offset)
+    postfix_padding = calculate_padding(alignment, offset + prefix_padding + data_size)
+    return prefix_padding + data_size + postfix_padding
+
+
 def create_padding_buffer(padding: int) -> bytes:
     return bytes([0x00] * padding)
 
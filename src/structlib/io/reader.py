@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import struct
+import weakref
+from functools import partial
+from typing import Any, Tuple, Dict, Optional
+
+from structlib.errors import UnpackBufferSizeError
+from structlib.io import bufferio
+from structlib.protocols.packing import unpack_buffer, iter_unpack_buffer, IterPackable
+from structlib.protocols.typedef import TypeDefSizable, size_of, native_size_of, align_of, calculate_padding
+from structlib.typing_ import ReadableBuffer
+
+# Fast paths organized by id(typedef); typedefs aren't hashable, so they can't be the keys of a WeakKeyDictionary
+#   Entries hold a weak reference to their typedef & are removed once it's collected; an id is never reused for a stale entry
+#   (struct, size, alignment) ~ struct is None if the typedef has no fast path
+_FastPath = Tuple[Optional[struct.Struct], int, int]
+_FAST_PATHS: Dict[int, Tuple[weakref.ref, _FastPath]] = {}
+
+
+def _build_fast_path(typedef: Any) -> _FastPath:
+    internal_struct = None
+    size = alignment = 0
+    get_internal_struct = getattr(typedef, "_internal_struct", None)
+    if get_internal_struct is not None and isinstance(typedef, TypeDefSizable):
+        internal_struct = get_internal_struct()
+        if internal_struct is not None and internal_struct.size == native_size_of(typedef):
+            size, alignment = size_of(typedef), align_of(typedef)
+        else:
+            internal_struct = None
+    return internal_struct, size, alignment
+
+
+def _forget_fast_path(key: int, ref: weakref.ref):
+    entry = _FAST_PATHS.get(key)
+    if entry is not None and entry[0] is ref:  # The entry may already be replaced
+        del _FAST_PATHS[key]
+
+
+def _get_fast_path(typedef: Any) -> _FastPath:
+    key = id(typedef)
+    entry = _FAST_PATHS.get(key)
+    if entry is not None and entry[0]() is typedef:
+        return entry[1]
+    fast_path = _build_fast_path(typedef)
+    try:
+        ref = weakref.ref(typedef, partial(_forget_fast_path, key))
+    except TypeError:
+        return fast_path  # Can't be weakly referenced; not cached
+    _FAST_PATHS[key] = ref, fast_path
+    return fast_path
+
+
+class BufferReader:
+    """
+    Reads values sequentially from a buffer; tracking the cursor instead of returning `(read, value)` for every value.
+
+    The cursor is an `offset` relative to `origin`, matching `bufferio.read`; alignment padding is calculated from the origin.
+    Primitives which map to the struct module (E.G. integers & floats) are read directly from the buffer.
+    Other typedefs use the `unpack_buffer` protocol.
+    """
+
+    def __init__(self, buffer: ReadableBuffer, *, offset: int = 0, origin: int = 0):
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        self._origin = origin
+        self._offset = offset
+
+    @property
+    def origin(self) -> int:
+        return self._origin
+
+    @property
+    def offset(self) -> int:
+        return self._offset
+
+    @property
+    def remaining(self) -> int:
+        return len(self._view) - self._origin - self._offset
+
+    def tell(self) -> int:
+        return self._offset
+
+    def seek(self, offset: int) -> int:
+        if offset < 0 or self._origin + offset > len(self._view):
+            raise UnpackBufferSizeError(self._pretty_name(self.seek), len(self._view), self._origin + offset)
+        self._offset = offset
+        return offset
+
+    def skip(self, size: int, alignment: int = 1) -> int:
+        """
+        Advances the cursor past `size` bytes (and padding) without reading them.
+
+        :returns: The number of bytes skipped.
+        """
+        skipped = bufferio.skip(size, alignment, self._offset)
+        self._check_bounds(self.skip, self._offset + skipped)
+        self._offset += skipped
+        return skipped
+
+    def _pretty_name(self, func) -> str:
+        return f"{self.__class__.__name__}.{func.__name__}"
+
+    def _check_bounds(self, func, end: int):
+        required = self._origin + end
+        if required > len(self._view):
+            raise UnpackBufferSizeError(self._pretty_name(func), len(self._view), required)
+
+    def read(self, typedef: Any) -> Any:
+        internal_struct, size, alignment = _get_fast_path(typedef)
+        offset = self._offset
+        if internal_struct is not None:
+            offset += calculate_padding(alignment, offset)
+            self._check_bounds(self.read, offset + size)
+            value, = internal_struct.unpack_from(self._view, self._origin + offset)
+            self._offset = offset + size
+            return value
+        read, value = unpack_buffer(typedef, self._buffer, offset=offset, origin=self._origin)
+        self._check_bounds(self.read, offset + read)
+        self._offset = offset + read
+        return value
+
+    def read_many(self, typedef: Any, count: int) -> Tuple[Any, ...]:
+        internal_struct, size, alignment = _get_fast_path(typedef)
+        offset = self._offset
+        if internal_struct is not None and size == internal_struct.size:
+            # Elements are tightly packed; one unpack call for all elements
+            offset += calculate_padding(alignment, offset)
+            self._check_bounds(self.read_many, offset + size * count)
+            fmt = internal_struct.format
+            values = struct.unpack_from(f"{fmt[0]}{count}{fmt[1:]}", self._view, self._origin + offset)
+            self._offset = offset + size * count
+            return values
+        elif isinstance(typedef, IterPackable):
+            read, values = iter_unpack_buffer(typedef, self._buffer, count, offset=offset, origin=self._origin)
+            self._check_bounds(self.read_many, offset + read)
+            self._offset = offset + read
+            return tuple(values)
+        else:
+            return tuple(self.read(typedef) for _ in range(count))
+
+    def read_bytes(self, size: int, alignment: int = 1) -> memoryview:
+        """
+        Reads raw bytes without copying them.
+        """
+        offset = self._offset + calculate_padding(alignment, self._offset)
+        read = bufferio.skip(size, alignment, self._offset)
+        self._check_bounds(self.read_bytes, self._offset + read)
+        start = self._origin + offset
+        self._offset += read
+        return self._view[start:start + size]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from io import SEEK_CUR
 from typing import BinaryIO, Tuple
 
 from structlib.io.bufferio import create_padding_buffer
@@ -45,5 +46,24 @@ def read(stream: BinaryIO, data_size: int, alignment: int, origin: int = 0) -> T
     return prefix_padding + data_size + postfix_padding, data
 
 
+def skip(stream: BinaryIO, data_size: int, alignment: int, origin: int = 0) -> int:
+    """
+    Seeks past the data (and padding) that `read` would consume, without reading it.
+    :param stream:
+    :param data_size:
+    :param alignment:
+    :param origin:
+    :return:
+    """
+    offset = stream_offset_from_origin(stream, origin)
+
+    prefix_padding = calculate_padding(alignment, offset)
+    postfix_padding = calculate_padding(alignment, offset + prefix_padding + data_size)
+
+    skipped = prefix_padding + data_size + postfix_padding
+    stream.seek(skipped, SEEK_CUR)
+    return skipped
+
+
 def stream_offset_from_origin(stream: BinaryIO, origin: int):
     return stream.tell() - origin
\ No newline at end of file
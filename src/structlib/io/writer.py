@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from typing import Any
+
+from structlib.errors import VarSizeError
+from structlib.io import bufferio
+from structlib.protocols.packing import pack_buffer, iter_pack_buffer
+from structlib.protocols.typedef import TypeDefSizable, TypeDefAlignable, size_of, align_of, calculate_padding
+from structlib.utils import default_if_none
+
+DEFAULT_CAPACITY = 256
+
+
+class BufferWriter:
+    """
+    A growable output buffer with a write cursor; used to serialize many values into a single buffer.
+
+    The cursor is an `offset` relative to `origin`, matching `bufferio.write`; alignment padding is calculated from the origin.
+    Capacity is doubled as needed, so appending values doesn't reallocate per write.
+
+    Space can be reserved for fields which aren't known until later (E.G. sizes & counts) and filled in with `patch`.
+    """
+
+    def __init__(self, capacity: int = None, *, origin: int = 0):
+        """
+        :param capacity: The initial capacity (in bytes); excluding the origin.
+        :param origin: Bytes before the origin are zero-filled; alignment is relative to the origin.
+        """
+        if origin < 0:
+            raise ValueError("Origin cannot be negative!")
+        capacity = default_if_none(capacity, DEFAULT_CAPACITY)
+        self._buffer = bytearray(origin + capacity)
+        self._origin = origin
+        self._offset = 0
+        self._size = 0  # Furthest byte written (relative to origin)
+
+    @property
+    def origin(self) -> int:
+        return self._origin
+
+    @property
+    def offset(self) -> int:
+        return self._offset
+
+    @property
+    def size(self) -> int:
+        """
+        The number of bytes written after the origin.
+        """
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buffer) - self._origin
+
+    def __len__(self) -> int:
+        return self._origin + self._size
+
+    def tell(self) -> int:
+        return self._offset
+
+    def seek(self, offset: int) -> int:
+        """
+        Moves the cursor; writing past the current size zero-fills the gap.
+        """
+        if offset < 0:
+            raise ValueError("Offset cannot be negative!")
+        self._reserve_capacity(offset)
+        self._offset = offset
+        return offset
+
+    def _reserve_capacity(self, size: int):
+        """
+        Ensures `size` bytes (relative to the origin) are allocated; grows by doubling.
+        """
+        required = self._origin + size
+        capacity = len(self._buffer)
+        if required > capacity:
+            new_capacity = max(capacity * 2, required)
+            self._buffer.extend(bytes(new_capacity - capacity))
+
+    def _advance(self, written: int) -> int:
+        self._offset += written
+        if self._offset > self._size:
+            self._size = self._offset
+        return written
+
+    @staticmethod
+    def _max_write_size(typedef: Any) -> int:
+        # A sized typedef never writes more than its size & its (prefix) padding
+        if isinstance(typedef, TypeDefSizable):
+            alignment = align_of(typedef) if isinstance(typedef, TypeDefAlignable) else 1
+            return size_of(typedef) + alignment - 1
+        return 0
+
+    def write(self, typedef: Any, *args: Any) -> int:
+        """
+        Packs args (using `pack_buffer` semantics) at the cursor, then advances the cursor.
+
+        :returns: The number of bytes written (including padding).
+        """
+        # Variable sized typedefs write sequentially; the underlying bytearray grows on its own if needed
+        self._reserve_capacity(self._offset + self._max_write_size(typedef))
+        written = pack_buffer(typedef, self._buffer, *args, offset=self._offset, origin=self._origin)
+        return self._advance(written)
+
+    def write_many(self, typedef: Any, *args: Any) -> int:
+        """
+        Packs args (using `iter_pack_buffer` semantics) at the cursor, then advances the cursor.
+
+        :returns: The number of bytes written (including padding).
+        """
+        self._reserve_capacity(self._offset + self._max_write_size(typedef) * len(args))
+        written = iter_pack_buffer(typedef, self._buffer, *args, offset=self._offset, origin=self._origin)
+        return self._advance(written)
+
+    def write_bytes(self, data: bytes, alignment: int = 1) -> int:
+        """
+        Writes raw data at the cursor; aligned to `alignment`, then advances the cursor.
+        """
+        self._reserve_capacity(self._offset + len(data) + alignment - 1)
+        written = bufferio.write(self._buffer, data, alignment, self._offset, self._origin)
+        return self._advance(written)
+
+    def align(self, alignment: int) -> int:
+        """
+        Zero-fills up to the next `alignment` boundary.
+
+        :returns: The number of padding bytes written.
+        """
+        padding = calculate_padding(alignment, self._offset)
+        self._reserve_capacity(self._offset + padding)
+        bufferio.apply_padding_to_buffer(self._buffer, padding, self._offset, self._origin)
+        return self._advance(padding)
+
+    def reserve(self, typedef: TypeDefSizable) -> int:
+        """
+        Skips (zero-fills) the space `typedef` would be written to; the value can be written later via `patch`.
+
+        :returns: The offset to pass to `patch`.
+        """
+        if not isinstance(typedef, TypeDefSizable):
+            raise VarSizeError()
+        offset = self._offset
+        alignment = align_of(typedef) if isinstance(typedef, TypeDefAlignable) else 1
+        reserved = bufferio.skip(size_of(typedef), alignment, offset)
+        self._reserve_capacity(offset + reserved)
+        bufferio.apply_padding_to_buffer(self._buffer, reserved, offset, self._origin)
+        self._advance(reserved)
+        return offset
+
+    def patch(self, offset: int, typedef: TypeDefSizable, *args: Any) -> int:
+        """
+        Packs args at a previously reserved offset; the cursor is not moved.
+        """
+        if not isinstance(typedef, TypeDefSizable):
+            raise VarSizeError()
+        if offset + size_of(typedef) > self._size:
+            raise ValueError(f"Cannot patch at offset '{offset}', only '{self._size}' bytes have been written!")
+        return pack_buffer(typedef, self._buffer, *args, offset=offset, origin=self._origin)
+
+    def getbuffer(self) -> memoryview:
+        """
+        A zero-copy view of the written bytes (including the bytes before the origin).
+
+        The writer cannot grow while the view is held; release it before writing more data.
+        """
+        return memoryview(self._buffer)[:self._origin + self._size]
+
+    def getvalue(self) -> bytes:
+        return bytes(self._buffer[:self._origin + self._size])
+
+    def clear(self):
+        """
+        Resets the cursor and size; the allocated capacity is kept for reuse.
+        """
+        bufferio.apply_padding_to_buffer(self._buffer, self._size, 0, self._origin)
+        self._offset = 0
+        self._size = 0
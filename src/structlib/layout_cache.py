@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
+
+# Bump when the layout rules (or the stored fields) change; old cache files are ignored
+LAYOUT_CACHE_VERSION = 1
+# If set, the cache is enabled (using this directory) when structlib is imported
+LAYOUT_CACHE_ENV = "STRUCTLIB_LAYOUT_CACHE"
+
+
+class StructLayout(NamedTuple):
+    """
+    The computed layout of a Struct; everything `Struct.__init__` derives from its members.
+    """
+    fixed_size: bool
+    native_size: Optional[int]  # None if the size couldn't be calculated
+    offsets: Optional[Tuple[int, ...]]
+    const_members: Tuple[bool, ...]
+    unpack_stream_by_member: bool
+
+
+class _LayoutCache:
+    def __init__(self, path: Path):
+        self.path = path
+        self._layouts: Optional[Dict[str, StructLayout]] = None
+        self._dirty = False
+
+    def _read(self) -> Dict[str, StructLayout]:
+        try:
+            with open(self.path, "r") as handle:
+                raw = json.load(handle)
+        except (OSError, ValueError):
+            return {}  # Missing or corrupt; rebuilt as layouts are computed
+        layouts = {}
+        for key, (fixed_size, native_size, offsets, const_members, by_member) in raw.items():
+            layouts[key] = StructLayout(fixed_size, native_size, tuple(offsets) if offsets is not None else None, tuple(const_members), by_member)
+        return layouts
+
+    def get(self, key: str) -> Optional[StructLayout]:
+        if self._layouts is None:
+            self._layouts = self._read()  # Loaded once; on the first lookup
+        return self._layouts.get(key)
+
+    def put(self, key: str, layout: StructLayout):
+        if self._layouts is None:
+            self._layouts = self._read()
+        self._layouts[key] = layout
+        self._dirty = True
+
+    def flush(self):
+        if not self._dirty:
+            return
+        layouts = self._read()  # Merge with layouts written by other processes
+        layouts.update(self._layouts)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        handle, temp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w") as temp:
+                json.dump(layouts, temp, separators=(",", ":"))
+            os.replace(temp_path, self.path)  # Atomic; readers never see a partial file
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        self._layouts = layouts
+        self._dirty = False
+
+
+_cache: Optional[_LayoutCache] = None
+
+
+def enable_layout_cache(directory: Union[str, os.PathLike]):
+    """
+    Stores computed Struct layouts in `directory`; later processes load them instead of recomputing them.
+
+    Layouts are keyed by a hash of the definition (each member's class, size, alignment & byteorder),
+    so changing a definition never returns a stale layout. New layouts are written when the process exits (or on `flush_layout_cache`).
+    """
+    global _cache
+    if _cache is not None:
+        _cache.flush()
+    _cache = _LayoutCache(Path(directory) / f"layouts-v{LAYOUT_CACHE_VERSION}.json")
+
+
+def disable_layout_cache():
+    global _cache
+    if _cache is not None:
+        _cache.flush()
+    _cache = None
+
+
+def flush_layout_cache():
+    if _cache is not None:
+        _cache.flush()
+
+
+def _member_key(typedef: Any) -> str:
+    cls = typedef if isinstance(typedef, type) else type(typedef)
+    # Reading the attributes directly; protocol isinstance checks are what the cache avoids
+    native_size = getattr(typedef, "__typedef_native_size__", None)
+    alignment = getattr(typedef, "__typedef_alignment__", None)
+    byteorder = getattr(typedef, "__typedef_byteorder__", None)
+    return f"{cls.__module__}.{cls.__qualname__}:{native_size}:{alignment}:{byteorder}"
+
+
+def definition_key(types: Tuple[Any, ...], alignment: Optional[int]) -> Optional[str]:
+    """
+    The cache key of a Struct definition; None if the cache is disabled.
+    """
+    if _cache is None:
+        return None
+    definition = "|".join(_member_key(t) for t in types)
+    return hashlib.sha1(f"{alignment}|{definition}".encode()).hexdigest()
+
+
+def load_layout(key: Optional[str]) -> Optional[StructLayout]:
+    if key is None or _cache is None:
+        return None
+    return _cache.get(key)
+
+
+def store_layout(key: Optional[str], layout: StructLayout):
+    if key is not None and _cache is not None:
+        _cache.put(key, layout)
+
+
+atexit.register(flush_layout_cache)
+
+if os.environ.get(LAYOUT_CACHE_ENV):
+    enable_layout_cache(os.environ[LAYOUT_CACHE_ENV])
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Tuple, Union, List, Dict
+
+from structlib.errors import VarSizeError, UnpackBufferSizeError, FixedBufferSizeError
+from structlib.io import bufferio
+from structlib.protocols.packing import IterPackable, iter_unpack, unpack, StructPackable, iter_pack_buffer, pack_buffer
+from structlib.protocols.typedef import TypeDefSizable, size_of, align_of, calculate_padding
+from structlib.typedefs.datastruct import TypeDefDataclass
+from structlib.typing_ import ReadableBuffer, WritableBuffer
+
+PathLike = Union[str, os.PathLike]
+Columns = Union[Tuple[Tuple[Any, ...], ...], Dict[str, Tuple[Any, ...]]]
+
+# Number of records decoded by each task; small enough to balance work between workers, large enough to amortize the IPC
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def _unpack_records(typedef: Any, buffer: ReadableBuffer, count: int) -> Tuple[Any, ...]:
+    if isinstance(typedef, IterPackable):
+        return tuple(iter_unpack(typedef, buffer, count))
+    stride = size_of(typedef)
+    return tuple(unpack(typedef, buffer[i * stride:(i + 1) * stride]) for i in range(count))
+
+
+def _to_columns(typedef: Any, records: Tuple[Any, ...]) -> Columns:
+    if isinstance(typedef, TypeDefDataclass):
+        return {name: tuple(getattr(record, name) for record in records) for name in typedef.__typedef_dclass_name_order__}
+    elif isinstance(typedef, StructPackable):
+        return tuple(zip(*records))
+    else:
+        return records
+
+
+def _merge_columns(typedef: Any, parts: List[Columns]) -> Columns:
+    if isinstance(typedef, TypeDefDataclass):
+        return {name: tuple(value for part in parts for value in part[name]) for name in typedef.__typedef_dclass_name_order__}
+    elif isinstance(typedef, StructPackable):
+        column_count = max((len(part) for part in parts), default=0)
+        return tuple(tuple(value for part in parts for value in part[i]) for i in range(column_count))
+    else:
+        return tuple(value for part in parts for value in part)
+
+
+def _unpack_shared_chunk(typedef: Any, name: str, start: int, count: int, columnar: bool):
+    shm = SharedMemory(name=name)  # Pool workers share the parent's resource tracker; the parent unlinks the segment
+    try:
+        stride = size_of(typedef)
+        records = _unpack_records(typedef, bytes(shm.buf[start:start + stride * count]), count)
+    finally:
+        shm.close()
+    return _to_columns(typedef, records) if columnar else records
+
+
+def _unpack_file_chunk(typedef: Any, path: PathLike, start: int, count: int, columnar: bool):
+    with open(path, "rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            stride = size_of(typedef)
+            records = _unpack_records(typedef, mapped[start:start + stride * count], count)
+    return _to_columns(typedef, records) if columnar else records
+
+
+def parallel_iter_unpack(typedef: Any, buffer_or_path: Union[ReadableBuffer, PathLike], iter_count: int, *, offset: int = 0, workers: int = None, chunk_size: int = None, columnar: bool = False) -> Union[Tuple[Any, ...], Columns]:
+    """
+    Unpacks `iter_count` consecutive records of a fixed-size typedef using a process pool.
+
+    Records are partitioned at `size_of(typedef)` boundaries; each partition is decoded by a worker.
+    Workers read the input from shared memory (buffers) or a memory-mapped file (paths); the input is never pickled.
+
+    :param typedef: A fixed-size typedef; must be picklable (module-level DataStructs, or typedef instances).
+    :param buffer_or_path: A buffer (copied once into shared memory), or the path of a file (memory-mapped by each worker).
+    :param iter_count: The number of records to unpack.
+    :param offset: The offset of the first record; the first record is aligned relative to the start of the buffer/file.
+    :param workers: The number of worker processes; defaults to `os.cpu_count()`.
+    :param chunk_size: The number of records decoded per task.
+    :param columnar: If True, results are returned as columns instead of records;
+        a dict of name => values for DataStructs, a tuple of columns for Structs, otherwise the values as-is.
+    :returns: The records in order, or the columns if `columnar` is set.
+    """
+    if not isinstance(typedef, TypeDefSizable):
+        raise VarSizeError()
+    stride = size_of(typedef)
+    offset += calculate_padding(align_of(typedef), offset)
+    chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+    chunks = [(offset + i * stride, min(chunk_size, iter_count - i)) for i in range(0, iter_count, chunk_size)]
+
+    shm = None
+    try:
+        if isinstance(buffer_or_path, (str, os.PathLike)):
+            task, source = _unpack_file_chunk, buffer_or_path
+        else:
+            view = memoryview(buffer_or_path).cast("B")
+            end = offset + stride * iter_count
+            if len(view) < end:
+                raise UnpackBufferSizeError(parallel_iter_unpack.__name__, len(view), end)
+            shm = SharedMemory(create=True, size=max(end, 1))
+            shm.buf[:end] = view[:end]
+            task, source = _unpack_shared_chunk, shm.name
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(task, typedef, source, start, count, columnar) for start, count in chunks]
+            parts = [future.result() for future in futures]
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    if columnar:
+        return _merge_columns(typedef, parts)
+    return tuple(record for part in parts for record in part)
+
+
+def _pack_chunk(typedef: Any, buffer: WritableBuffer, args: Tuple[Any, ...], offset: int, origin: int):
+    if isinstance(typedef, IterPackable):
+        iter_pack_buffer(typedef, buffer, *args, offset=offset, origin=origin)
+        return
+    stride = size_of(typedef)
+    for i, arg in enumerate(args):
+        if isinstance(typedef, StructPackable):
+            pack_buffer(typedef, buffer, *arg, offset=offset + i * stride, origin=origin)
+        else:
+            pack_buffer(typedef, buffer, arg, offset=offset + i * stride, origin=origin)
+
+
+def parallel_pack_buffer(typedef: Any, buffer: WritableBuffer, *args: Any, offset: int = 0, origin: int = 0, workers: int = None, chunk_size: int = None) -> int:
+    """
+    Packs consecutive records of a fixed-size typedef into a buffer using a thread pool.
+
+    Each record is written at `index * size_of(typedef)`; so the buffer is partitioned and chunks are written in place, concurrently.
+    This benefits from packing paths which release the GIL (E.G. numpy) and free-threaded builds of python.
+
+    :param typedef: A fixed-size typedef.
+    :param buffer: The output buffer; a bytearray is grown to fit, other buffers (E.G. mmap) must be large enough.
+    :param args: The records to pack; tuples for Structs.
+    :param offset: The offset of the first record; the first record is aligned relative to the origin.
+    :param origin: The origin of the buffer; alignment is relative to the origin.
+    :param workers: The number of worker threads; defaults to the ThreadPoolExecutor default.
+    :param chunk_size: The number of records packed per task.
+    :returns: The number of bytes written (including padding).
+    """
+    if not isinstance(typedef, TypeDefSizable):
+        raise VarSizeError()
+    stride = size_of(typedef)
+    prefix_padding = calculate_padding(align_of(typedef), offset)
+    start = offset + prefix_padding
+    required = origin + start + stride * len(args)
+    if len(buffer) < required:
+        if not isinstance(buffer, bytearray):
+            raise FixedBufferSizeError(len(buffer), required)
+        buffer.extend(bytes(required - len(buffer)))  # Resize once; chunks can't resize the buffer while other threads write to it
+    bufferio.apply_padding_to_buffer(buffer, prefix_padding, offset, origin)
+
+    chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_pack_chunk, typedef, buffer, args[i:i + chunk_size], start + i * stride, origin) for i in range(0, len(args), chunk_size)]
+        for future in futures:
+            future.result()  # Raise any errors
+    return prefix_padding + stride * len(args)
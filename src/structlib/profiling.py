@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Tuple, Optional, Iterable
+
+from structlib.protocols.packing import Packable, IterPackable, PrimitivePackable, DataclassPackable, ConstPackable, StructPackable, DataclassIterPackable, ConstIterPackable
+
+PROTOCOLS = (Packable, IterPackable, PrimitivePackable, DataclassPackable, ConstPackable, StructPackable, DataclassIterPackable, ConstIterPackable)
+
+
+def _entry_points(protocols: Iterable[type]) -> Tuple[str, ...]:
+    names = []
+    for proto in protocols:
+        for name, value in vars(proto).items():
+            if not name.startswith("_") and (callable(value) or isinstance(value, classmethod)) and name not in names:
+                names.append(name)
+    return tuple(names)
+
+
+ENTRY_POINTS = _entry_points(PROTOCOLS)
+
+
+@dataclass
+class EntryPointStats:
+    calls: int = 0
+    bytes: int = 0
+    inclusive_time: float = 0.0
+    self_time: float = 0.0
+
+
+@dataclass
+class TypeDefStats:
+    """
+    Measurements for a single typedef; inclusive time counts only the outermost call of each typedef (recursion isn't double counted).
+    """
+    typedef: Any
+    name: str
+    calls: int = 0
+    bytes: int = 0
+    inclusive_time: float = 0.0
+    self_time: float = 0.0
+    entry_points: Dict[str, EntryPointStats] = field(default_factory=dict)
+
+
+def _typedef_of(obj: Any) -> Any:
+    # DataStruct instances are attributed to their class
+    if isinstance(obj, type) or not isinstance(obj, DataclassPackable):
+        return obj
+    return type(obj)
+
+
+def _typedef_name(typedef: Any) -> str:
+    if isinstance(typedef, type):
+        return typedef.__name__
+    text = str(typedef)
+    return text if " object at " not in text else typedef.__class__.__name__
+
+
+def _bytes_processed(name: str, args: Tuple[Any, ...], result: Any) -> int:
+    try:
+        if "unpack" in name:
+            if name.endswith("_buffer") or name.endswith("_stream"):
+                return result[0]
+            return len(args[0]) if args else 0
+        else:
+            return result if isinstance(result, int) else len(result)
+    except (TypeError, IndexError):
+        return 0
+
+
+class _Frame:
+    __slots__ = ("key", "child_time")
+
+    def __init__(self, key: int):
+        self.key = key
+        self.child_time = 0.0
+
+
+class Profiler:
+    """
+    Records calls, bytes processed and time spent in each typedef's pack/unpack entry points.
+
+    Instrumentation is installed by patching the entry points of every packable class while the profiler is enabled;
+    when disabled the original methods are restored, so profiling costs nothing unless it is in use.
+    Nested calls (E.G. members of a Struct / DataStruct) are attributed to the member; the parent's self time excludes them.
+    Members decoded by a parent's fast path (E.G. primitives of a fixed size Struct) make no calls, so they're attributed to the parent.
+
+    Usage:
+        with Profiler() as profiler:
+            ...
+        print(profiler.report())
+    """
+    _active: Optional[Profiler] = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        self._stats: Dict[int, TypeDefStats] = {}
+        self._local = threading.local()
+        self._patched: List[Tuple[type, str, Any]] = []
+
+    @property
+    def enabled(self) -> bool:
+        return Profiler._active is self
+
+    def _stack(self) -> List[_Frame]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, typedef: Any, name: str, elapsed: float, child_time: float, processed: int, outermost: bool):
+        key = id(typedef)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = TypeDefStats(typedef, _typedef_name(typedef))
+        entry = stats.entry_points.get(name)
+        if entry is None:
+            entry = stats.entry_points[name] = EntryPointStats()
+        entry.calls += 1
+        entry.bytes += processed
+        entry.inclusive_time += elapsed
+        entry.self_time += elapsed - child_time
+        stats.self_time += elapsed - child_time
+        if outermost:
+            stats.calls += 1
+            stats.bytes += processed
+            stats.inclusive_time += elapsed
+
+    def _wrap(self, name: str, func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(obj, *args, **kwargs):
+            typedef = _typedef_of(obj)
+            key = id(typedef)
+            stack = self._stack()
+            outermost = all(frame.key != key for frame in stack)
+            frame = _Frame(key)
+            stack.append(frame)
+            start = perf_counter()
+            try:
+                result = func(obj, *args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                stack.pop()
+                if stack:
+                    stack[-1].child_time += elapsed
+            self._record(typedef, name, elapsed, frame.child_time, _bytes_processed(name, args, result), outermost)
+            return result
+
+        return wrapper
+
+    @staticmethod
+    def _classes() -> List[type]:
+        found, pending = [], list(PROTOCOLS)
+        while pending:
+            cls = pending.pop()
+            for sub in cls.__subclasses__():
+                if sub not in found and sub not in PROTOCOLS:
+                    found.append(sub)
+                    pending.append(sub)
+        return [cls for cls in found if not getattr(cls, "_is_protocol", False)]
+
+    def enable(self):
+        with Profiler._lock:
+            if Profiler._active is not None:
+                raise RuntimeError("A profiler is already enabled!")
+            for cls in self._classes():
+                for name in ENTRY_POINTS:
+                    original = cls.__dict__.get(name)
+                    if original is None:
+                        continue
+                    if isinstance(original, classmethod):
+                        patched = classmethod(self._wrap(name, original.__func__))
+                    elif callable(original):
+                        patched = self._wrap(name, original)
+                    else:
+                        continue
+                    setattr(cls, name, patched)
+                    self._patched.append((cls, name, original))
+            Profiler._active = self
+
+    def disable(self):
+        with Profiler._lock:
+            if Profiler._active is not self:
+                return
+            for cls, name, original in reversed(self._patched):
+                setattr(cls, name, original)
+            self._patched.clear()
+            Profiler._active = None
+
+    def __enter__(self) -> Profiler:
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.disable()
+
+    def reset(self):
+        self._stats.clear()
+
+    def snapshot(self) -> List[TypeDefStats]:
+        """
+        Returns a copy of the measurements; sorted by self time (descending).
+        """
+        stats = []
+        for item in self._stats.values():
+            entry_points = {name: EntryPointStats(e.calls, e.bytes, e.inclusive_time, e.self_time) for name, e in item.entry_points.items()}
+            stats.append(TypeDefStats(item.typedef, item.name, item.calls, item.bytes, item.inclusive_time, item.self_time, entry_points))
+        stats.sort(key=lambda s: s.self_time, reverse=True)
+        return stats
+
+    def stats_of(self, typedef: Any) -> Optional[TypeDefStats]:
+        for stats in self.snapshot():
+            if stats.typedef is typedef:
+                return stats
+        return None
+
+    def report(self, limit: int = None, entry_points: bool = False) -> str:
+        """
+        Formats the snapshot as a table.
+
+        :param limit: Only include the first `limit` typedefs (by self time).
+        :param entry_points: Include a row for each entry point of a typedef.
+        """
+        lines = [f"{'typedef':40} {'calls':>10} {'bytes':>12} {'incl (ms)':>12} {'self (ms)':>12}"]
+        for stats in self.snapshot()[:limit]:
+            lines.append(f"{stats.name[:40]:40} {stats.calls:10} {stats.bytes:12} {stats.inclusive_time * 1e3:12.3f} {stats.self_time * 1e3:12.3f}")
+            if entry_points:
+                for name, entry in sorted(stats.entry_points.items(), key=lambda kv: kv[1].self_time, reverse=True):
+                    lines.append(f"  {name[:38]:38} {entry.calls:10} {entry.bytes:12} {entry.inclusive_time * 1e3:12.3f} {entry.self_time * 1e3:12.3f}")
+        return "\n".join(lines)
+
+
+def profile() -> Profiler:
+    """
+    Helper; `with profile() as profiler:` measures the enclosed block.
+    """
+    return Profiler()
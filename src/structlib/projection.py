@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from io import SEEK_SET
+from typing import Any, Sequence, Tuple, Union, List
+
+from structlib.errors import VarSizeError, UnpackBufferSizeError, pretty_func_name
+from structlib.io import bufferio, streamio
+from structlib.protocols.typedef import align_of, calculate_padding
+from structlib.typedefs.datastruct import TypeDefDataclass
+from structlib.typedefs.structure import Struct, _fused_struct
+from structlib.typing_ import ReadableBuffer, ReadableStream
+
+Field = Union[str, int]
+
+
+class Projection:
+    """
+    Decodes a subset of the members of a fixed size Struct / DataStruct; the other members are never read.
+
+    Members are decoded at their precomputed offsets; when every selected member maps to the struct module,
+    all selected members are decoded by a single precompiled struct. Streams seek past the unselected members.
+    Values are returned as a tuple, in the order the fields were selected.
+    """
+
+    def __init__(self, typedef: Any, fields: Sequence[Field]):
+        """
+        :param typedef: A fixed size Struct or DataStruct.
+        :param fields: Attribute names (DataStruct) or member indexes (Struct; const members, E.G. Padding, aren't counted).
+        """
+        if isinstance(typedef, TypeDefDataclass):
+            packable: Struct = typedef.__typedef_dclass_struct_packable__
+            names = typedef.__typedef_dclass_name_order__
+            indexes = []
+            for name in fields:
+                if name not in names:
+                    raise KeyError(f"`{typedef.__name__}` has no field '{name}'!")
+                indexes.append(names.index(name))
+        elif isinstance(typedef, Struct):
+            packable = typedef
+            indexes = list(fields)
+        else:
+            raise TypeError(f"Cannot project `{typedef}`; only Structs & DataStructs can be projected!")
+        if packable._offsets is None:
+            raise VarSizeError()
+
+        members, _, size = packable._get_unpack_plan()
+        member_types = [t for t, is_const in zip(packable._types, packable._const_members) if not is_const]
+        self._typedef = typedef
+        self._fields = tuple(fields)
+        self._members = tuple(members[i] for i in indexes)  # (offset, size, decode)
+        self._size = size
+        self._alignment = align_of(packable)
+        self._span = (min((m[0] for m in self._members), default=0), max((m[0] + m[1] for m in self._members), default=0))
+        self._fused = self._fused_record = self._fused_span = None
+        if len(set(indexes)) == len(indexes):  # Fused structs can't decode a field twice
+            selected = [(members[i][0], member_types[i]) for i in indexes]
+            order = sorted(range(len(selected)), key=lambda i: selected[i][0])
+            fields_by_offset = [selected[i] for i in order]
+            self._fused = _fused_struct(fields_by_offset)
+            if self._fused is not None:
+                self._fused_record = _fused_struct(fields_by_offset, size)  # Padded to the record; for iter_unpack
+                self._fused_span = _fused_struct([(offset - self._span[0], t) for offset, t in fields_by_offset])  # Relative to the first field; for streams
+            # The fused structs decode fields in offset order; `_order` restores the selection order
+            self._order = tuple(order.index(i) for i in range(len(order)))
+
+    @property
+    def typedef(self) -> Any:
+        return self._typedef
+
+    @property
+    def fields(self) -> Tuple[Field, ...]:
+        return self._fields
+
+    def _reorder(self, values: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        return tuple([values[i] for i in self._order])
+
+    def _check_size(self, func, buffer: ReadableBuffer, required: int):
+        if len(buffer) < required:
+            raise UnpackBufferSizeError(pretty_func_name(self, func), len(buffer), required)
+
+    def _unpack_at(self, buffer: ReadableBuffer, start: int) -> Tuple[Any, ...]:
+        if self._fused is not None:
+            return self._reorder(self._fused.unpack_from(buffer, start))
+        return tuple([decode(buffer, start, offset) for offset, _, decode in self._members])
+
+    def unpack(self, buffer: ReadableBuffer) -> Tuple[Any, ...]:
+        """
+        Unpacks the selected fields of a record; the buffer starts at the record.
+        """
+        self._check_size(self.unpack, buffer, self._span[1])
+        return self._unpack_at(buffer, 0)
+
+    def unpack_buffer(self, buffer: ReadableBuffer, *, offset: int = 0, origin: int = 0) -> Tuple[int, Tuple[Any, ...]]:
+        """
+        :returns: The bytes the whole record occupies (including padding) & the selected fields.
+        """
+        start = origin + offset + calculate_padding(self._alignment, offset)
+        self._check_size(self.unpack_buffer, buffer, start + self._size)
+        return bufferio.skip(self._size, self._alignment, offset), self._unpack_at(buffer, start)
+
+    def iter_unpack(self, buffer: ReadableBuffer, iter_count: int, *, offset: int = 0, origin: int = 0, columnar: bool = False) -> Tuple[Tuple[Any, ...], ...]:
+        """
+        Unpacks the selected fields of `iter_count` consecutive records.
+
+        :param columnar: If True, returns a tuple of columns (one per field) instead of a tuple of records.
+        """
+        start = origin + offset + calculate_padding(self._alignment, offset)
+        end = start + self._size * iter_count
+        self._check_size(self.iter_unpack, buffer, end)
+        if self._fused_record is not None:
+            view = memoryview(buffer)[start:end]
+            if self._order == tuple(range(len(self._order))):
+                records = tuple(self._fused_record.iter_unpack(view))
+            else:
+                records = tuple(self._reorder(values) for values in self._fused_record.iter_unpack(view))
+        else:
+            records = tuple(self._unpack_at(buffer, record_start) for record_start in range(start, end, self._size))
+        if columnar:
+            return tuple(zip(*records)) if records else tuple(() for _ in self._fields)
+        return records
+
+    def unpack_stream(self, stream: ReadableStream, *, origin: int = 0) -> Tuple[int, Tuple[Any, ...]]:
+        """
+        Reads only the selected fields; seeking past the others. The stream is left at the end of the record.
+        """
+        prefix_padding = streamio.skip(stream, 0, self._alignment, origin)
+        record_start = stream.tell()
+        if self._fused is not None:
+            # Read the span of the selected fields in one call
+            span_start, span_end = self._span
+            stream.seek(record_start + span_start, SEEK_SET)
+            data = stream.read(span_end - span_start)
+            values = self._reorder(self._fused_span.unpack(data)) if len(data) == span_end - span_start else None
+        else:
+            values = []
+            for member_offset, size, decode in self._members:
+                stream.seek(record_start + member_offset, SEEK_SET)
+                data = stream.read(size)
+                if len(data) != size:
+                    values = None
+                    break
+                values.append(decode(data, 0, 0))  # `data` starts at the member; which is aligned within the struct
+            values = tuple(values) if values is not None else None
+        if values is None:
+            raise UnpackBufferSizeError(pretty_func_name(self, self.unpack_stream), stream.tell() - record_start, self._size)
+        stream.seek(record_start + self._size, SEEK_SET)
+        return prefix_padding + self._size, values
+
+    def iter_unpack_stream(self, stream: ReadableStream, iter_count: int, *, origin: int = 0) -> Tuple[int, List[Tuple[Any, ...]]]:
+        total_read = 0
+        results = []
+        for _ in range(iter_count):
+            read, values = self.unpack_stream(stream, origin=origin)
+            total_read += read
+            results.append(values)
+        return total_read, results
+
+
+def project(typedef: Any, fields: Sequence[Field]) -> Projection:
+    """
+    Helper; creates a `Projection` which only decodes `fields` of a fixed size Struct / DataStruct.
+    """
+    return Projection(typedef, fields)
@@ -1,7 +1,7 @@
-from copy import copy
 from typing import List, Union, Type, Any, Tuple
 
 from structlib.abc_.packing import PrimitivePackableABC, IterPackableABC
+from structlib.abc_.typedef import derive_backing
 from structlib.byteorder import ByteOrder
 from structlib.protocols.packing import iter_pack, pack_buffer, iter_unpack, unpack_buffer
 from structlib.protocols.typedef import TypeDefSizable, TypeDefAlignable, TypeDefByteOrder, byteorder_as, size_of, align_as, T
@@ -25,17 +25,13 @@ class FixedCollection(PrimitivePackableABC, IterPackableABC, TypeDefSizable, Typ
 
     def __typedef_align_as__(self, alignment: int):
         if self.__typedef_alignment__ != alignment:
-            inst = copy(self)
-            inst._backing = align_as(self._backing, alignment)
-            return inst
+            return derive_backing(self, align_as(self._backing, alignment))
         else:
             return self
 
     def __typedef_byteorder_as__(self, byteorder: ByteOrder):
         if self.__typedef_byteorder__ != byteorder:
-            inst = copy(self)
-            inst._backing = byteorder_as(self._backing, byteorder)
-            return inst
+            return derive_backing(self, byteorder_as(self._backing, byteorder))
         else:
             return self
 
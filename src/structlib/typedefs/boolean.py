@@ -1,3 +1,4 @@
+import struct
 from typing import List, Tuple
 
 from structlib.abc_.packing import IterPackableABC, PrimitivePackableABC
@@ -14,6 +15,14 @@ class BooleanDefinition(PrimitivePackableABC, IterPackableABC, TypeDefSizableABC
     FALSE = 0x00
     FALSE_BUF = bytes([FALSE])
 
+    INTERNAL_STRUCT = struct.Struct("<?")  # Booleans have no byteorder; the prefix only disables native alignment
+
+    def _internal_struct(self) -> struct.Struct:
+        """
+        Returns the precompiled struct for this boolean (excluding padding).
+        """
+        return self.INTERNAL_STRUCT
+
     def __init__(self, *, alignment: int = None):
         """
         Creates a 'class' used to pack/unpack booleans.
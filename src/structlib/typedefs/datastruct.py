@@ -3,15 +3,19 @@ from __future__ import annotations
 import sys
 from abc import ABCMeta, abstractmethod, ABC
 from collections import OrderedDict
+from functools import partial
 from typing import Any, TypeVar, Tuple, Optional, Dict, Type, ForwardRef, _type_check, _eval_type, Protocol, Union, runtime_checkable, _ProtocolMeta, TYPE_CHECKING
+from weakref import WeakKeyDictionary
 
 from structlib.utils import classproperty
 from structlib.abc_.packing import DataclassPackableABC
+from structlib.abc_.typedef import intern_derived
 from structlib.errors import PrettyNotImplementedError
 from structlib.protocols.packing import StructPackable, DClassType, DClass
 from structlib.protocols.typedef import native_size_of, TypeDefAlignable, align_of, AttrProtocolMeta
 from structlib.typedefs.array import AnyPackableTypeDef
 from structlib.typedefs.structure import Struct
+from structlib.typing_ import ReadableBuffer
 
 T = TypeVar("T")
 
@@ -109,8 +113,10 @@ class TypeDefDataclassMetaclass(AttrProtocolMeta, ABCMeta, type):
         if cls.__typedef_alignment__ == alignment:
             return cls
         else:
-            new_cls = type(cls.__name__, cls.__bases__, dict(cls.__dict__), alignment=alignment)
-            return new_cls
+            def derive(base: T) -> T:
+                return type(base.__name__, base.__bases__, dict(base.__dict__), alignment=alignment)
+
+            return intern_derived(cls, alignment, None, derive)
 
     def dclass_redefine(cls: T, annotations: Dict) -> T:
         _dict = dict(cls.__dict__)
@@ -128,6 +134,8 @@ class TypeDefDataclassMetaclass(AttrProtocolMeta, ABCMeta, type):
         if not bases:
             return super().__new__(mcs, name, bases, attrs)  # Abstract Base Class; AutoStruct
 
+        # Classes built from another class's `__dict__` (E.G. derived or redefined) are roots until `intern_derived` says otherwise
+        attrs.pop("__typedef_root__", None)
         if "__str__" not in attrs:
             attrs["__str__"] = mcs.dclass_str
         if "__repr__" not in attrs:
@@ -137,16 +145,61 @@ class TypeDefDataclassMetaclass(AttrProtocolMeta, ABCMeta, type):
         attrs["__typedef_alignment__"] = classproperty(lambda self: align_of(self.__typedef_dclass_struct_packable__))
 
         attrs["__typedef_dclass_redefine__"] = classmethod(mcs.dclass_redefine)
-        type_hints = resolve_annotations(attrs.get("__annotations__", {}), attrs.get("__module__"))
-        typed_attr = {name: typing for name, typing in type_hints.items()}
-        ordered_attr = [name for name in type_hints.keys() if name in typed_attr]
-        ordered_structs = [type_hints[attr] for attr in typed_attr]
-        attrs["__typedef_dclass_struct_packable__"] = Struct(*ordered_structs, alignment=alignment)
-        attrs["__typedef_dclass_name2type_lookup__"] = typed_attr
-        attrs["__typedef_dclass_name_order__"] = tuple(ordered_attr)
+        # Resolving annotations & building the Struct is deferred until the class is first used; see `finalize`
+        for attr in _FINALIZED_ATTRS:
+            attrs[attr] = classproperty(partial(_finalized_attr, attr))
 
         attrs["__typedef_native_size__"] = classproperty(lambda self: native_size_of(self.__typedef_dclass_struct_packable__))
-        return super().__new__(mcs, name, bases, attrs)
+        cls = super().__new__(mcs, name, bases, attrs)
+        _PENDING[cls] = attrs.get("__annotations__", {}), attrs.get("__module__"), alignment
+        return cls
+
+
+# Attributes which are only available after the class is finalized
+_FINALIZED_ATTRS = ("__typedef_dclass_struct_packable__", "__typedef_dclass_name2type_lookup__", "__typedef_dclass_name_order__")
+# Classes which haven't been finalized; (raw annotations, module name, alignment)
+_PENDING: WeakKeyDictionary[type, Tuple[Dict[str, Any], Optional[str], Optional[int]]] = WeakKeyDictionary()
+
+
+def _finalized_attr(attr: str, cls: type) -> Any:
+    finalize(cls)
+    return cls.__dict__[attr]
+
+
+def finalize(cls: T) -> T:
+    """
+    Resolves the annotations of a DataStruct class & builds its Struct; does nothing if the class is already finalized.
+
+    Classes are finalized automatically when they are first used (E.G. sized, packed or unpacked);
+    forward references only need to be resolvable by then.
+    """
+    pending = _PENDING.get(cls)
+    if pending is None:
+        return cls
+    raw_annotations, module_name, alignment = pending
+    type_hints = resolve_annotations(raw_annotations, module_name)
+    typed_attr = {name: typing for name, typing in type_hints.items()}
+    ordered_structs = [type_hints[attr] for attr in typed_attr]
+    struct = Struct(*ordered_structs, alignment=alignment)
+    ordered_attr = [name for name, is_const in zip(typed_attr, struct._const_members) if not is_const]  # Const members (E.G. Padding) aren't stored on the instance
+    # Replace the placeholders; later lookups don't go through `_finalized_attr`
+    type.__setattr__(cls, "__typedef_dclass_struct_packable__", struct)
+    type.__setattr__(cls, "__typedef_dclass_name2type_lookup__", typed_attr)
+    type.__setattr__(cls, "__typedef_dclass_name_order__", tuple(ordered_attr))
+    _PENDING.pop(cls, None)
+    return cls
+
+
+def finalize_all() -> int:
+    """
+    Finalizes every DataStruct class which hasn't been used yet; E.G. to warm up a service or to validate a format module.
+
+    :returns: The number of classes finalized.
+    """
+    pending = list(_PENDING.keys())
+    for cls in pending:
+        finalize(cls)
+    return len(pending)
 
 
 def dclass2tuple(t: Union[Type[TypeDefDataclass], Any], v: Union[TypeDefDataclass, T]) -> Union[Tuple[Any, ...], T]:
@@ -247,6 +300,17 @@ class TypeDefDataclassABC(DataclassPackableABC, TypeDefAlignable, TypeDefDatacla
         args = packable.struct_unpack(buffer)
         return tuple2dclass(cls, args)
 
+    @classmethod
+    def dclass_unpack_member(cls, buffer: ReadableBuffer, name: str, *, offset: int = 0) -> Any:
+        """
+        Unpacks a single attribute of a fixed size DataStruct, without decoding the other attributes.
+
+        :param offset: The offset of the DataStruct in the buffer; the DataStruct is assumed to be aligned.
+        """
+        index = cls.__typedef_dclass_name_order__.index(name)
+        packable: Struct = cls.__typedef_dclass_struct_packable__
+        return packable.unpack_member(buffer, index, offset=offset)
+
 
 class DataStruct(TypeDefDataclassABC):
     ...  # Implement any ABC's
@@ -0,0 +1,97 @@
+from enum import Enum
+from typing import Type, Tuple, List, Iterable, Dict, Any
+
+from structlib.abc_.packing import PrimitivePackableABC, IterPackableABC
+from structlib.abc_.typedef import derive_backing
+from structlib.byteorder import ByteOrder
+from structlib.protocols.typedef import TypeDefSizable, TypeDefAlignable, TypeDefByteOrder, native_size_of, align_of, byteorder_of, align_as, byteorder_as
+from structlib.typedefs.integer import IntegerDefinition
+from structlib.utils import auto_pretty_repr
+
+
+class EnumDefinition(PrimitivePackableABC, IterPackableABC, TypeDefSizable, TypeDefAlignable, TypeDefByteOrder):
+    """
+    Represents an Enum stored as an integer.
+
+    The value <-> member lookup tables are built once, when the definition is created;
+    packing/unpacking only performs a dictionary lookup per element instead of calling the Enum's constructor.
+    """
+
+    @property
+    def __typedef_native_size__(self) -> int:
+        return native_size_of(self._backing)
+
+    @property
+    def __typedef_alignment__(self) -> int:
+        return align_of(self._backing)
+
+    @property
+    def __typedef_byteorder__(self) -> ByteOrder:
+        return byteorder_of(self._backing)
+
+    def __typedef_align_as__(self, alignment: int):
+        if self.__typedef_alignment__ != alignment:
+            return derive_backing(self, align_as(self._backing, alignment))
+        else:
+            return self
+
+    def __typedef_byteorder_as__(self, byteorder: ByteOrder):
+        if self.__typedef_byteorder__ != byteorder:
+            return derive_backing(self, byteorder_as(self._backing, byteorder))
+        else:
+            return self
+
+    def __init__(self, enum_cls: Type[Enum], backing: IntegerDefinition):
+        self._enum = enum_cls
+        self._backing = backing
+        # Iterating an Enum skips aliases; aliases share their canonical member, so they are still covered
+        self._value2member: Dict[int, Enum] = {member.value: member for member in enum_cls}
+        self._member2value: Dict[Enum, int] = {member: member.value for member in enum_cls}
+
+    def _to_members(self, values: Iterable[int]) -> List[Enum]:
+        lookup = self._value2member
+        try:
+            return [lookup[value] for value in values]
+        except KeyError:
+            # Values not in the table (E.G. combined Flags); fallback to the Enum's constructor, which raises for invalid values
+            enum_cls = self._enum
+            return [lookup[value] if value in lookup else enum_cls(value) for value in values]
+
+    def _to_values(self, members: Iterable[Any]) -> List[int]:
+        lookup = self._member2value
+        try:
+            return [lookup[member] for member in members]
+        except KeyError:
+            enum_cls = self._enum
+            return [lookup[member] if member in lookup else enum_cls(member).value for member in members]
+
+    def prim_pack(self, arg: Enum) -> bytes:
+        return self._backing.iter_pack(*self._to_values([arg]))
+
+    def unpack_prim(self, buffer: bytes) -> Enum:
+        return self._to_members(self._backing.iter_unpack(buffer, 1))[0]
+
+    def iter_pack(self, *args: Enum) -> bytes:
+        return self._backing.iter_pack(*self._to_values(args))
+
+    def iter_unpack(self, buffer: bytes, iter_count: int) -> Tuple[Enum, ...]:
+        values = self._backing.iter_unpack(buffer, iter_count)
+        return tuple(self._to_members(values))
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        elif isinstance(other, EnumDefinition):
+            return self._enum is other._enum and \
+                   self._backing == other._backing
+        else:
+            return False
+
+    def __str__(self):
+        return f"Enum[{self._enum.__name__}] of `{self._backing}`"
+
+    def __repr__(self):
+        return auto_pretty_repr(self)
+
+
+EnumDef = EnumDefinition  # Alias
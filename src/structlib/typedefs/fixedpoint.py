@@ -0,0 +1,215 @@
+import sys
+from array import array
+from typing import Tuple, List, Sequence, Optional
+
+from structlib.abc_.packing import PrimitivePackableABC, IterPackableABC
+from structlib.abc_.typedef import derive_backing
+from structlib.byteorder import ByteOrder
+from structlib.protocols.typedef import TypeDefSizable, TypeDefAlignable, TypeDefByteOrder, native_size_of, align_of, byteorder_of, align_as, byteorder_as, size_of
+from structlib.typedefs.integer import IntegerDefinition, Int32, UInt8, UInt16, Int8, Int16
+from structlib.utils import auto_pretty_repr, default_if_none
+
+try:
+    import numpy
+except ImportError:  # numpy is optional; fallback to the array module
+    numpy = None
+
+
+class ScaledIntegerDefinition(PrimitivePackableABC, IterPackableABC, TypeDefSizable, TypeDefAlignable, TypeDefByteOrder):
+    """
+    Represents a float stored as an integer; `value = integer * scale + offset`.
+
+    Arrays are converted in bulk; using numpy if it is installed, otherwise the array module is used to read the raw integers.
+    """
+
+    @property
+    def __typedef_native_size__(self) -> int:
+        return native_size_of(self._backing)
+
+    @property
+    def __typedef_alignment__(self) -> int:
+        return align_of(self._backing)
+
+    @property
+    def __typedef_byteorder__(self) -> ByteOrder:
+        return byteorder_of(self._backing)
+
+    def __typedef_align_as__(self, alignment: int):
+        if self.__typedef_alignment__ != alignment:
+            return derive_backing(self, align_as(self._backing, alignment))
+        else:
+            return self
+
+    def __typedef_byteorder_as__(self, byteorder: ByteOrder):
+        if self.__typedef_byteorder__ != byteorder:
+            return derive_backing(self, byteorder_as(self._backing, byteorder))
+        else:
+            return self
+
+    def __init__(self, backing: IntegerDefinition, scale: float, offset: float = None, *, minimum: float = None, maximum: float = None):
+        """
+        :param backing: The integer definition used to store the value.
+        :param scale: The value of a single step of the integer.
+        :param offset: The value of `0`.
+        :param minimum: If specified, unpacked values are clamped to be no less than this value.
+        :param maximum: If specified, unpacked values are clamped to be no greater than this value.
+        """
+        self._backing = backing
+        self._scale = scale
+        self._offset = default_if_none(offset, 0.0)
+        self._minimum = minimum
+        self._maximum = maximum
+
+    @property
+    def _int_range(self) -> Tuple[int, int]:
+        bits = native_size_of(self._backing) * 8
+        if self._backing._signed:
+            return -(1 << (bits - 1)), (1 << (bits - 1)) - 1
+        else:
+            return 0, (1 << bits) - 1
+
+    def _array_typecode(self) -> Optional[str]:
+        backing = self._backing
+        if size_of(backing) != native_size_of(backing):  # Over-aligned elements can't be read as a flat array
+            return None
+        return IntegerDefinition.ARRAY_TYPECODES.get((native_size_of(backing), backing._signed))
+
+    def _numpy_dtype(self):
+        backing = self._backing
+        endian = "<" if byteorder_of(backing) == "little" else ">"
+        kind = "i" if backing._signed else "u"
+        return numpy.dtype(f"{endian}{kind}{native_size_of(backing)}")
+
+    def _unpack_ints(self, buffer: bytes, iter_count: int) -> Sequence[int]:
+        typecode = self._array_typecode()
+        if typecode is None:
+            return self._backing.iter_unpack(buffer, iter_count)
+        values = array(typecode)
+        values.frombytes(buffer[:iter_count * values.itemsize])
+        if byteorder_of(self._backing) != sys.byteorder:
+            values.byteswap()
+        return values
+
+    def _pack_ints(self, values: List[int]) -> bytes:
+        typecode = self._array_typecode()
+        if typecode is None:
+            return self._backing.iter_pack(*values)
+        packed = array(typecode, values)
+        if byteorder_of(self._backing) != sys.byteorder:
+            packed.byteswap()
+        return packed.tobytes()
+
+    def _from_bytes(self, buffer: bytes, iter_count: int) -> List[float]:
+        scale, offset, lo, hi = self._scale, self._offset, self._minimum, self._maximum
+        if numpy is not None and self._array_typecode() is not None:
+            values = numpy.frombuffer(buffer, dtype=self._numpy_dtype(), count=iter_count) * scale + offset
+            if lo is not None or hi is not None:
+                values = numpy.clip(values, lo, hi)
+            return values.tolist()
+        ints = self._unpack_ints(buffer, iter_count)
+        if lo is None and hi is None:
+            return [value * scale + offset for value in ints]
+        lo = -float("inf") if lo is None else lo
+        hi = float("inf") if hi is None else hi
+        return [min(max(value * scale + offset, lo), hi) for value in ints]
+
+    def _to_bytes(self, *args: float) -> bytes:
+        scale, offset = self._scale, self._offset
+        int_lo, int_hi = self._int_range
+        if numpy is not None and self._array_typecode() is not None:
+            ints = numpy.rint((numpy.asarray(args, dtype=numpy.float64) - offset) / scale)
+            if not numpy.isfinite(ints).all():
+                raise ValueError(f"Cannot pack non-finite values as `{self}`!")  # Matches the array module path; casting NaN is undefined
+            # 64-bit limits aren't exact as floats (E.G. `2**64 - 1` rounds up to `2**64`); clip to the nearest float inside the range,
+            #   then saturate in the integer dtype so the limits are exact
+            float_lo = numpy.nextafter(float(int_lo), numpy.inf) if float(int_lo) < int_lo else float(int_lo)
+            float_hi = numpy.nextafter(float(int_hi), -numpy.inf) if float(int_hi) > int_hi else float(int_hi)
+            values = numpy.clip(ints, float_lo, float_hi).astype(self._numpy_dtype())
+            values[ints >= float_hi] = int_hi
+            values[ints <= float_lo] = int_lo
+            return values.tobytes()
+        try:
+            ints = [min(max(round((arg - offset) / scale), int_lo), int_hi) for arg in args]
+        except (ValueError, OverflowError):  # round() of NaN / infinity
+            raise ValueError(f"Cannot pack non-finite values as `{self}`!")
+        return self._pack_ints(ints)
+
+    def prim_pack(self, arg: float) -> bytes:
+        return self._to_bytes(arg)
+
+    def unpack_prim(self, buffer: bytes) -> float:
+        return self._from_bytes(buffer, 1)[0]
+
+    def iter_pack(self, *args: float) -> bytes:
+        return self._to_bytes(*args)
+
+    def iter_unpack(self, buffer: bytes, iter_count: int) -> Tuple[float, ...]:
+        return tuple(self._from_bytes(buffer, iter_count))
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        elif isinstance(other, ScaledIntegerDefinition):
+            return self.__class__ == other.__class__ and \
+                   self._backing == other._backing and \
+                   self._scale == other._scale and \
+                   self._offset == other._offset and \
+                   self._minimum == other._minimum and \
+                   self._maximum == other._maximum
+        else:
+            return False
+
+    def __str__(self):
+        return f"Scaled[{self._scale}, {self._offset}] of `{self._backing}`"
+
+    def __repr__(self):
+        return auto_pretty_repr(self)
+
+
+class FixedPointDefinition(ScaledIntegerDefinition):
+    """
+    Represents a binary fixed-point number (Q format); the lowest `fraction_bits` of the integer are the fractional part.
+
+    E.G. `Q16.16` is a 32-bit signed integer with 16 fractional bits.
+    """
+
+    def __init__(self, backing: IntegerDefinition, fraction_bits: int):
+        bits = native_size_of(backing) * 8
+        if not 0 <= fraction_bits <= bits:
+            raise ValueError(f"Fixed point cannot have '{fraction_bits}' fractional bits in a '{bits}' bit integer!")
+        super().__init__(backing, 1 / (1 << fraction_bits))
+        self._fraction_bits = fraction_bits
+
+    def __str__(self):
+        bits = native_size_of(self._backing) * 8
+        prefix = "Q" if self._backing._signed else "UQ"
+        return f"{prefix}{bits - self._fraction_bits}.{self._fraction_bits}"
+
+
+class NormalizedDefinition(ScaledIntegerDefinition):
+    """
+    Represents a normalized integer; unsigned integers map to [0, 1] and signed integers map to [-1, 1].
+
+    Signed integers follow the common GPU convention; the minimum integer is clamped to -1.
+    Packing saturates values outside the normalized range.
+    """
+
+    def __init__(self, backing: IntegerDefinition):
+        bits = native_size_of(backing) * 8
+        if backing._signed:
+            super().__init__(backing, 1 / ((1 << (bits - 1)) - 1), minimum=-1.0)
+        else:
+            super().__init__(backing, 1 / ((1 << bits) - 1))
+
+    def __str__(self):
+        bits = native_size_of(self._backing) * 8
+        prefix = "SNorm" if self._backing._signed else "UNorm"
+        return f"{prefix}{bits}"
+
+
+UNorm8 = NormalizedDefinition(UInt8)
+UNorm16 = NormalizedDefinition(UInt16)
+SNorm8 = NormalizedDefinition(Int8)
+SNorm16 = NormalizedDefinition(Int16)
+
+Q16_16 = FixedPointDefinition(Int32, 16)
@@ -31,7 +31,13 @@ class FloatDefinition(PrimitivePackableABC, IterPackableABC, TypeDefSizableABC,
         TypeDefSizableABC.__init__(self,native_size)
         TypeDefAlignableABC.__init__(self,alignment)
         TypeDefByteOrderABC.__init__(self,byteorder)
-        self._internal = self.INTERNAL_STRUCTS[(bits, byteorder_of(self))]
+        self._internal_struct()  # Validate bits
+
+    def _internal_struct(self) -> struct.Struct:
+        """
+        Returns the precompiled struct for this float (excluding padding).
+        """
+        return self.INTERNAL_STRUCTS[(native_size_of(self) * 8, byteorder_of(self))]
 
     def __str__(self):
         size = native_size_of(self) * 8
@@ -53,14 +59,14 @@ class FloatDefinition(PrimitivePackableABC, IterPackableABC, TypeDefSizableABC,
         return auto_pretty_repr(self)
 
     def prim_pack(self, arg: float) -> bytes:
-        data = self._internal.pack(arg)
+        data = self._internal_struct().pack(arg)
         buffer = bytearray(size_of(self))
         buffer[0:len(data)] = data
         return buffer
 
     def unpack_prim(self, buffer: bytes) -> float:
         data_buffer = buffer[0:native_size_of(self)]
-        return self._internal.unpack(data_buffer)[0]
+        return self._internal_struct().unpack(data_buffer)[0]
 
     def iter_pack(self, *args: float) -> bytes:
         parts = [self.prim_pack(arg) for arg in args]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import List, Any, Tuple
+import struct
+from array import array
+from typing import List, Any, Tuple, Dict, Optional
 
 from structlib.abc_.packing import IterPackableABC, PrimitivePackableABC
 from structlib.abc_.typedef import TypeDefAlignableABC, TypeDefByteOrderABC, TypeDefSizableABC
@@ -10,7 +12,39 @@ from structlib.protocols.typedef import native_size_of, byteorder_of, align_of,
 from structlib.utils import default_if_none, pretty_str, auto_pretty_repr
 
 
+def _build_array_typecodes() -> Dict[Tuple[int, bool], str]:
+    # Item sizes of 'i'/'l' vary by platform; so we check them at import
+    typecodes = {}
+    for typecode in "bBhHiIlLqQ":
+        typecodes.setdefault((array(typecode).itemsize, typecode.islower()), typecode)
+    return typecodes
+
+
+def _build_internal_structs() -> Dict[Tuple[int, bool, ByteOrder], struct.Struct]:
+    structs = {}
+    for byte_size, code in [(1, "b"), (2, "h"), (4, "i"), (8, "q")]:
+        for signed in [True, False]:
+            for byteorder, prefix in [("little", "<"), ("big", ">")]:
+                structs[(byte_size, signed, byteorder)] = struct.Struct(prefix + (code if signed else code.upper()))
+    return structs
+
+
 class IntegerDefinition(PrimitivePackableABC, IterPackableABC, TypeDefSizableABC, TypeDefAlignableABC, TypeDefByteOrderABC):
+    """
+    Array typecodes organized by (byte_size, signed); used for native-layout bulk conversions.
+    """
+    ARRAY_TYPECODES = _build_array_typecodes()
+    """
+    Structs organized by (byte_size, signed, byteorder [literal]); used by fast paths which need a precompiled unpacker.
+    """
+    INTERNAL_STRUCTS = _build_internal_structs()
+
+    def _internal_struct(self) -> Optional[struct.Struct]:
+        """
+        Returns the precompiled struct for this integer (excluding padding), or None if the size is not supported by the struct module.
+        """
+        return self.INTERNAL_STRUCTS.get((native_size_of(self), self._signed, byteorder_of(self)))
+
     def _to_bytes(self, *args: int):
         native_size = native_size_of(self)
         byteorder = byteorder_of(self)
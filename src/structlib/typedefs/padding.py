@@ -0,0 +1,60 @@
+from typing import Tuple
+
+from structlib.abc_.packing import ConstPackableABC
+from structlib.abc_.typedef import TypeDefSizableABC, TypeDefAlignableABC
+from structlib.io import bufferio, streamio
+from structlib.protocols.typedef import size_of, align_of
+from structlib.typing_ import ReadableBuffer, ReadableStream
+from structlib.utils import default_if_none, auto_pretty_repr
+
+
+class Padding(ConstPackableABC, TypeDefSizableABC, TypeDefAlignableABC):
+    """
+    Represents reserved bytes which should be ignored.
+
+    When packing; the bytes are zero-filled
+    When unpacking; the bytes are skipped, buffers advance the offset and streams seek past the bytes, nothing is read.
+
+    Inside a Struct/DataStruct, padding does not consume an argument and does not appear in the unpacked result.
+    """
+
+    def const_pack(self) -> bytes:
+        return bytes(size_of(self))
+
+    def const_unpack(self, buffer: bytes) -> None:
+        return None
+
+    def const_unpack_buffer(self, buffer: ReadableBuffer, *, offset: int, origin: int) -> Tuple[int, None]:
+        read = bufferio.skip(size_of(self), align_of(self), offset)
+        return read, None
+
+    def const_unpack_stream(self, stream: ReadableStream, *, origin: int) -> Tuple[int, None]:
+        read = streamio.skip(stream, size_of(self), align_of(self), origin)
+        return read, None
+
+    def __init__(self, size: int, *, alignment: int = None):
+        if size < 0:
+            raise ValueError("Padding cannot have a negative size!")
+        alignment = default_if_none(alignment, 1)
+        TypeDefSizableABC.__init__(self, size)
+        TypeDefAlignableABC.__init__(self, alignment)
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        elif isinstance(other, Padding):
+            return self.__typedef_alignment__ == other.__typedef_alignment__ and \
+                   self.__typedef_native_size__ == other.__typedef_native_size__
+        else:
+            return False
+
+    def __str__(self):
+        alignment = align_of(self)
+        align_str = f" @ {alignment}" if alignment != 1 else ""
+        return f"Padding [{size_of(self)}]{align_str}"
+
+    def __repr__(self):
+        return auto_pretty_repr(self)
+
+
+Skip = Padding  # Alias
@@ -1,16 +1,110 @@
-from typing import Tuple, Any
+import re
+from functools import lru_cache, partial
+from io import BytesIO
+from typing import Tuple, Any, List, Optional, Callable
 
 from structlib.abc_.packing import PrimitivePackableABC, IterPackableABC, ConstPackableABC
 from structlib.abc_.typedef import TypeDefSizableABC, TypeDefAlignableABC
-from structlib.io import bufferio
-from structlib.protocols.packing import TPrim, DataclassPackable, DClass, ConstPackable
-from structlib.protocols.typedef import size_of, align_of
+from structlib.errors import UnpackError, PackError
+from structlib.io import bufferio, streamio
+from structlib.protocols.packing import TPrim, DataclassPackable, DClass, ConstPackable, PrimitivePackable
+from structlib.protocols.typedef import size_of, align_of, calculate_padding
 from structlib.typedefs.integer import IntegerDefinition
 from structlib.typedefs.varlen import LengthPrefixedPrimitiveABC
 from structlib.typing_ import ReadableBuffer, ReadableStream, WritableStream, WritableBuffer
 from structlib.utils import default_if_none, auto_pretty_repr
 
 
+def _decode(buffer: bytes, encoding: str) -> str:
+    return str(buffer, encoding)
+
+
+_NULL_BYTE = re.compile(b"\0")
+
+
+def _null_finder(buffer: ReadableBuffer) -> Callable[[int, int], int]:
+    """
+    Returns `find(start, end)`; the index of the first null byte in `buffer[start:end]`, or -1.
+
+    Memoryviews don't have `find`; they are searched with a regex instead, which reads the view in place (without copying it).
+    """
+    if isinstance(buffer, (bytes, bytearray)):
+        return partial(buffer.find, b"\0")
+    search = _NULL_BYTE.search
+
+    def find(start: int, end: int) -> int:
+        match = search(buffer, start, end)
+        return -1 if match is None else match.start()
+
+    return find
+
+
+class StringCache:
+    """
+    A bounded cache of decoded strings, keyed by the raw bytes (and encoding); the least recently used string is evicted first.
+
+    Repeated values return the same `str` object, which avoids decoding them again and keeps a single copy of each string in memory.
+    A cache can be shared by multiple string typedefs.
+    """
+    _DEFAULT_MAXSIZE = 4096
+
+    def __init__(self, maxsize: int = None):
+        maxsize = default_if_none(maxsize, self._DEFAULT_MAXSIZE)
+        if maxsize < 1:
+            raise ValueError("StringCache must hold at least 1 string!")
+        self._maxsize = maxsize
+        self._lookup = lru_cache(maxsize=maxsize)(_decode)
+
+    def decode(self, buffer: ReadableBuffer, encoding: str) -> str:
+        if not isinstance(buffer, bytes):  # Keys must be hashable (and must not hold a reference to the source buffer)
+            buffer = bytes(buffer)
+        return self._lookup(buffer, encoding)
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @property
+    def size(self) -> int:
+        return self._lookup.cache_info().currsize
+
+    @property
+    def hits(self) -> int:
+        return self._lookup.cache_info().hits
+
+    @property
+    def misses(self) -> int:
+        return self._lookup.cache_info().misses
+
+    def clear(self):
+        """
+        Removes all cached strings and resets the hit/miss counters.
+        """
+        self._lookup.cache_clear()
+
+    def __getstate__(self):
+        return self._maxsize  # The lru_cache wrapper can't be pickled; it's recreated instead
+
+    def __setstate__(self, state):
+        self.__init__(state)
+
+    def __str__(self):
+        return f"StringCache [{self.size} / {self.maxsize}] (hits={self.hits}, misses={self.misses})"
+
+    def __repr__(self):
+        return auto_pretty_repr(self)
+
+
+def decode_string(buffer: ReadableBuffer, encoding: str, cache: Optional[StringCache] = None) -> str:
+    """
+    Decodes the buffer, using the cache if one is specified.
+    """
+    if cache is None:
+        return str(buffer, encoding)
+    else:
+        return cache.decode(buffer, encoding)
+
+
 class StringBuffer(PrimitivePackableABC, IterPackableABC, TypeDefSizableABC, TypeDefAlignableABC):
     """
     Represents a fixed-buffer string.
@@ -21,35 +115,41 @@ class StringBuffer(PrimitivePackableABC, IterPackableABC, TypeDefSizableABC, Typ
 
     def prim_pack(self, arg: str) -> bytes:
         encoded = arg.encode(self._encoding)
-        buf = bytearray(encoded)
         size = size_of(self)
-        if len(buf) > size:
-            raise
-        elif len(buf) < size:
-            buf.extend([0x00] * (size - len(buf)))
-        return buf
+        if len(encoded) > size:
+            raise PackError(f"'{arg}' is '{len(encoded)}' bytes, expected at most '{size}' bytes!")
+        return encoded.ljust(size, b"\0")
 
     def unpack_prim(self, buffer: bytes) -> str:
-        return buffer.decode(encoding=self._encoding)
+        return decode_string(buffer, self._encoding, self._cache)
 
     def iter_pack(self, *args: str) -> bytes:
         parts = [self.prim_pack(arg) for arg in args]
-        empty = bytearray()
-        return empty.join(parts)
+        return b"".join(parts)
 
     def iter_unpack(self, buffer: bytes, iter_count: int) -> Tuple[str, ...]:
         size = size_of(self)
-        partials = [buffer[i * size:(i + 1) * size] for i in range(iter_count)]
-        unpacked = [self.unpack_prim(partial) for partial in partials]
-        return tuple(unpacked)
+        encoding = self._encoding
+        view = memoryview(buffer)  # Slicing a view doesn't copy the partials before decoding
+        if self._cache is None:
+            return tuple([str(view[start:start + size], encoding) for start in range(0, iter_count * size, size)])
+        decode = self._cache.decode
+        return tuple([decode(view[start:start + size], encoding) for start in range(0, iter_count * size, size)])
 
     _DEFAULT_ENCODING = "ascii"
 
-    def __init__(self, size: int, encoding: str = None, *, alignment: int = None):
+    def __init__(self, size: int, encoding: str = None, *, alignment: int = None, cache: StringCache = None):
+        """
+        :param size: The size of the buffer.
+        :param encoding: The encoding of the string.
+        :param alignment: The alignment for this type.
+        :param cache: If specified, decoded strings are cached; repeated strings will return the same `str` object.
+        """
         alignment = default_if_none(alignment, 1)
         TypeDefSizableABC.__init__(self, size)
         TypeDefAlignableABC.__init__(self, alignment)
         self._encoding = default_if_none(encoding, self._DEFAULT_ENCODING)
+        self._cache = cache
 
     def __eq__(self, other):
         if self is other:
@@ -83,13 +183,14 @@ class PascalString(LengthPrefixedPrimitiveABC):
         return arg.encode(self._encoding)
 
     def _internal_unpack(self, buffer: bytes) -> TPrim:
-        return buffer.decode(self._encoding)
+        return decode_string(buffer, self._encoding, self._cache)
 
     _DEFAULT_ENCODING = "ascii"
 
-    def __init__(self, size_type: IntegerDefinition, encoding: str = None, *, alignment: int = None, block_size: int = None):
+    def __init__(self, size_type: IntegerDefinition, encoding: str = None, *, alignment: int = None, block_size: int = None, cache: StringCache = None):
         super().__init__(size_type, alignment, block_size)
         self._encoding = default_if_none(encoding, self._DEFAULT_ENCODING)
+        self._cache = cache
 
     def __eq__(self, other):
         if self is other:
@@ -113,13 +214,44 @@ class PascalString(LengthPrefixedPrimitiveABC):
 
 class CStringBuffer(StringBuffer):
     """
-    A Fixed string buffer that will auto-strip trailing `\0` when unpacking.
+    A Fixed string buffer that is terminated by the first `\0` when unpacking; the terminator and any bytes after it are discarded.
 
+    The terminator is found on the raw bytes, so the padding is never decoded;
+    unless the encoding doesn't encode `\0` as a single null byte (E.G. utf-16), then the buffer is decoded and trailing `\0` are stripped.
     Otherwise, it functions identically to StringBuffer.
     """
 
+    def __init__(self, size: int, encoding: str = None, *, alignment: int = None, cache: StringCache = None):
+        super().__init__(size, encoding, alignment=alignment, cache=cache)
+        # The terminator can only be found on the raw bytes if `\0` is encoded as a single null byte; E.G. not utf-16
+        self._byte_terminated = "\0".encode(self._encoding) == b"\0"
+
     def unpack_prim(self, buffer: bytes) -> str:
-        return buffer.decode(encoding=self._encoding).rstrip("\0")
+        if not self._byte_terminated:
+            return decode_string(buffer, self._encoding, self._cache).rstrip("\0")
+        end = _null_finder(buffer)(0, len(buffer))
+        if end != -1:
+            buffer = buffer[:end]
+        return decode_string(buffer, self._encoding, self._cache)
+
+    def iter_unpack(self, buffer: bytes, iter_count: int) -> Tuple[str, ...]:
+        if not self._byte_terminated:
+            return tuple([value.rstrip("\0") for value in super().iter_unpack(buffer, iter_count)])
+        size = size_of(self)
+        encoding = self._encoding
+        find = _null_finder(buffer)
+        view = memoryview(buffer)
+        cache = self._cache
+        results = []
+        for start in range(0, iter_count * size, size):
+            end = find(start, start + size)
+            if end == -1:
+                end = start + size
+            if cache is None:
+                results.append(str(view[start:end], encoding))
+            else:
+                results.append(cache.decode(view[start:end], encoding))
+        return tuple(results)
 
     def __str__(self):
         return "C" + super(CStringBuffer, self).__str__()
@@ -128,6 +260,191 @@ class CStringBuffer(StringBuffer):
         return auto_pretty_repr(self)
 
 
+class CString(PrimitivePackable, IterPackableABC, TypeDefAlignableABC):
+    """
+    Represents a var-buffer, null-terminated string.
+
+    The terminator is located on the raw bytes (`find` for buffers, block reads for streams) before decoding.
+    The encoding must encode `\0` as a single null byte (E.G. ascii, latin-1, utf-8).
+    """
+    TERMINATOR = b"\0"
+    _DEFAULT_ENCODING = "ascii"
+    _DEFAULT_STREAM_BLOCK_SIZE = 256
+
+    def __init__(self, encoding: str = None, *, alignment: int = None, stream_block_size: int = None, cache: StringCache = None):
+        """
+        :param encoding: The encoding of the string.
+        :param alignment: The alignment for this type.
+        :param stream_block_size: The size of blocks read while searching a stream for the terminator.
+        :param cache: If specified, decoded strings are cached; repeated strings will return the same `str` object.
+        """
+        alignment = default_if_none(alignment, 1)
+        TypeDefAlignableABC.__init__(self, alignment)
+        self._encoding = default_if_none(encoding, self._DEFAULT_ENCODING)
+        self._stream_block_size = default_if_none(stream_block_size, self._DEFAULT_STREAM_BLOCK_SIZE)
+        self._cache = cache
+        if "\0".encode(self._encoding) != self.TERMINATOR:
+            raise ValueError(f"CString does not support '{self._encoding}'; the encoding must encode `\\0` as a single null byte!")
+
+    def _encode(self, arg: str) -> bytes:
+        encoded = arg.encode(self._encoding)
+        if self.TERMINATOR in encoded:
+            raise PackError(f"'{arg}' contains a null terminator!")
+        return encoded
+
+    def prim_pack(self, arg: str) -> bytes:
+        packed = self._encode(arg) + self.TERMINATOR
+        return bufferio.pad_data_to_boundary(packed, align_of(self))
+
+    def prim_pack_buffer(self, buffer: WritableBuffer, arg: str, *, offset: int = 0, origin: int = 0) -> int:
+        packed = self._encode(arg) + self.TERMINATOR
+        return bufferio.write(buffer, packed, align_of(self), offset=offset, origin=origin)
+
+    def prim_pack_stream(self, stream: WritableStream, arg: str, *, origin: int = 0) -> int:
+        packed = self._encode(arg) + self.TERMINATOR
+        return streamio.write(stream, packed, align_of(self), origin=origin)
+
+    def unpack_prim(self, buffer: bytes) -> str:
+        return self.unpack_prim_buffer(buffer)[1]
+
+    def unpack_prim_buffer(self, buffer: ReadableBuffer, *, offset: int = 0, origin: int = 0) -> Tuple[int, str]:
+        alignment = align_of(self)
+        prefix_padding = calculate_padding(alignment, offset)
+        start = origin + offset + prefix_padding
+        end = _null_finder(buffer)(start, len(buffer))
+        if end == -1:
+            raise UnpackError("CString is missing a null terminator!")
+        data_size = end - start + 1
+        postfix_padding = calculate_padding(alignment, offset + prefix_padding + data_size)
+        return prefix_padding + data_size + postfix_padding, decode_string(buffer[start:end], self._encoding, self._cache)
+
+    def unpack_prim_stream(self, stream: ReadableStream, *, origin: int = 0) -> Tuple[int, str]:
+        read, results = self.iter_unpack_stream(stream, 1, origin=origin)
+        return read, results[0]
+
+    def iter_pack(self, *args: str) -> bytes:
+        if align_of(self) == 1:
+            if len(args) == 0:
+                return b""
+            terminator = self.TERMINATOR
+            return terminator.join([self._encode(arg) for arg in args]) + terminator
+        with BytesIO() as stream:
+            self.iter_pack_stream(stream, *args, origin=0)
+            stream.seek(0)
+            return stream.read()
+
+    def iter_pack_buffer(self, buffer: WritableBuffer, *args: str, offset: int, origin: int) -> int:
+        total_written = 0
+        for arg in args:
+            total_written += self.prim_pack_buffer(buffer, arg, offset=total_written + offset, origin=origin)
+        return total_written
+
+    def iter_pack_stream(self, stream: WritableStream, *args: str, origin: int) -> int:
+        total_written = 0
+        for arg in args:
+            total_written += self.prim_pack_stream(stream, arg, origin=origin)
+        return total_written
+
+    def iter_unpack(self, buffer: bytes, iter_count: int) -> Tuple[str, ...]:
+        return self.iter_unpack_buffer(buffer, iter_count)[1]
+
+    def iter_unpack_buffer(self, buffer: ReadableBuffer, iter_count: int, *, offset: int = 0, origin: int = 0) -> Tuple[int, Tuple[str, ...]]:
+        if align_of(self) != 1:
+            results = []
+            total_read = 0
+            for _ in range(iter_count):
+                read, result = self.unpack_prim_buffer(buffer, offset=total_read + offset, origin=origin)
+                total_read += read
+                results.append(result)
+            return total_read, tuple(results)
+        # Unaligned strings are packed back to back; no padding to account for
+        encoding, cache = self._encoding, self._cache
+        start = pos = origin + offset
+        find, size = _null_finder(buffer), len(buffer)
+        results = []
+        for _ in range(iter_count):
+            end = find(pos, size)
+            if end == -1:
+                raise UnpackError("CString is missing a null terminator!")
+            results.append(decode_string(buffer[pos:end], encoding, cache))
+            pos = end + 1
+        return pos - start, tuple(results)
+
+    def iter_unpack_stream(self, stream: ReadableStream, iter_count: int, *, origin: int) -> Tuple[int, Tuple[str, ...]]:
+        terminator, encoding, cache = self.TERMINATOR, self._encoding, self._cache
+        alignment = align_of(self)
+        block_size = self._stream_block_size
+        total_read = 0
+        results = []
+        # Read blocks into a window & search the window; the stream is rewound to the end of the last string once done
+        window = bytearray()
+        window_start = stream.tell()
+        pos = search = 0
+        for _ in range(iter_count):
+            prefix_padding = calculate_padding(alignment, window_start + pos - origin)
+            pos += prefix_padding
+            search = max(search, pos)
+            while True:
+                end = window.find(terminator, search)
+                if end != -1:
+                    break
+                search = max(len(window), pos)
+                block = stream.read(block_size)
+                if len(block) == 0:
+                    raise UnpackError("CString is missing a null terminator!")
+                window += block
+            data_size = end - pos + 1
+            results.append(decode_string(window[pos:end], encoding, cache))
+            postfix_padding = calculate_padding(alignment, window_start + end + 1 - origin)
+            total_read += prefix_padding + data_size + postfix_padding
+            pos = search = end + 1 + postfix_padding
+        stream.seek(window_start + pos)
+        return total_read, tuple(results)
+
+    def unpack_table(self, buffer: ReadableBuffer) -> Tuple[str, ...]:
+        """
+        Unpacks a buffer made up entirely of consecutive (unaligned) strings; E.G. a string table.
+
+        The whole buffer is decoded at once and then split on the terminator.
+        If a cache is specified; the terminators are found on the raw buffer instead and each string is looked up in the cache.
+        """
+        if len(buffer) == 0:
+            return tuple()
+        if buffer[-1] != 0x00:
+            raise UnpackError("CString table is missing a null terminator!")
+        if self._cache is None:
+            text = str(buffer[:-1], self._encoding)
+            return tuple(text.split("\0"))
+        encoding, decode = self._encoding, self._cache.decode
+        find, size = _null_finder(buffer), len(buffer)
+        view = memoryview(buffer)
+        results = []
+        start = 0
+        while start < size:
+            end = find(start, size)  # Always found; the table ends with a terminator
+            results.append(decode(view[start:end], encoding))
+            start = end + 1
+        return tuple(results)
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        elif isinstance(other, CString):
+            return self.__typedef_alignment__ == other.__typedef_alignment__ and \
+                   self._encoding == other._encoding
+        else:
+            return False
+
+    def __str__(self):
+        name = f"CString ({self._encoding})"
+        alignment = align_of(self)
+        align_str = f" @ {alignment}" if alignment != 1 else ""
+        return f"{name}{align_str}"
+
+    def __repr__(self):
+        return auto_pretty_repr(self)
+
+
 class MagicWord(ConstPackableABC, TypeDefAlignableABC, TypeDefSizableABC):
     """
     Represents a fixed-length magic word.
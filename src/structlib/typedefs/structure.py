@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from io import BytesIO
-from typing import Any, Union, Tuple
+import struct
+from io import SEEK_CUR
+from typing import Any, Union, Tuple, List, Optional, Callable, Sequence
 
+from structlib import layout_cache
 from structlib.abc_.packing import StructPackableABC
 from structlib.abc_.typedef import TypeDefAlignableABC, TypeDefSizableABC
+from structlib.errors import VarSizeError, UnpackBufferSizeError, pretty_func_name
 from structlib.io import bufferio, streamio
-from structlib.protocols.packing import nested_pack, unpack_buffer
+from structlib.layout_cache import StructLayout
+from structlib.protocols.packing import nested_pack, unpack_buffer, unpack_stream, ConstPackable, Packable, StructPackable, PrimitivePackable, DataclassPackable, PrettyTypeError
 from structlib.protocols.typedef import TypeDefSizable, TypeDefAlignable, align_of, TypeDefSizableAndAlignable, size_of, native_size_of, calculate_padding
 from structlib.typedefs.array import AnyPackableTypeDef
+from structlib.typedefs.padding import Padding
+from structlib.typing_ import ReadableStream, WritableBuffer, ReadableBuffer
 
 
 def _max_align_of(*types: TypeDefAlignable):
@@ -38,49 +44,273 @@ def _combined_size(*types: TypeDefSizableAndAlignable):
     return size
 
 
+def _member_offsets(*types: TypeDefSizableAndAlignable) -> Tuple[int, ...]:
+    """
+    The offset of each member (from the start of the struct); mirrors the layout of `_combined_size`.
+    """
+    offsets = []
+    size = 0
+    for t in types:
+        t_align = align_of(t)
+        t_prefix_pad = calculate_padding(t_align, size)
+        offsets.append(size + t_prefix_pad)
+        t_native_size = native_size_of(t)
+        t_postfix_pad = calculate_padding(t_align, t_native_size)
+        size += t_prefix_pad + t_native_size + t_postfix_pad
+    return tuple(offsets)
+
+
+def _compute_layout(*types: AnyPackableTypeDef) -> StructLayout:
+    fixed_size = all(isinstance(t, TypeDefSizable) for t in types)
+    native_size = offsets = None
+    if fixed_size:
+        try:
+            native_size = _combined_size(*types)
+            offsets = _member_offsets(*types)
+        except:  # TODO narrow exception
+            ...
+    const_members = tuple(isinstance(t, ConstPackable) for t in types)
+    unpack_stream_by_member = not fixed_size or any(isinstance(t, Padding) for t in types)
+    return StructLayout(fixed_size, native_size, offsets, const_members, unpack_stream_by_member)
+
+
+# The decoder of each (non-const) member; (offset, size, decode(buffer, start, offset) -> value); `start` is the start of the struct
+_MemberDecoder = Tuple[int, int, Callable[[ReadableBuffer, int], Any]]
+# The members, a single struct which decodes the whole record (if every member maps to the struct module) & the size of the struct
+_UnpackPlan = Tuple[Tuple[_MemberDecoder, ...], Optional[struct.Struct], int]
+
+
+def _internal_struct_of(t: AnyPackableTypeDef) -> Optional[struct.Struct]:
+    get_internal_struct = getattr(t, "_internal_struct", None)
+    if get_internal_struct is None:
+        return None
+    internal_struct = get_internal_struct()
+    if internal_struct is None or internal_struct.size != native_size_of(t):
+        return None
+    return internal_struct
+
+
+def _unpack_buffer_name(t: AnyPackableTypeDef) -> str:
+    # Resolves the `unpack_buffer` dispatch once; protocol checks are too slow to repeat for every record
+    if isinstance(t, Packable):
+        return "unpack_buffer"
+    elif isinstance(t, StructPackable):
+        return "struct_unpack_buffer"
+    elif isinstance(t, PrimitivePackable):
+        return "unpack_prim_buffer"
+    elif isinstance(t, DataclassPackable):
+        return "dclass_unpack_buffer"
+    else:
+        raise PrettyTypeError(t, Packable)
+
+
+def _member_decoder(t: AnyPackableTypeDef) -> Callable[[ReadableBuffer, int, int], Any]:
+    internal_struct = _internal_struct_of(t)
+    if internal_struct is not None:
+        unpack_from = internal_struct.unpack_from
+        return lambda buffer, start, offset: unpack_from(buffer, start + offset)[0]
+    name = _unpack_buffer_name(t)
+    # Members are aligned relative to the start of the struct, not the buffer; getattr, so patched methods (E.G. Profiler) are used
+    return lambda buffer, start, offset: getattr(t, name)(buffer, offset=offset, origin=start)[1]
+
+
+def _fused_struct(fields: Sequence[Tuple[int, AnyPackableTypeDef]], size: int = None) -> Optional[struct.Struct]:
+    """
+    A single struct which decodes every (offset, typedef) field; None unless every field maps to the struct module with a common byteorder.
+
+    :param size: If specified, the struct is padded to `size` bytes; E.G. to decode consecutive records with `iter_unpack`.
+    """
+    prefixes = set()
+    parts = []
+    position = 0
+    for offset, t in fields:
+        internal_struct = _internal_struct_of(t)
+        if internal_struct is None:
+            return None
+        if internal_struct.size > 1:
+            prefixes.add(internal_struct.format[0])
+        if offset > position:
+            parts.append(f"{offset - position}x")
+        parts.append(internal_struct.format[1:])
+        position = offset + internal_struct.size
+    if len(prefixes) > 1:
+        return None
+    if size is not None and size > position:
+        parts.append(f"{size - position}x")
+    return struct.Struct((prefixes.pop() if prefixes else "<") + "".join(parts))
+
+
+def _build_unpack_plan(struct_: Struct) -> _UnpackPlan:
+    members = []
+    fields = []
+    for t, offset, is_const in zip(struct_._types, struct_._offsets, struct_._const_members):
+        if is_const:
+            continue
+        members.append((offset, native_size_of(t), _member_decoder(t)))
+        fields.append((offset, t))
+    return tuple(members), _fused_struct(fields), size_of(struct_)
+
+
 class Struct(StructPackableABC, TypeDefSizableABC, TypeDefAlignableABC):
+    def _pack_members(self, args: Tuple[Any, ...]) -> List[Tuple[AnyPackableTypeDef, bytes]]:
+        """
+        Packs each member; const members (E.G. Padding) don't consume an arg.
+        """
+        arg_iter = iter(args)
+        packed = []
+        for t, is_const in zip(self._types, self._const_members):
+            if is_const:
+                packed.append((t, t.const_pack()))
+            else:
+                try:
+                    arg = next(arg_iter)
+                except StopIteration:
+                    break
+                packed.append((t, nested_pack(t, arg)))  # TODO; check if this fails when t is Struct because Tuple/List is wrapped
+        return packed
+
     def struct_pack(self, *args: Any) -> bytes:
         if self._fixed_size:
             written = 0
             buffer = bytearray(size_of(self))
-            for arg, t in zip(args, self._types):
-                packed = nested_pack(t, arg)  # TODO; check if this fails when t is Struct because Tuple/List is wrapped
+            for t, packed in self._pack_members(args):
                 written += bufferio.write(buffer, packed, align_of(t), written, origin=0)
             return buffer
         else:
-            with BytesIO() as stream:
-                for arg, t in zip(args, self._types):
-                    packed = nested_pack(t, arg)  # TODO; check if this fails when t is Struct because Tuple/List is wrapped
-                    streamio.write(stream, packed, align_of(t), origin=0)
-                stream.seek(0)
-                return stream.read()
+            # Collect members & padding; then join them in a single allocation
+            parts = []
+            written = 0
+            for t, packed in self._pack_members(args):
+                alignment = align_of(t)
+                prefix_padding = calculate_padding(alignment, written)
+                postfix_padding = calculate_padding(alignment, written + prefix_padding + len(packed))
+                if prefix_padding > 0:
+                    parts.append(bufferio.create_padding_buffer(prefix_padding))
+                parts.append(packed)
+                if postfix_padding > 0:
+                    parts.append(bufferio.create_padding_buffer(postfix_padding))
+                written += prefix_padding + len(packed) + postfix_padding
+            return b"".join(parts)
+
+    def struct_pack_buffer(self, buffer: WritableBuffer, *args: Any, offset: int, origin: int) -> int:
+        if self._fixed_size:
+            return super().struct_pack_buffer(buffer, *args, offset=offset, origin=origin)
+        # Write members directly into the buffer; writes are sequential, so a bytearray will grow as needed
+        alignment = align_of(self)
+        prefix_padding = calculate_padding(alignment, offset)
+        bufferio.apply_padding_to_buffer(buffer, prefix_padding, offset, origin)
+        struct_origin = origin + offset + prefix_padding
+        written = 0
+        for t, packed in self._pack_members(args):
+            written += bufferio.write(buffer, packed, align_of(t), written, struct_origin)
+        postfix_offset = offset + prefix_padding + written
+        postfix_padding = calculate_padding(alignment, postfix_offset)
+        bufferio.apply_padding_to_buffer(buffer, postfix_padding, postfix_offset, origin)
+        return prefix_padding + written + postfix_padding
+
+    def _get_unpack_plan(self) -> _UnpackPlan:
+        plan = self._unpack_plan
+        if plan is None:
+            plan = self._unpack_plan = _build_unpack_plan(self)  # Built on first use; defining structs stays cheap
+        return plan
+
+    def _unpack_at(self, buffer: ReadableBuffer, start: int) -> Tuple[Any, ...]:
+        """
+        Decodes every (non-const) member of a fixed size struct at its constant offset; `start` is the start of the struct.
+        """
+        members, record_struct, _ = self._get_unpack_plan()
+        if record_struct is not None:
+            return record_struct.unpack_from(buffer, start)
+        return tuple([decode(buffer, start, offset) for offset, _, decode in members])
 
     def struct_unpack(self, buffer: bytes) -> Tuple[Any, ...]:
+        if self._offsets is not None:
+            self._check_unpack_size(self.struct_unpack, buffer, self._get_unpack_plan()[2])
+            return self._unpack_at(buffer, 0)
         total_read = 0
         results = []
-        for t in self._types:
-            read, result = unpack_buffer(t, buffer, offset=total_read, origin=0)
-            results.append(result)
+        for t, is_const in zip(self._types, self._const_members):
+            if is_const:
+                read, _ = t.const_unpack_buffer(buffer, offset=total_read, origin=0)
+            else:
+                read, result = unpack_buffer(t, buffer, offset=total_read, origin=0)
+                results.append(result)
             total_read += read
         return tuple(results)
 
-    def __init__(self, *types: Union[AnyPackableTypeDef, AnyPackableTypeDef], alignment: int = None):
-        if alignment is None:
-            alignment = _max_align_of(*types)
-        self._fixed_size = all(isinstance(t, TypeDefSizable) for t in types)
+    def struct_unpack_buffer(self, buffer: ReadableBuffer, *, offset: int, origin: int) -> Tuple[int, Tuple[Any, ...]]:
+        if self._offsets is None:
+            return super().struct_unpack_buffer(buffer, offset=offset, origin=origin)
+        # Decode in place; the struct isn't copied out of the buffer first
+        size = self._get_unpack_plan()[2]
+        alignment = align_of(self)
+        start = origin + offset + calculate_padding(alignment, offset)
+        self._check_unpack_size(self.struct_unpack_buffer, buffer, start + size)
+        return bufferio.skip(size, alignment, offset), self._unpack_at(buffer, start)
+
+    def unpack_member(self, buffer: ReadableBuffer, index: int, *, offset: int = 0) -> Any:
+        """
+        Unpacks a single member of a fixed size struct, without decoding the other members.
+
+        :param index: The index of the member in the unpacked result; const members (E.G. Padding) aren't counted.
+        :param offset: The offset of the struct in the buffer; the struct is assumed to be aligned.
+        """
+        if self._offsets is None:
+            raise VarSizeError()
+        members, _, _ = self._get_unpack_plan()
+        member_offset, size, decode = members[index]
+        self._check_unpack_size(self.unpack_member, buffer, offset + member_offset + size)
+        return decode(buffer, offset, member_offset)
+
+    def _check_unpack_size(self, func, buffer: ReadableBuffer, required: int):
+        if len(buffer) < required:
+            raise UnpackBufferSizeError(pretty_func_name(self, func), len(buffer), required)
+
+    def struct_unpack_stream(self, stream: ReadableStream, *, origin: int) -> Tuple[int, Tuple[Any, ...]]:
+        if not self._unpack_stream_by_member:
+            return super().struct_unpack_stream(stream, origin=origin)
+        # Read members directly from the stream; variable sized members can't be read in one block & Padding is skipped via seek
+        alignment = align_of(self)
+        prefix_padding = streamio.skip(stream, 0, alignment, origin)
+        struct_origin = stream.tell()
+        total_read = 0
+        results = []
+        for t, is_const in zip(self._types, self._const_members):
+            if is_const:
+                read, _ = t.const_unpack_stream(stream, origin=struct_origin)
+            else:
+                read, result = unpack_stream(t, stream, origin=struct_origin)
+                results.append(result)
+            total_read += read
         if self._fixed_size:
-            try:
-                size = _combined_size(*types)
-                TypeDefSizableABC.__init__(self, size)
-            except:  # TODO narrow exception
-                # delattr(self, "__typedef_native_size__")
-                ...
+            postfix_padding = size_of(self) - total_read
+            stream.seek(postfix_padding, SEEK_CUR)
         else:
-            ...
-            # delattr(self, "__typedef_native_size__")
+            postfix_padding = streamio.skip(stream, 0, alignment, struct_origin)
+        return prefix_padding + total_read + postfix_padding, tuple(results)
 
+    def __init__(self, *types: Union[AnyPackableTypeDef, AnyPackableTypeDef], alignment: int = None):
+        if alignment is None:
+            alignment = _max_align_of(*types)
+        key = layout_cache.definition_key(types, alignment)  # None if the cache is disabled
+        layout = layout_cache.load_layout(key)
+        if layout is None:
+            layout = _compute_layout(*types)
+            layout_cache.store_layout(key, layout)
+        self._fixed_size = layout.fixed_size
+        self._offsets = layout.offsets  # Member offsets; only known for fixed size structs
+        if layout.native_size is not None:
+            TypeDefSizableABC.__init__(self, layout.native_size)
         TypeDefAlignableABC.__init__(self, alignment)
         self._types = types
+        self._const_members = layout.const_members
+        self._unpack_stream_by_member = layout.unpack_stream_by_member
+        self._unpack_plan: Optional[_UnpackPlan] = None
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_unpack_plan"] = None  # Decoders can't be pickled; rebuilt on first use
+        return state
 
     def __eq__(self, other):
         if self is other:
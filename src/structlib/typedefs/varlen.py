@@ -1,16 +1,24 @@
+from __future__ import annotations
+
+import struct
+import sys
 from abc import abstractmethod
+from array import array
 from io import BytesIO
-from typing import Tuple, Any
+from typing import Tuple, Any, Sequence, Union, overload, Optional
 
 from structlib.abc_.packing import IterPackableABC
 from structlib.abc_.typedef import TypeDefAlignableABC
 from structlib.errors import PrettyNotImplementedError
 from structlib.io import bufferio, streamio
 from structlib.protocols.packing import TPrim, PrimitivePackable
-from structlib.protocols.typedef import align_of
+from structlib.protocols.typedef import align_of, size_of
 from structlib.typedefs.integer import IntegerDefinition
 from structlib.typing_ import ReadableStream, ReadableBuffer, WritableBuffer, WritableStream
-from structlib.utils import default_if_none
+from structlib.utils import default_if_none, auto_pretty_repr
+
+OffsetIndex = array  # array('Q') of offsets; see `LengthPrefixedPrimitiveABC.build_offset_index`
+_OFFSET_INDEX_TYPECODE = "Q"
 
 
 class LengthPrefixedPrimitiveABC(PrimitivePackable, IterPackableABC, TypeDefAlignableABC):
@@ -79,6 +87,58 @@ class LengthPrefixedPrimitiveABC(PrimitivePackable, IterPackableABC, TypeDefAlig
         var_read, var_buffer = bufferio.read(buffer, var_size, alignment, offset=offset + read, origin=origin)  # var_read includes extra bytes read for alignment padding!
         return read + var_read, self._internal_unpack(var_buffer)
 
+    def _prefix_struct(self) -> Optional[struct.Struct]:
+        """
+        The precompiled struct used to scan length prefixes; None if the size type isn't supported by the struct module.
+        """
+        return self._size_type._internal_struct()
+
+    def _skip_prim_buffer(self, buffer: ReadableBuffer, *, offset: int = 0, origin: int = 0) -> int:
+        """
+        Returns the bytes `unpack_prim_buffer` would read; only the length prefix is unpacked.
+        """
+        read, block_count = self._size_type.unpack_prim_buffer(buffer, offset=offset, origin=origin)
+        var_size = self.__block_count2size(block_count)
+        return read + bufferio.skip(var_size, align_of(self), offset + read)
+
+    def build_offset_index(self, buffer: ReadableBuffer, iter_count: int, *, offset: int = 0, origin: int = 0) -> Tuple[int, OffsetIndex]:
+        """
+        Walks the length prefixes of `iter_count` consecutive items (without unpacking the items) and records the offset of each item.
+
+        The index can be passed to `LengthPrefixedSequence` for random access, and can be stored with `pack_offset_index`.
+
+        :returns: The bytes read (like `iter_unpack_buffer`) and the index; an array with the offset (relative to origin) of each item.
+        """
+        index = array(_OFFSET_INDEX_TYPECODE)
+        prefix_struct = self._prefix_struct()
+        if prefix_struct is None:
+            total_read = 0
+            for _ in range(iter_count):
+                index.append(offset + total_read)
+                total_read += self._skip_prim_buffer(buffer, offset=offset + total_read, origin=origin)
+            return total_read, index
+        # Fast path; mirrors `_iter_unpack_buffer_fast` without unpacking payloads
+        unpack_from = prefix_struct.unpack_from
+        prefix_size, prefix_alignment = size_of(self._size_type), align_of(self._size_type)
+        alignment, block_size = align_of(self), self._block_size
+        pos = offset
+        for _ in range(iter_count):
+            index.append(pos)
+            pos += (-pos) % prefix_alignment
+            block_count, = unpack_from(buffer, origin + pos)
+            pos += prefix_size
+            pos += (-pos) % alignment
+            pos += block_count * block_size
+            pos += (-pos) % alignment
+        return pos - offset, index
+
+    def iter_unpack_buffer_lazy(self, buffer: ReadableBuffer, iter_count: int, *, offset: int = 0, origin: int = 0) -> Tuple[int, LengthPrefixedSequence]:
+        """
+        Like `iter_unpack_buffer`; but items are only unpacked when they are accessed.
+        """
+        read, index = self.build_offset_index(buffer, iter_count, offset=offset, origin=origin)
+        return read, LengthPrefixedSequence(self, buffer, index, origin=origin)
+
     def unpack_prim_stream(self, stream: ReadableStream, *, origin: int = 0) -> Tuple[int, TPrim]:
         read, block_count = self._size_type.unpack_prim_stream(stream, origin=origin)
         var_size = self.__block_count2size(block_count)
@@ -105,15 +165,42 @@ class LengthPrefixedPrimitiveABC(PrimitivePackable, IterPackableABC, TypeDefAlig
         return total_written
 
     def iter_unpack(self, buffer: bytes, iter_count: int) -> Tuple[TPrim, ...]:
+        return self.iter_unpack_buffer(buffer, iter_count)[1]
+
+    def _iter_unpack_buffer_fast(self, prefix_struct: struct.Struct, buffer: ReadableBuffer, iter_count: int, offset: int, origin: int) -> Tuple[int, Tuple[TPrim, ...]]:
+        """
+        Equivalent to calling `unpack_prim_buffer` for each item; but prefixes are scanned with a precompiled struct and padding is calculated inline.
+        """
+        unpack_from = prefix_struct.unpack_from
+        internal_unpack = self._internal_unpack
+        prefix_size, prefix_alignment = size_of(self._size_type), align_of(self._size_type)
+        alignment, block_size = align_of(self), self._block_size
         results = []
-        total_read = 0
-        for _ in range(iter_count):
-            read, result = self.unpack_prim_buffer(buffer, offset=total_read)
-            total_read += read
-            results.append(result)
-        return tuple(results)
+        append = results.append
+        pos = offset
+        if prefix_alignment == 1 and alignment == 1:  # Most common case; skip padding calculations
+            for _ in range(iter_count):
+                start = origin + pos + prefix_size
+                block_count, = unpack_from(buffer, origin + pos)
+                end = start + block_count * block_size
+                append(internal_unpack(buffer[start:end]))
+                pos = end - origin
+        else:
+            for _ in range(iter_count):
+                pos += (-pos) % prefix_alignment
+                block_count, = unpack_from(buffer, origin + pos)
+                pos += prefix_size
+                pos += (-pos) % alignment
+                start = origin + pos
+                pos += block_count * block_size
+                append(internal_unpack(buffer[start:origin + pos]))
+                pos += (-pos) % alignment
+        return pos - offset, tuple(results)
 
     def iter_unpack_buffer(self, buffer: ReadableBuffer, iter_count: int, *, offset: int = 0, origin: int = 0) -> Tuple[int, Tuple[TPrim, ...]]:
+        prefix_struct = self._prefix_struct()
+        if prefix_struct is not None:
+            return self._iter_unpack_buffer_fast(prefix_struct, buffer, iter_count, offset, origin)
         results = []
         total_read = 0
         for _ in range(iter_count):
@@ -138,3 +225,71 @@ class LengthPrefixedBytes(LengthPrefixedPrimitiveABC):
 
     def _internal_unpack(self, buffer: bytes) -> bytes:
         return buffer
+
+
+class LengthPrefixedSequence(Sequence):
+    """
+    A read-only sequence over a region of length prefixed items; using an offset index for random access.
+
+    Items are unpacked when accessed (and are not cached), slicing returns a new sequence without unpacking any items.
+    """
+
+    def __init__(self, typedef: LengthPrefixedPrimitiveABC, buffer: ReadableBuffer, index: OffsetIndex, *, origin: int = 0):
+        self._typedef = typedef
+        self._buffer = buffer
+        self._index = index
+        self._origin = origin
+
+    @property
+    def index(self) -> OffsetIndex:
+        return self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @overload
+    def __getitem__(self, item: int) -> Any:
+        ...
+
+    @overload
+    def __getitem__(self, item: slice) -> LengthPrefixedSequence:
+        ...
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[Any, LengthPrefixedSequence]:
+        if isinstance(item, slice):
+            return LengthPrefixedSequence(self._typedef, self._buffer, self._index[item], origin=self._origin)
+        offset = self._index[item]
+        return self._typedef.unpack_prim_buffer(self._buffer, offset=offset, origin=self._origin)[1]
+
+    def __str__(self):
+        return f"Sequence[{len(self)}] of `{self._typedef}`"
+
+    def __repr__(self):
+        return auto_pretty_repr(self)
+
+
+_OFFSET_INDEX_SIZE = IntegerDefinition(8, False, alignment=1, byteorder="little")
+
+
+def pack_offset_index(index: OffsetIndex) -> bytes:
+    """
+    Packs an offset index; as a little-endian UInt64 count followed by little-endian UInt64 offsets.
+    """
+    packed = array(_OFFSET_INDEX_TYPECODE, index)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return _OFFSET_INDEX_SIZE.prim_pack(len(index)) + packed.tobytes()
+
+
+def unpack_offset_index(buffer: ReadableBuffer, *, offset: int = 0) -> Tuple[int, OffsetIndex]:
+    """
+    Unpacks an offset index packed by `pack_offset_index`.
+
+    :returns: The bytes read and the index.
+    """
+    read, count = _OFFSET_INDEX_SIZE.unpack_prim_buffer(buffer, offset=offset)
+    index = array(_OFFSET_INDEX_TYPECODE)
+    index.frombytes(buffer[offset + read:offset + read + count * index.itemsize])
+    if sys.byteorder != "little":
+        index.byteswap()
+    return read + count * index.itemsize, index
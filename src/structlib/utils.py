@@ -1,4 +1,6 @@
-from typing import Any, Optional, OrderedDict, Dict, Union
+import weakref
+from functools import partial
+from typing import Any, Optional, OrderedDict, Dict, Union, Tuple
 
 from structlib.byteorder import ByteOrder
 from structlib.typing_ import ReadableBuffer
@@ -51,6 +53,43 @@ def default_if_none(value: Any, default: Any) -> Any:
     return default if value is None else value
 
 
+class WeakIdCache:
+    """
+    A cache keyed by object identity; for objects which aren't hashable (E.G. typedefs), so can't be the keys of a WeakKeyDictionary.
+
+    Entries hold a weak reference to their object & are removed once it's collected; an id is never reused for a stale entry.
+    Objects which can't be weakly referenced aren't cached. Values must not reference their object, or it's never collected.
+    """
+
+    def __init__(self):
+        self._entries: Dict[int, Tuple[weakref.ref, Any]] = {}
+
+    def get(self, obj: Any) -> Optional[Any]:
+        entry = self._entries.get(id(obj))
+        if entry is not None and entry[0]() is obj:
+            return entry[1]
+        return None
+
+    def put(self, obj: Any, value: Any):
+        key = id(obj)
+        try:
+            ref = weakref.ref(obj, partial(self._forget, key))
+        except TypeError:
+            return  # Can't be weakly referenced; not cached
+        self._entries[key] = ref, value
+
+    def _forget(self, key: int, ref: weakref.ref):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is ref:  # The entry may already be replaced
+            del self._entries[key]
+
+    def __contains__(self, obj: Any) -> bool:
+        return self.get(obj) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 # Stolen from
 # https://stackoverflow.com/qstions/128573/using-property-on-classmethods/64738850#64738850
 # We don't use @classmethod + @property to allow <= 3.9 support
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterator, Type, TypeVar
+from weakref import WeakKeyDictionary
+
+from structlib.errors import VarSizeError, UnpackBufferSizeError, FixedBufferSizeError
+from structlib.protocols.packing import nested_pack
+from structlib.protocols.typedef import align_of, calculate_padding, native_size_of
+from structlib.typedefs.datastruct import TypeDefDataclass
+from structlib.typedefs.structure import Struct, _member_decoder, _internal_struct_of
+from structlib.typing_ import WritableBuffer
+
+T = TypeVar("T")
+
+# Generated view classes organized by DataStruct; classes are hashable, unlike typedef instances
+_VIEW_CLASSES: WeakKeyDictionary[type, Type[DataStructView]] = WeakKeyDictionary()
+
+
+def _member_encoder(t: Any, size: int) -> Callable[[WritableBuffer, int, Any], None]:
+    internal_struct = _internal_struct_of(t)
+    if internal_struct is not None:
+        pack_into = internal_struct.pack_into
+        return lambda buffer, offset, value: pack_into(buffer, offset, value)
+
+    def encode(buffer: WritableBuffer, offset: int, value: Any):
+        packed = nested_pack(t, value)  # Over-aligned members include their trailing padding; only the value is written
+        if len(packed) < size:
+            raise FixedBufferSizeError(len(packed), size)
+        buffer[offset:offset + size] = packed[:size]  # Same size; a bytearray is never resized
+
+    return encode
+
+
+def _field_property(name: str, t: Any, member_offset: int) -> property:
+    size = native_size_of(t)
+    decode = _member_decoder(t)
+    encode = _member_encoder(t, size)
+
+    def fget(self: DataStructView) -> Any:
+        return decode(self._view_buffer, self._view_start, member_offset)
+
+    def fset(self: DataStructView, value: Any):
+        encode(self._view_buffer, self._view_start + member_offset, value)
+
+    return property(fget, fset, doc=f"`{name}`; read from / written to the buffer at offset {member_offset} of the record.")
+
+
+class DataStructView:
+    """
+    A writable view of a DataStruct record inside a buffer (E.G. bytearray, writable mmap).
+
+    Reading a field decodes it from the buffer; setting a field encodes just that field at its fixed offset,
+    so in-place updates only touch the modified bytes. Nested DataStructs are read as copies; assign the whole value to update them.
+
+    Subclasses are generated per DataStruct by `view_class`.
+    """
+    __slots__ = ("_view_buffer", "_view_start")
+    __typedef_view_dclass__: Type[TypeDefDataclass]
+    __typedef_view_struct__: Struct
+    __typedef_view_size__: int
+    __typedef_view_alignment__: int
+
+    def __init__(self, buffer: WritableBuffer, offset: int = 0, *, origin: int = 0):
+        """
+        :param offset: The offset of the record; the record is aligned relative to the origin.
+        :param origin: The origin of the buffer; alignment is relative to the origin.
+        """
+        if memoryview(buffer).readonly:
+            raise TypeError(f"Cannot create a `{self.__class__.__name__}` of a read-only buffer!")
+        self._view_buffer = buffer
+        self.view_move(offset, origin=origin)
+
+    def view_move(self, offset: int, *, origin: int = 0):
+        """
+        Points the view at another record of the same buffer; avoids creating a view per record when patching many records.
+        """
+        start = origin + offset + calculate_padding(self.__typedef_view_alignment__, offset)
+        required = start + self.__typedef_view_size__
+        if len(self._view_buffer) < required:
+            raise UnpackBufferSizeError(f"{self.__class__.__name__}.{self.view_move.__name__}", len(self._view_buffer), required)
+        self._view_start = start
+
+    @property
+    def view_offset(self) -> int:
+        """
+        The (aligned) start of the record in the buffer.
+        """
+        return self._view_start
+
+    def view_dclass(self) -> TypeDefDataclass:
+        """
+        Copies the record into an instance of the viewed DataStruct.
+        """
+        values = self.__typedef_view_struct__._unpack_at(self._view_buffer, self._view_start)
+        return self.__typedef_view_dclass__.__typedef_tuple2dclass__(*values)
+
+    def view_assign(self, value: TypeDefDataclass):
+        """
+        Writes an instance of the viewed DataStruct over the whole record.
+        """
+        packed = value.dclass_pack()
+        self._view_buffer[self._view_start:self._view_start + len(packed)] = packed
+
+    def __str__(self) -> str:
+        names = self.__typedef_view_dclass__.__typedef_dclass_name_order__
+        pairs = [f"{name}={getattr(self, name)}" for name in names]
+        return f"{self.__class__.__name__}({', '.join(pairs)})"
+
+    __repr__ = __str__
+
+
+def view_class(dclass: Type[T]) -> Type[DataStructView]:
+    """
+    The view class of a fixed size DataStruct; generated once, with a property per field.
+
+    :raises VarSizeError: The DataStruct isn't fixed size; fields don't have fixed offsets.
+    """
+    cached = _VIEW_CLASSES.get(dclass)
+    if cached is not None:
+        return cached
+    if not isinstance(dclass, TypeDefDataclass):
+        raise TypeError(f"Cannot view `{dclass}`; only DataStructs can be viewed!")
+    struct: Struct = dclass.__typedef_dclass_struct_packable__
+    if struct._offsets is None:
+        raise VarSizeError()
+    _, _, size = struct._get_unpack_plan()
+    attrs = {
+        "__slots__": (),
+        "__typedef_view_dclass__": dclass,
+        "__typedef_view_struct__": struct,
+        "__typedef_view_size__": size,
+        "__typedef_view_alignment__": align_of(dclass),
+    }
+    members = [(t, offset) for t, offset, is_const in zip(struct._types, struct._offsets, struct._const_members) if not is_const]
+    for name, (t, member_offset) in zip(dclass.__typedef_dclass_name_order__, members):
+        attrs[name] = _field_property(name, t, member_offset)
+    cls = type(f"{dclass.__name__}View", (DataStructView,), attrs)
+    _VIEW_CLASSES[dclass] = cls
+    return cls
+
+
+def view(dclass: Type[T], buffer: WritableBuffer, offset: int = 0, *, origin: int = 0) -> DataStructView:
+    """
+    Helper; views the record at `offset` as `dclass`. Setting a field writes through to the buffer.
+    """
+    return view_class(dclass)(buffer, offset, origin=origin)
+
+
+def iter_view(dclass: Type[T], buffer: WritableBuffer, iter_count: int, *, offset: int = 0, origin: int = 0) -> Iterator[DataStructView]:
+    """
+    Views `iter_count` consecutive records; each record gets its own view.
+    """
+    cls = view_class(dclass)
+    first = cls(buffer, offset, origin=origin)
+    start = first.view_offset - origin
+    required = origin + start + cls.__typedef_view_size__ * iter_count
+    if len(buffer) < required:
+        raise UnpackBufferSizeError(iter_view.__name__, len(buffer), required)
+    if iter_count > 0:
+        yield first
+    for i in range(1, iter_count):
+        yield cls(buffer, start + cls.__typedef_view_size__ * i, origin=origin)
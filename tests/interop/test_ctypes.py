@@ -0,0 +1,103 @@
+import ctypes
+import gc
+
+import pytest
+
+from structlib.errors import VarSizeError, UnpackBufferSizeError
+from structlib.interop.ctypes_ import to_ctypes, view_ctypes, _CTYPES
+from structlib.protocols.typedef import size_of, align_as, byteorder_as
+from structlib.typedefs import integer, floating
+from structlib.typedefs.array import Array
+from structlib.typedefs.boolean import Boolean
+from structlib.typedefs.datastruct import DataStruct
+from structlib.typedefs.padding import Padding
+from structlib.typedefs.strings import StringBuffer, PascalString
+from structlib.typedefs.structure import Struct
+
+BigUInt16 = byteorder_as(integer.UInt16, "big")
+BigInt32 = byteorder_as(integer.Int32, "big")
+LittleInt32 = byteorder_as(integer.Int32, "little")
+
+
+class Header(DataStruct):
+    magic: StringBuffer(4)
+    version: BigUInt16
+    count: BigInt32
+
+
+class Flags(DataStruct):
+    enabled: Boolean
+    count: BigInt32
+
+
+class Record(DataStruct):
+    id: integer.UInt8
+    value: floating.Float64
+    _reserved: Padding(3)
+    name: StringBuffer(5)
+    flags: Array(3, integer.Int16)
+    enabled: Boolean
+
+
+def test_layout_matches_typedef():
+    for typedef in [Header, Record, Struct(integer.UInt8, align_as(integer.UInt32, 2), floating.Float32), Array(3, align_as(integer.UInt8, 2))]:
+        assert ctypes.sizeof(to_ctypes(typedef)) == size_of(typedef)
+    record = to_ctypes(Record)
+    assert [name for name, _ in record._fields_ if not name.startswith("_pad_")] == list(Record.__typedef_dclass_name_order__)
+    assert record.value.offset == 8 and record.name.offset == 19
+    assert to_ctypes(Record) is record  # Cached
+
+
+def test_byteorder_base():
+    assert issubclass(to_ctypes(Header), ctypes.BigEndianStructure)
+    assert issubclass(to_ctypes(Struct(LittleInt32, integer.UInt8)), ctypes.LittleEndianStructure)
+    mixed = Struct(BigInt32, LittleInt32)
+    packed = mixed.struct_pack(1, 2)
+    view = view_ctypes(mixed, bytearray(packed))
+    assert (view.f0, view.f1) == (1, 2)
+
+
+def test_boolean_with_other_endian_members():
+    for typedef in [Flags, Struct(Boolean, BigInt32), Struct(Boolean, LittleInt32, Array(2, Boolean))]:
+        ctype = to_ctypes(typedef)
+        assert ctypes.sizeof(ctype) == size_of(typedef)
+    flagged = Struct(Boolean, BigInt32)
+    view = view_ctypes(flagged, bytearray(flagged.struct_pack(True, 0x01020304)))
+    assert (view.f0, view.f1) == (True, 0x01020304)
+
+
+def test_view_reads_and_writes_buffer():
+    sample = Header.__typedef_tuple2dclass__("HEAD", 3, -7)
+    buffer = bytearray(b"??\0\0" + sample.dclass_pack())
+    view = view_ctypes(Header, buffer, 2)  # offset 2 is aligned to 4
+    assert (view.magic, view.version, view.count) == (b"HEAD", 3, -7)
+    view.count = 1000
+    assert Header.dclass_unpack(bytes(buffer[4:])).count == 1000
+
+
+def test_view_array_of_records():
+    samples = [Record.__typedef_tuple2dclass__(i, i / 2, f"r{i}", [i, -i, i], i % 2 == 0) for i in range(10)]
+    buffer = bytearray(b"".join(sample.dclass_pack() for sample in samples))
+    views = view_ctypes(Record, buffer, count=10)
+    assert [v.id for v in views] == [s.id for s in samples]
+    assert [list(v.flags) for v in views] == [s.flags for s in samples]
+    assert [v.enabled for v in views] == [s.enabled for s in samples]
+
+
+def test_unsupported():
+    with pytest.raises(VarSizeError):
+        to_ctypes(Struct(integer.UInt8, PascalString(integer.UInt8)))
+    with pytest.raises(TypeError):
+        to_ctypes(floating.Float16)
+    with pytest.raises(UnpackBufferSizeError):
+        view_ctypes(Header, bytearray(4))
+
+
+def test_cache_released_with_typedef():
+    typedef = Struct(integer.UInt8, integer.UInt32)
+    ctype = to_ctypes(typedef)
+    assert to_ctypes(typedef) is ctype and typedef in _CTYPES
+    size = len(_CTYPES)
+    del typedef
+    gc.collect()
+    assert len(_CTYPES) == size - 1  # Removed when the typedef was collected; the cache isn't wiped
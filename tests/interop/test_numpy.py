@@ -0,0 +1,92 @@
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+from structlib.errors import VarSizeError, FixedBufferSizeError
+from structlib.interop.numpy_ import to_numpy_dtype, unpack_numpy, pack_numpy, pack_numpy_buffer
+from structlib.protocols.typedef import size_of, align_as, byteorder_as
+from structlib.typedefs import integer, floating
+from structlib.typedefs.array import Array
+from structlib.typedefs.boolean import Boolean
+from structlib.typedefs.datastruct import DataStruct
+from structlib.typedefs.padding import Padding
+from structlib.typedefs.strings import StringBuffer, PascalString
+from structlib.typedefs.structure import Struct
+
+
+class Record(DataStruct):
+    id: integer.UInt8
+    value: floating.Float64
+    _reserved: Padding(3)
+    name: StringBuffer(5)
+    flags: Array(3, integer.Int16)
+    enabled: Boolean
+
+
+COUNT = 100
+
+
+def _records():
+    return [Record.__typedef_tuple2dclass__(i, i / 8, f"r{i}", [i, -i, i * 2], i % 2 == 0) for i in range(COUNT)]
+
+
+def test_dtype_primitives():
+    assert to_numpy_dtype(integer.Int32) == numpy.dtype("=i4")
+    assert to_numpy_dtype(byteorder_as(integer.UInt16, "big")) == numpy.dtype(">u2")
+    assert to_numpy_dtype(floating.Float16) == numpy.dtype("=f2")
+    assert to_numpy_dtype(Boolean) == numpy.dtype("?")
+    assert to_numpy_dtype(StringBuffer(8)) == numpy.dtype("S8")
+    over_aligned = to_numpy_dtype(align_as(integer.UInt8, 4))
+    assert over_aligned.itemsize == 4 and over_aligned.names == ("f0",)
+
+
+def test_dtype_struct_layout():
+    record = Struct(integer.UInt8, integer.UInt32, Padding(2), floating.Float32)
+    dtype = to_numpy_dtype(record)
+    assert dtype.names == ("f0", "f1", "f2")
+    assert [dtype.fields[name][1] for name in dtype.names] == [0, 4, 12]
+    assert dtype.itemsize == size_of(record)
+
+
+def test_dtype_datastruct_matches_size():
+    dtype = to_numpy_dtype(Record)
+    assert dtype.names == Record.__typedef_dclass_name_order__
+    assert dtype.itemsize == size_of(Record)
+
+
+def test_dtype_unsupported():
+    with pytest.raises(VarSizeError):
+        to_numpy_dtype(Struct(integer.UInt8, PascalString(integer.UInt8)))
+    with pytest.raises(TypeError):
+        to_numpy_dtype(integer.Int128)
+
+
+def test_unpack_numpy_is_zero_copy():
+    samples = _records()
+    buffer = bytearray(b"??" + bytes(6) + b"".join(sample.dclass_pack() for sample in samples))  # offset 2 is aligned to 8
+    array = unpack_numpy(Record, buffer, COUNT, offset=2)
+    assert array["id"].tolist() == [s.id for s in samples]
+    assert array["value"].tolist() == [s.value for s in samples]
+    assert array["name"].tolist() == [s.name.encode() for s in samples]
+    assert array["flags"].tolist() == [s.flags for s in samples]
+    assert array["enabled"].tolist() == [s.enabled for s in samples]
+    array["id"][0] = 255  # Writes go to the buffer
+    assert buffer[8] == 255
+
+
+def test_pack_numpy_roundtrip():
+    samples = _records()
+    packed = b"".join(sample.dclass_pack() for sample in samples)
+    array = unpack_numpy(Record, packed, COUNT)
+    assert pack_numpy(Record, array) == packed
+    assert pack_numpy(integer.UInt16, numpy.arange(4)) == integer.UInt16.iter_pack(0, 1, 2, 3)
+
+
+def test_pack_numpy_buffer():
+    samples = numpy.arange(10, dtype=numpy.uint32)
+    buffer = bytearray(b"?")
+    written = pack_numpy_buffer(integer.UInt32, buffer, samples, offset=1)
+    assert written == 3 + 40
+    assert buffer == b"?\0\0\0" + integer.UInt32.iter_pack(*range(10))
+    with pytest.raises(FixedBufferSizeError):
+        pack_numpy_buffer(integer.UInt32, memoryview(bytearray(8)), samples)
@@ -0,0 +1,90 @@
+import gc
+import struct
+
+import pytest
+
+from structlib.byteorder import NativeEndian
+from structlib.errors import VarSizeError
+from structlib.interop.struct_ import to_struct_format, to_struct, from_struct_format, _STRUCTS
+from structlib.protocols.typedef import size_of, align_as, byteorder_as
+from structlib.typedefs import integer, floating
+from structlib.typedefs.array import Array
+from structlib.typedefs.boolean import Boolean
+from structlib.typedefs.datastruct import DataStruct
+from structlib.typedefs.padding import Padding
+from structlib.typedefs.strings import StringBuffer, PascalString
+from structlib.typedefs.structure import Struct
+
+PREFIX = "<" if NativeEndian == "little" else ">"
+
+
+class Record(DataStruct):
+    id: integer.UInt8
+    value: floating.Float64
+    _reserved: Padding(3)
+    name: StringBuffer(5)
+    flags: Array(3, integer.Int16)
+    enabled: Boolean
+
+
+def test_primitive_formats():
+    assert to_struct_format(integer.Int32) == PREFIX + "i"
+    assert to_struct_format(byteorder_as(integer.UInt16, "big")) == ">H"
+    assert to_struct_format(align_as(floating.Float32, 8)) == PREFIX + "f4x"
+    assert to_struct_format(StringBuffer(6)) == PREFIX + "6s"
+    assert to_struct_format(Array(4, integer.UInt8)) == PREFIX + "4B"
+
+
+def test_struct_format_matches_layout():
+    fmt = to_struct_format(Record)
+    assert fmt == PREFIX + "B7xd3x5s3h?x"
+    assert struct.calcsize(fmt) == size_of(Record)
+    sample = Record.__typedef_tuple2dclass__(1, 2.5, "abc", [1, -2, 3], True)
+    assert struct.unpack(fmt, sample.dclass_pack()) == (1, 2.5, b"abc\0\0", 1, -2, 3, True)
+    assert to_struct(Record) is to_struct(Record)
+
+
+def test_nested_struct_format():
+    nested = Struct(integer.UInt8, Struct(integer.UInt16, integer.UInt8), integer.UInt32)
+    fmt = to_struct_format(nested)
+    assert fmt == PREFIX + "BxHB3xI"
+    assert struct.pack(fmt, 1, 2, 3, 4) == nested.struct_pack(1, (2, 3), 4)
+    assert struct.calcsize(to_struct_format(Array(2, Struct(integer.UInt8, integer.UInt16)))) == 8
+
+
+def test_unsupported_formats():
+    with pytest.raises(VarSizeError):
+        to_struct_format(Struct(integer.UInt8, PascalString(integer.UInt8)))
+    with pytest.raises(TypeError):
+        to_struct_format(integer.Int128)
+    with pytest.raises(TypeError):
+        to_struct_format(Struct(byteorder_as(integer.UInt16, "big"), byteorder_as(integer.UInt16, "little")))
+
+
+@pytest.mark.parametrize("fmt", ["<4sH2xI3f", ">bhiq", "!?xd", "=HH", "@bhiqd"])
+def test_from_struct_format_roundtrip(fmt):
+    typedef = from_struct_format(fmt)
+    assert from_struct_format(fmt) is typedef  # Cached
+    assert size_of(typedef) >= struct.calcsize(fmt)
+    if fmt[0] != "@":
+        assert size_of(typedef) == struct.calcsize(fmt)
+        assert struct.calcsize(to_struct_format(typedef)) == struct.calcsize(fmt)
+
+
+def test_from_struct_format_values():
+    typedef = from_struct_format("<4sH2xI3f")
+    packed = struct.pack("<4sH2xI3f", b"HEAD", 2, 3, 1.0, 2.0, 3.0)
+    assert typedef.struct_unpack(packed) == ("HEAD", 2, 3, (1.0, 2.0, 3.0))
+    with pytest.raises(struct.error):
+        from_struct_format("<Z")
+    with pytest.raises(TypeError):
+        from_struct_format("<p")
+
+
+def test_struct_cache_released_with_typedef():
+    typedef = Struct(integer.UInt8, integer.UInt32)
+    assert to_struct(typedef) is to_struct(typedef) and typedef in _STRUCTS
+    size = len(_STRUCTS)
+    del typedef
+    gc.collect()
+    assert len(_STRUCTS) == size - 1  # Removed when the typedef was collected; the cache isn't wiped
@@ -0,0 +1,82 @@
+import gc
+
+import pytest
+
+from structlib.errors import UnpackBufferSizeError
+from structlib.io.reader import BufferReader, _FAST_PATHS
+from structlib.io.writer import BufferWriter
+from structlib.protocols.typedef import align_as, byteorder_as
+from structlib.typedefs import integer, floating
+from structlib.typedefs.strings import PascalString, CString
+from structlib.typedefs.structure import Struct
+
+
+def test_reader_round_trip():
+    name = PascalString(integer.UInt8)
+    record = Struct(integer.UInt8, floating.Float32)
+    big = byteorder_as(integer.Int16, "big")
+    writer = BufferWriter(origin=2)
+    writer.write(integer.UInt8, 7)
+    writer.write(floating.Float64, 0.5)
+    writer.write(name, "hello")
+    writer.write(record, 3, 1.5)
+    writer.write(big, -2)
+    writer.write_many(integer.UInt32, 1, 2, 3)
+    writer.write_many(align_as(integer.UInt16, 4), 4, 5)
+
+    reader = BufferReader(writer.getvalue(), origin=2)
+    assert reader.read(integer.UInt8) == 7
+    assert reader.read(floating.Float64) == 0.5
+    assert reader.read(name) == "hello"
+    assert reader.read(record) == (3, 1.5)
+    assert reader.read(big) == -2
+    assert reader.read_many(integer.UInt32, 3) == (1, 2, 3)
+    assert reader.read_many(align_as(integer.UInt16, 4), 2) == (4, 5)
+    assert reader.remaining == 0
+    assert reader.offset == writer.size
+
+
+def test_reader_bounds():
+    reader = BufferReader(bytes(6), offset=1)
+    with pytest.raises(UnpackBufferSizeError):
+        reader.read(integer.UInt64)
+    assert reader.offset == 1  # Unchanged on failure
+    with pytest.raises(UnpackBufferSizeError):
+        reader.read_many(integer.UInt16, 3)
+    with pytest.raises(UnpackBufferSizeError):
+        reader.seek(7)
+    with pytest.raises(UnpackBufferSizeError):
+        reader.read(integer.UInt32)  # Aligned to 4; ends at 8
+    assert reader.read(integer.UInt16) == 0  # Aligned to 2
+    assert reader.offset == 4 and reader.remaining == 2
+
+
+def test_reader_read_bytes():
+    data = bytes(range(16))
+    reader = BufferReader(data)
+    reader.skip(1)
+    view = reader.read_bytes(4, alignment=4)
+    assert isinstance(view, memoryview) and view.tobytes() == bytes([4, 5, 6, 7])
+    assert reader.offset == 8
+
+
+def test_reader_cstring():
+    cstring = CString()
+    reader = BufferReader(cstring.iter_pack("alpha", "beta", "gamma"))
+    assert reader.read(cstring) == "alpha"
+    assert reader.read_many(cstring, 2) == ("beta", "gamma")
+    assert reader.remaining == 0
+
+
+def test_reader_fast_path_cache():
+    big = byteorder_as(integer.UInt32, "big")
+    assert BufferReader(integer.UInt32.prim_pack(2)).read(big) == 2 << 24
+    assert id(big) in _FAST_PATHS
+    derived = align_as(integer.UInt16, 16)  # Derived typedefs are interned weakly; collected once released
+    assert BufferReader(bytes(16)).read(derived) == 0
+    derived_key = id(derived)
+    assert derived_key in _FAST_PATHS
+    del derived
+    gc.collect()
+    assert derived_key not in _FAST_PATHS  # Removed with its typedef; the id can't map to a stale entry
+    assert id(big) in _FAST_PATHS
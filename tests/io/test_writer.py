@@ -0,0 +1,64 @@
+import pytest
+
+from structlib.errors import VarSizeError
+from structlib.io.writer import BufferWriter
+from structlib.protocols.typedef import align_as
+from structlib.typedefs import integer
+from structlib.typedefs.strings import PascalString
+from structlib.typedefs.structure import Struct
+
+
+def test_writer_grows():
+    writer = BufferWriter(4)
+    for i in range(100):
+        writer.write(integer.UInt32, i)
+    assert writer.size == 400
+    assert writer.capacity >= 400
+    assert writer.getvalue() == integer.UInt32.iter_pack(*range(100))
+
+
+def test_writer_alignment():
+    writer = BufferWriter(origin=3)
+    writer.write(integer.UInt8, 1)
+    writer.write(integer.UInt32, 2)
+    writer.write_bytes(b"ab", alignment=4)
+    assert writer.offset == writer.size == 12
+    expected = bytes(3) + b"\x01" + bytes(3) + integer.UInt32.prim_pack(2) + b"ab\x00\x00"
+    assert writer.getvalue() == expected
+
+
+def test_writer_var_size():
+    record = Struct(integer.UInt8, PascalString(align_as(integer.UInt8, 1)))
+    samples = [(1, "a" * 200), (2, ""), (3, "xyz")]
+    writer = BufferWriter(8)  # Smaller than a single record
+    for sample in samples:
+        writer.write(record, *sample)
+    assert writer.getvalue() == b"".join(record.struct_pack(*sample) for sample in samples)
+    writer.write_many(PascalString(integer.UInt8), "hi", "there")
+    assert writer.getvalue().endswith(PascalString(integer.UInt8).iter_pack("hi", "there"))
+
+
+def test_writer_reserve_patch():
+    writer = BufferWriter(origin=1)
+    writer.write(integer.UInt8, 0xFF)
+    count_offset = writer.reserve(integer.UInt32)
+    written = writer.write_many(integer.UInt16, 1, 2, 3)
+    writer.patch(count_offset, integer.UInt32, 3)
+    assert writer.offset == 1 + 3 + 4 + written
+    view = writer.getbuffer()
+    assert integer.UInt32.unpack_prim_buffer(view, offset=count_offset, origin=1)[1] == 3
+    view.release()
+    with pytest.raises(VarSizeError):
+        writer.reserve(PascalString(integer.UInt8))
+
+
+def test_writer_seek_clear():
+    writer = BufferWriter()
+    writer.seek(8)
+    writer.write(integer.UInt8, 5)
+    assert writer.getvalue() == bytes(8) + b"\x05"
+    writer.clear()
+    assert writer.size == 0 and len(writer.getvalue()) == 0
+    writer.seek(9)
+    writer.write(integer.UInt8, 1)
+    assert writer.getvalue() == bytes(9) + b"\x01"
@@ -0,0 +1,69 @@
+import pytest
+
+from structlib import layout_cache
+from structlib.layout_cache import enable_layout_cache, disable_layout_cache, flush_layout_cache, LAYOUT_CACHE_VERSION
+from structlib.protocols.typedef import size_of, align_as
+from structlib.typedefs import integer, floating, structure
+from structlib.typedefs.padding import Padding
+from structlib.typedefs.strings import PascalString
+from structlib.typedefs.structure import Struct
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    enable_layout_cache(tmp_path)
+    yield tmp_path
+    disable_layout_cache()
+
+
+def _recompute_forbidden(monkeypatch):
+    def fail(*types):
+        raise AssertionError("Layout should have been loaded from the cache!")
+
+    monkeypatch.setattr(structure, "_compute_layout", fail)
+
+
+def test_layout_roundtrip(cache_dir, monkeypatch):
+    types = (integer.UInt8, Padding(3), floating.Float64, integer.UInt16)
+    expected = Struct(*types)
+    flush_layout_cache()
+    assert (cache_dir / f"layouts-v{LAYOUT_CACHE_VERSION}.json").exists()
+
+    enable_layout_cache(cache_dir)  # Reload from disk
+    _recompute_forbidden(monkeypatch)
+    loaded = Struct(*types)
+    assert loaded == expected
+    assert size_of(loaded) == size_of(expected)
+    assert loaded._offsets == expected._offsets
+    assert loaded._const_members == expected._const_members
+    assert loaded.struct_pack(1, 2.0, 3) == expected.struct_pack(1, 2.0, 3)
+
+
+def test_var_size_layout(cache_dir, monkeypatch):
+    types = (integer.UInt8, PascalString(integer.UInt8))
+    Struct(*types)
+    flush_layout_cache()
+    enable_layout_cache(cache_dir)
+    _recompute_forbidden(monkeypatch)
+    loaded = Struct(*types)
+    assert not loaded._fixed_size and loaded._offsets is None
+    assert loaded.struct_unpack(loaded.struct_pack(1, "abc")) == (1, "abc")
+
+
+def test_definition_changes_key(cache_dir):
+    base = layout_cache.definition_key((integer.UInt8, integer.UInt32), 4)
+    assert base == layout_cache.definition_key((integer.UInt8, integer.UInt32), 4)
+    assert base != layout_cache.definition_key((integer.UInt8, integer.UInt32), 8)
+    assert base != layout_cache.definition_key((integer.UInt8, align_as(integer.UInt32, 2)), 4)
+    assert base != layout_cache.definition_key((integer.UInt16, integer.UInt32), 4)
+    assert base != layout_cache.definition_key((integer.UInt8, floating.Float32), 4)
+
+
+def test_corrupt_cache_is_ignored(cache_dir):
+    (cache_dir / f"layouts-v{LAYOUT_CACHE_VERSION}.json").write_text("{not json")
+    enable_layout_cache(cache_dir)
+    assert size_of(Struct(integer.UInt8, integer.UInt32)) == 8
+
+
+def test_disabled_cache():
+    assert layout_cache.definition_key((integer.UInt8,), 1) is None
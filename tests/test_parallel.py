@@ -0,0 +1,74 @@
+import pytest
+
+from structlib.errors import VarSizeError, FixedBufferSizeError
+from structlib.parallel import parallel_iter_unpack, parallel_pack_buffer
+from structlib.protocols.typedef import size_of
+from structlib.typedefs import integer, floating
+from structlib.typedefs.datastruct import DataStruct
+from structlib.typedefs.strings import PascalString
+from structlib.typedefs.structure import Struct
+
+
+class Point(DataStruct):
+    x: integer.Int32
+    y: integer.Int32
+    w: floating.Float32
+
+
+COUNT = 1000
+
+
+def test_parallel_primitive():
+    samples = list(range(COUNT))
+    packed = b"????" + integer.UInt32.iter_pack(*samples)  # offset 2 is aligned to 4
+    result = parallel_iter_unpack(integer.UInt32, packed, COUNT, offset=2, workers=2, chunk_size=64)
+    assert result == tuple(samples)
+
+
+def test_parallel_struct_columnar():
+    record = Struct(integer.UInt8, integer.UInt16, floating.Float32)
+    samples = [(i % 256, i, i / 4) for i in range(COUNT)]
+    packed = b"".join(record.struct_pack(*sample) for sample in samples)
+    assert parallel_iter_unpack(record, packed, COUNT, workers=2, chunk_size=100) == tuple(samples)
+    columns = parallel_iter_unpack(record, packed, COUNT, workers=2, chunk_size=100, columnar=True)
+    assert columns == tuple(zip(*samples))
+
+
+def test_parallel_datastruct_file(tmp_path):
+    samples = [Point.__typedef_tuple2dclass__(i, -i, i / 2) for i in range(COUNT)]
+    path = tmp_path / "points.bin"
+    path.write_bytes(b"".join(sample.dclass_pack() for sample in samples))
+    result = parallel_iter_unpack(Point, path, COUNT, workers=2, chunk_size=128)
+    assert [(p.x, p.y, p.w) for p in result] == [(p.x, p.y, p.w) for p in samples]
+    columns = parallel_iter_unpack(Point, str(path), COUNT, workers=2, chunk_size=128, columnar=True)
+    assert columns["y"] == tuple(-i for i in range(COUNT))
+
+
+def test_parallel_var_size():
+    with pytest.raises(VarSizeError):
+        parallel_iter_unpack(PascalString(integer.UInt8), b"", 0)
+
+
+def test_parallel_pack_primitive():
+    samples = list(range(COUNT))
+    buffer = bytearray(b"?")
+    written = parallel_pack_buffer(integer.UInt32, buffer, *samples, offset=1, workers=4, chunk_size=64)
+    assert written == 3 + 4 * COUNT
+    assert buffer == b"?" + bytes(3) + integer.UInt32.iter_pack(*samples)
+
+
+def test_parallel_pack_struct():
+    record = Struct(integer.UInt8, floating.Float32)
+    samples = [(i % 256, i / 4) for i in range(COUNT)]
+    buffer = bytearray(size_of(record) * COUNT)
+    parallel_pack_buffer(record, buffer, *samples, workers=4, chunk_size=100)
+    assert bytes(buffer) == b"".join(record.struct_pack(*sample) for sample in samples)
+    with pytest.raises(FixedBufferSizeError):
+        parallel_pack_buffer(record, memoryview(bytearray(8)), *samples)
+
+
+def test_parallel_pack_datastruct():
+    samples = [Point.__typedef_tuple2dclass__(i, -i, i / 2) for i in range(COUNT)]
+    buffer = bytearray()
+    parallel_pack_buffer(Point, buffer, *samples, workers=4, chunk_size=128)
+    assert bytes(buffer) == b"".join(sample.dclass_pack() for sample in samples)
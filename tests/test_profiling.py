@@ -0,0 +1,57 @@
+from structlib.profiling import Profiler, profile
+from structlib.typedefs import integer, floating
+from structlib.typedefs.datastruct import DataStruct
+from structlib.typedefs.integer import IntegerDefinition
+from structlib.typedefs.strings import StringBuffer
+from structlib.typedefs.structure import Struct
+
+
+class Pair(DataStruct):
+    a: integer.UInt8
+    b: floating.Float32
+
+
+def test_profile_counts():
+    with profile() as profiler:
+        integer.UInt16.iter_pack(1, 2, 3)
+        integer.UInt16.unpack_prim_buffer(b"\x01\x00", offset=0, origin=0)
+    stats = profiler.stats_of(integer.UInt16)
+    assert stats.calls == 2
+    assert stats.bytes == 6 + 2
+    assert stats.entry_points["iter_pack"].calls == 1
+    assert stats.entry_points["unpack_prim_buffer"].bytes == 2
+    assert stats.entry_points["unpack_prim"].calls == 1  # Nested call; not an outermost call
+    assert stats.name in profiler.report(entry_points=True)
+
+
+def test_profile_nested_attribution():
+    name = StringBuffer(4)  # Strings are unpacked via their entry points; primitives are decoded by the struct's fast path
+    s = Struct(integer.UInt8, name)
+    with profile() as profiler:
+        packed = s.struct_pack(1, "abc")
+        s.struct_unpack(packed)
+    struct_stats = profiler.stats_of(s)
+    name_stats = profiler.stats_of(name)
+    assert struct_stats.calls == 2 and name_stats.calls == 2
+    # The struct's self time excludes its members
+    assert struct_stats.self_time <= struct_stats.inclusive_time - name_stats.inclusive_time + 1e-9
+
+
+def test_profile_datastruct():
+    record = Pair.__typedef_tuple2dclass__(1, 0.5)
+    with profile() as profiler:
+        Pair.dclass_unpack(record.dclass_pack())
+    stats = profiler.stats_of(Pair)
+    assert stats.calls == 2
+    assert set(stats.entry_points) == {"dclass_pack", "dclass_unpack"}
+
+
+def test_profile_disabled_restores():
+    original = IntegerDefinition.__dict__["iter_pack"]
+    profiler = Profiler()
+    profiler.enable()
+    assert IntegerDefinition.__dict__["iter_pack"] is not original
+    profiler.disable()
+    assert IntegerDefinition.__dict__["iter_pack"] is original
+    integer.UInt8.iter_pack(1)
+    assert profiler.snapshot() == []
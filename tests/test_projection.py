@@ -0,0 +1,95 @@
+from io import BytesIO
+
+import pytest
+
+from structlib.errors import VarSizeError, UnpackBufferSizeError
+from structlib.projection import project
+from structlib.protocols.typedef import size_of
+from structlib.typedefs import integer, floating
+from structlib.typedefs.datastruct import DataStruct
+from structlib.typedefs.padding import Padding
+from structlib.typedefs.strings import StringBuffer, PascalString
+from structlib.typedefs.structure import Struct
+
+
+class Event(DataStruct):
+    id: integer.UInt32
+    kind: integer.UInt8
+    _reserved: Padding(3)
+    timestamp: floating.Float64
+    name: StringBuffer(8)
+    value: integer.Int16
+
+
+class Tagged(DataStruct):
+    tag: integer.UInt8
+    name: StringBuffer(4, alignment=4)
+
+
+COUNT = 50
+
+
+def _events():
+    return [Event.__typedef_tuple2dclass__(i, i % 4, i * 1.5, f"e{i}", -i) for i in range(COUNT)]
+
+
+def _packed(events) -> bytes:
+    return b"".join(event.dclass_pack() for event in events)
+
+
+def test_project_datastruct():
+    events = _events()
+    packed = _packed(events)
+    projection = project(Event, ["timestamp", "id"])  # Selection order is kept
+    assert projection.unpack(packed) == (0.0, 0)
+    assert projection.unpack_buffer(b"?" + bytes(7) + packed, offset=1) == (size_of(Event) + 7, (0.0, 0))
+    assert projection.iter_unpack(packed, COUNT) == tuple((e.timestamp, e.id) for e in events)
+    assert projection.iter_unpack(packed, COUNT, columnar=True) == (tuple(e.timestamp for e in events), tuple(e.id for e in events))
+
+
+def test_project_slow_members():
+    events = _events()
+    packed = _packed(events)
+    projection = project(Event, ["name", "value", "name"])  # Strings have no fused path; duplicates are allowed
+    assert projection.iter_unpack(packed, COUNT) == tuple((e.name.ljust(8, "\0"), e.value, e.name.ljust(8, "\0")) for e in events)
+
+
+def test_project_stream():
+    events = _events()
+    stream = BytesIO(b"?" + bytes(7) + _packed(events))
+    stream.seek(1)
+    for fields in (["value", "kind"], ["name", "id"]):
+        stream.seek(1)
+        read, values = project(Event, fields).iter_unpack_stream(stream, COUNT)
+        assert read == 7 + size_of(Event) * COUNT
+        assert stream.tell() == 8 + size_of(Event) * COUNT
+        full = Event.__typedef_dclass_struct_packable__.struct_unpack(events[3].dclass_pack())  # Strings decode with their null padding
+        assert values[3] == tuple(full[Event.__typedef_dclass_name_order__.index(f)] for f in fields)
+    with pytest.raises(UnpackBufferSizeError):
+        stream.seek(len(stream.getvalue()) - 4)
+        project(Event, ["value"]).unpack_stream(stream)
+
+
+def test_project_unaligned_origin():
+    record = Tagged.__typedef_tuple2dclass__(7, "abcd")
+    packed = b"?" + record.dclass_pack()
+    assert Tagged.dclass_unpack_buffer(packed, offset=0, origin=1)[1].name == "abcd"
+    assert project(Tagged, ["name"]).unpack_buffer(packed, offset=0, origin=1) == (8, ("abcd",))
+    assert project(Tagged, ["name", "tag"]).iter_unpack(packed + record.dclass_pack(), 2, origin=1) == (("abcd", 7), ("abcd", 7))
+
+
+def test_project_struct():
+    s = Struct(integer.UInt8, Padding(1), integer.UInt16, floating.Float32)
+    packed = s.struct_pack(1, 2, 3.0) + s.struct_pack(4, 5, 6.0)
+    assert project(s, [2, 0]).iter_unpack(packed, 2) == ((3.0, 1), (6.0, 4))
+
+
+def test_project_errors():
+    with pytest.raises(KeyError):
+        project(Event, ["missing"])
+    with pytest.raises(VarSizeError):
+        project(Struct(integer.UInt8, PascalString(integer.UInt8)), [0])
+    with pytest.raises(TypeError):
+        project(integer.UInt8, [0])
+    with pytest.raises(UnpackBufferSizeError):
+        project(Event, ["id"]).iter_unpack(bytes(size_of(Event)), 2)
@@ -0,0 +1,122 @@
+import mmap
+from enum import Enum
+
+import pytest
+
+from structlib.errors import VarSizeError, UnpackBufferSizeError, PackError
+from structlib.protocols.typedef import size_of, align_as
+from structlib.typedefs import integer, floating
+from structlib.typedefs.datastruct import DataStruct
+from structlib.typedefs.enumeration import EnumDefinition
+from structlib.typedefs.padding import Padding
+from structlib.typedefs.strings import StringBuffer, PascalString
+from structlib.view import view, iter_view, view_class
+
+
+class Record(DataStruct):
+    id: integer.UInt32
+    flags: integer.UInt8
+    _reserved: Padding(3)
+    weight: floating.Float64
+    name: StringBuffer(8)
+    checksum: integer.UInt16
+
+
+class Named(DataStruct):
+    name: PascalString(integer.UInt8)
+
+
+class Tagged(DataStruct):
+    tag: integer.UInt8
+    name: StringBuffer(4, alignment=4)
+
+
+class Color(Enum):
+    Red = 1
+    Blue = 2
+
+
+class OverAligned(DataStruct):
+    name: StringBuffer(3, alignment=4)
+    color: EnumDefinition(Color, align_as(integer.UInt8, 2))
+    tail: integer.UInt8
+
+
+COUNT = 20
+
+
+def _packed() -> bytearray:
+    records = [Record.__typedef_tuple2dclass__(i, 0, i * 0.5, f"r{i}", 0) for i in range(COUNT)]
+    return bytearray(b"".join(record.dclass_pack() for record in records))
+
+
+def test_read_fields():
+    buffer = _packed()
+    record = view(Record, buffer, size_of(Record) * 3)
+    assert record.id == 3 and record.weight == 1.5 and record.name == "r3".ljust(8, "\0")
+    assert record.view_dclass().id == 3
+
+
+def test_write_through_touches_only_the_field():
+    buffer = _packed()
+    expected = bytearray(buffer)
+    record = view(Record, buffer, size_of(Record) * 2)
+    record.checksum = 0xBEEF
+    expected[size_of(Record) * 3 - 8:size_of(Record) * 3 - 6] = (0xBEEF).to_bytes(2, "little")
+    assert buffer == expected
+    record.name = "patched!"
+    assert Record.dclass_unpack(buffer[size_of(Record) * 2:size_of(Record) * 3]).name == "patched!"
+    with pytest.raises(PackError):
+        record.name = "too long for the buffer"
+
+
+def test_iter_view_and_move():
+    buffer = _packed()
+    for record in iter_view(Record, buffer, COUNT):
+        record.flags |= 0x80
+    cursor = view(Record, buffer)
+    for i in range(COUNT):
+        cursor.view_move(size_of(Record) * i)
+        assert cursor.flags == 0x80 and cursor.id == i
+
+
+def test_mmap():
+    buffer = mmap.mmap(-1, size_of(Record) * 2)
+    record = view(Record, buffer, size_of(Record))
+    record.view_assign(Record.__typedef_tuple2dclass__(7, 1, 2.0, "mapped", 3))
+    record.weight = 4.0
+    assert Record.dclass_unpack(buffer[size_of(Record):]).weight == 4.0
+    assert buffer[:size_of(Record)] == bytes(size_of(Record))
+
+
+def test_unaligned_origin():
+    buffer = bytearray(b"?" + Tagged.__typedef_tuple2dclass__(7, "abcd").dclass_pack())
+    record = view(Tagged, buffer, 0, origin=1)
+    assert record.name == "abcd" and record.tag == 7
+    record.name = "wxyz"
+    record.tag = 9
+    assert buffer[0:1] == b"?"
+    assert Tagged.dclass_unpack_buffer(buffer, offset=0, origin=1)[1].name == "wxyz"
+    assert record.view_dclass().tag == 9
+
+
+def test_over_aligned_members():
+    buffer = bytearray(OverAligned.__typedef_tuple2dclass__("abc", Color.Red, 0xFF).dclass_pack())
+    record = view(OverAligned, buffer)
+    record.name = "xyz"
+    record.color = Color.Blue
+    assert buffer == OverAligned.__typedef_tuple2dclass__("xyz", Color.Blue, 0xFF).dclass_pack()
+    # Reads match a full unpack; over-aligned StringBuffers decode their padding
+    assert (record.name, record.color, record.tail) == OverAligned.__typedef_dclass_struct_packable__.struct_unpack(buffer)
+
+
+def test_view_errors():
+    with pytest.raises(VarSizeError):
+        view_class(Named)
+    with pytest.raises(TypeError):
+        view(Record, bytes(size_of(Record)))
+    with pytest.raises(UnpackBufferSizeError):
+        view(Record, bytearray(size_of(Record)), 8)
+    with pytest.raises(UnpackBufferSizeError):
+        list(iter_view(Record, bytearray(size_of(Record)), 2))
+    assert view_class(Record) is view_class(Record)
@@ -0,0 +1,97 @@
+from io import BytesIO
+
+import pytest
+
+from structlib.errors import UnpackError, PackError
+from structlib.typedefs.strings import CString, StringCache
+from tests import rng
+
+SAMPLES = list(rng.generate_strings(64, 5 * 23 * 2022, 48))
+
+
+def test_cstring_pack():
+    assert CString().prim_pack("abc") == b"abc\0"
+    assert CString(alignment=4).prim_pack("abc") == b"abc\0"
+    assert CString(alignment=4).prim_pack("abcd") == b"abcd\0\0\0\0"
+    with pytest.raises(PackError):
+        CString().prim_pack("a\0b")
+
+
+def test_cstring_unpack_buffer():
+    buffer = b"??hello\0world\0"
+    assert CString().unpack_prim_buffer(buffer, offset=2) == (6, "hello")
+    assert CString().unpack_prim_buffer(buffer, offset=1, origin=7) == (6, "world")
+    with pytest.raises(UnpackError):
+        CString().unpack_prim(b"missing")
+
+
+def test_cstring_memoryview():
+    buffer = memoryview(b"??hello\0world\0")
+    assert CString().unpack_prim_buffer(memoryview(b"ab\0")) == (3, "ab")
+    assert CString().unpack_prim_buffer(buffer, offset=2) == (6, "hello")
+    assert CString().iter_unpack_buffer(buffer, 2, offset=2) == (12, ("hello", "world"))
+    assert CString(alignment=2).iter_unpack_buffer(buffer, 2, offset=2) == (12, ("hello", "world"))
+    with pytest.raises(UnpackError):
+        CString().unpack_prim(memoryview(b"missing"))
+
+
+def test_cstring_iter():
+    for alignment in [1, 2, 4]:
+        cstring = CString(alignment=alignment)
+        packed = cstring.iter_pack(*SAMPLES)
+        assert cstring.iter_unpack(packed, len(SAMPLES)) == tuple(SAMPLES)
+        for offset in [0, 1, 3]:
+            buffer = bytearray(offset)
+            written = cstring.iter_pack_buffer(buffer, *SAMPLES, offset=offset, origin=0)
+            read, unpacked = cstring.iter_unpack_buffer(buffer, len(SAMPLES), offset=offset, origin=0)
+            assert unpacked == tuple(SAMPLES)
+            assert read == written
+
+
+def test_cstring_iter_stream():
+    for alignment in [1, 2, 4]:
+        for block_size in [1, 7, 4096]:
+            cstring = CString(alignment=alignment, stream_block_size=block_size)
+            with BytesIO() as stream:
+                stream.write(b"???")
+                written = cstring.iter_pack_stream(stream, *SAMPLES, origin=1)
+                stream.write(b"!")
+                stream.seek(3)
+                read, unpacked = cstring.iter_unpack_stream(stream, len(SAMPLES), origin=1)
+                assert unpacked == tuple(SAMPLES)
+                assert read == written
+                assert stream.tell() == 3 + written
+                assert stream.read() == b"!"
+
+
+def test_cstring_stream_prim():
+    with BytesIO(b"first\0second\0") as stream:
+        assert CString(stream_block_size=2).unpack_prim_stream(stream) == (6, "first")
+        assert stream.tell() == 6
+        assert CString().unpack_prim_stream(stream) == (7, "second")
+
+
+def test_cstring_table():
+    cstring = CString()
+    packed = cstring.iter_pack(*SAMPLES)
+    assert cstring.unpack_table(packed) == tuple(SAMPLES)
+    assert cstring.unpack_table(b"") == tuple()
+    with pytest.raises(UnpackError):
+        cstring.unpack_table(b"abc")
+    assert cstring.unpack_table(memoryview(packed)) == tuple(SAMPLES)
+
+
+def test_cstring_table_cache():
+    cstring = CString(cache=StringCache(16))
+    packed = cstring.iter_pack("a", "", "b", "a")
+    for buffer in [packed, bytearray(packed), memoryview(packed)]:
+        assert cstring.unpack_table(buffer) == ("a", "", "b", "a")
+    unpacked = cstring.unpack_table(memoryview(packed))
+    assert unpacked[0] is unpacked[3]
+
+
+def test_cstring_encoding():
+    with pytest.raises(ValueError):
+        CString("utf-16")
+    utf8 = CString("utf-8")
+    assert utf8.unpack_prim(utf8.prim_pack("héllo")) == "héllo"
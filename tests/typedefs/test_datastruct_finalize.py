@@ -0,0 +1,57 @@
+from structlib.protocols.typedef import size_of
+from structlib.typedefs import integer
+from structlib.typedefs.datastruct import DataStruct, finalize, finalize_all, _PENDING
+
+
+class Outer(DataStruct):
+    header: "Inner"  # Defined later; resolved when Outer is first used
+    value: integer.UInt32
+
+
+class Inner(DataStruct):
+    tag: integer.UInt8
+    size: integer.UInt16
+
+
+def _define():
+    class Lazy(DataStruct):
+        a: integer.UInt8
+        b: integer.UInt32
+
+    return Lazy
+
+
+def test_definition_is_deferred():
+    lazy = _define()
+    assert lazy in _PENDING
+    assert "__typedef_dclass_struct_packable__" in vars(lazy)  # Placeholder
+    assert size_of(lazy) == 8
+    assert lazy not in _PENDING
+    assert lazy.__typedef_dclass_name_order__ == ("a", "b")
+
+
+def test_forward_reference_resolved_on_use():
+    assert Outer.__typedef_dclass_name2type_lookup__["header"] is Inner
+    assert size_of(Outer) == 8
+
+
+def test_finalize():
+    lazy = _define()
+    assert finalize(lazy) is lazy
+    struct = lazy.__typedef_dclass_struct_packable__
+    assert finalize(lazy) is lazy  # Already finalized; nothing is rebuilt
+    assert lazy.__typedef_dclass_struct_packable__ is struct
+
+
+def test_finalize_all():
+    classes = [_define() for _ in range(3)]
+    assert finalize_all() >= 3
+    assert all(cls not in _PENDING for cls in classes)
+    assert finalize_all() == 0
+
+
+def test_unpack_member_by_name():
+    record = Inner.__typedef_tuple2dclass__(3, 500)
+    packed = record.dclass_pack()
+    assert Inner.dclass_unpack_member(packed, "size") == 500
+    assert Inner.dclass_unpack_member(b"??" + packed, "tag", offset=2) == 3
@@ -0,0 +1,63 @@
+import gc
+from enum import Enum
+
+from structlib.abc_.typedef import _DERIVED_TYPEDEFS
+from structlib.protocols.typedef import align_as, byteorder_as, align_of, byteorder_of
+from structlib.typedefs import integer, floating
+from structlib.typedefs.array import Array
+from structlib.typedefs.datastruct import DataStruct
+from structlib.typedefs.enumeration import EnumDefinition
+from structlib.typedefs.fixedpoint import Q16_16
+
+
+class Color(Enum):
+    Red = 1
+
+
+class Pair(DataStruct):
+    a: integer.UInt8
+    b: integer.UInt8
+
+
+def test_derived_interned():
+    for typedef in [integer.UInt32, floating.Float32, Array(4, integer.UInt16), EnumDefinition(Color, integer.UInt16), Q16_16]:
+        big = byteorder_as(typedef, "big")
+        assert byteorder_as(typedef, "big") is big
+        aligned = align_as(big, 8)
+        assert align_as(byteorder_as(typedef, "big"), 8) is aligned
+        assert byteorder_as(align_as(typedef, 8), "big") is aligned  # Order of derivation doesn't matter
+        assert byteorder_of(aligned) == "big" and align_of(aligned) == 8
+        # Deriving back to the root's definition returns the root
+        assert align_as(byteorder_as(aligned, byteorder_of(typedef)), align_of(typedef)) is typedef
+
+
+def test_derived_datastruct_interned():
+    aligned = align_as(Pair, 4)
+    assert align_as(Pair, 4) is aligned
+    assert align_of(aligned) == 4
+    assert align_as(aligned, 1) is Pair
+
+
+def test_redefined_datastruct_not_interned_with_source():
+    aligned = align_as(Pair, 4)
+    redefined = aligned.__typedef_dclass_redefine__({"x": integer.UInt8, "y": integer.UInt32})
+    assert align_as(redefined, 1) is not Pair
+    assert align_as(redefined, 1).__typedef_dclass_name_order__ == ("x", "y")
+    align_as(redefined, 8)
+    assert align_as(Pair, 8).__typedef_dclass_name_order__ == Pair.__typedef_dclass_name_order__
+
+
+def test_derived_float_struct():
+    # Float structs aren't cached on the instance; derived floats must use their own byteorder
+    big = byteorder_as(floating.Float32, "big")
+    assert big.prim_pack(1.0) == b"\x3f\x80\x00\x00"
+
+
+def test_derived_released():
+    root = integer.IntegerDefinition(4, True, byteorder="little")
+    derived = byteorder_as(root, "big")
+    key = (id(root), align_of(root), "big")
+    assert _DERIVED_TYPEDEFS[key] is derived
+    del derived
+    gc.collect()
+    assert key not in _DERIVED_TYPEDEFS
@@ -0,0 +1,181 @@
+from enum import Enum, IntEnum, IntFlag
+from random import Random
+from typing import List, Any
+
+import pytest
+
+from structlib.byteorder import ByteOrder, resolve_byteorder, NetworkEndian, LittleEndian, NativeEndian, BigEndian
+from structlib.protocols.packing import Packable
+from structlib.protocols.typedef import TypeDefAlignable, TypeDefByteOrder, byteorder_as
+from structlib.typedefs import integer
+from structlib.typedefs.enumeration import EnumDefinition
+from tests.typedefs.common_tests import AlignmentTests, DefinitionTests, ByteorderTests, PrimitiveTests, Sample2Bytes
+from tests.typedefs.util import classproperty
+
+
+class Color(Enum):
+    Red = 1
+    Green = 2
+    Blue = 4
+    Crimson = 1  # Alias
+
+
+class Size(IntEnum):
+    Small = -1
+    Medium = 0
+    Large = 300
+
+
+class Access(IntFlag):
+    Read = 1
+    Write = 2
+    Execute = 4
+
+
+# AVOID using test as prefix
+class EnumTests(AlignmentTests, ByteorderTests, PrimitiveTests, DefinitionTests):
+    @classproperty
+    def EQUAL_DEFINITIONS(self) -> List[Any]:
+        if NativeEndian == "big":
+            return [*self.NATIVE_PACKABLE, *self.BIG_PACKABLE, *self.NETWORK_PACKABLE]
+        else:
+            return [*self.NATIVE_PACKABLE, *self.LITTLE_PACKABLE]
+
+    @classproperty
+    def INEQUAL_DEFINITIONS(self) -> List[Any]:
+        if NativeEndian == "little":
+            return [*self.BIG_PACKABLE, *self.NETWORK_PACKABLE]
+        else:
+            return self.LITTLE_PACKABLE
+
+    @classproperty
+    def NATIVE_PACKABLE(self) -> List[Packable]:
+        return [EnumDefinition(self.ENUM, byteorder_as(self.BACKING, NativeEndian))]
+
+    @classproperty
+    def BIG_PACKABLE(self) -> List[Packable]:
+        return [EnumDefinition(self.ENUM, byteorder_as(self.BACKING, BigEndian))]
+
+    @classproperty
+    def LITTLE_PACKABLE(self) -> List[Packable]:
+        return [EnumDefinition(self.ENUM, byteorder_as(self.BACKING, LittleEndian))]
+
+    @classproperty
+    def NETWORK_PACKABLE(self) -> List[Packable]:
+        return [EnumDefinition(self.ENUM, byteorder_as(self.BACKING, NetworkEndian))]
+
+    @classproperty
+    def ALIGNABLE_TYPEDEFS(self) -> List[TypeDefAlignable]:
+        return [*self.NATIVE_PACKABLE, *self.BIG_PACKABLE, *self.LITTLE_PACKABLE, *self.NETWORK_PACKABLE]
+
+    @classproperty
+    def BYTEORDER_TYPEDEFS(self) -> List[TypeDefByteOrder]:
+        return [*self.NATIVE_PACKABLE, *self.BIG_PACKABLE, *self.LITTLE_PACKABLE, *self.NETWORK_PACKABLE]
+
+    @classmethod
+    def get_sample2bytes(cls, byteorder: ByteOrder = None, alignment: int = None) -> Sample2Bytes:
+        size = cls.NATIVE_SIZE
+        byteorder = resolve_byteorder(byteorder)
+        signed = cls.BACKING._signed
+
+        def s2b(s: Enum) -> bytes:
+            return int.to_bytes(s.value, size, byteorder, signed=signed)
+
+        return s2b
+
+    @classproperty
+    def OFFSETS(self) -> List[int]:
+        return [0, 1, 2, 4, 8]  # Normal power sequence
+
+    @classproperty
+    def ALIGNMENTS(self) -> List[int]:
+        return [1, 2, 4, 8]  # 0 not acceptable alignment
+
+    @classproperty
+    def ORIGINS(self) -> List[int]:
+        return [0, 1, 2, 4, 8]
+
+    @classproperty
+    def SAMPLE_COUNT(self) -> int:
+        # Keep it low for faster; less comprehensive, tests
+        return 16
+
+    @classproperty
+    def SAMPLES(self) -> List[Enum]:
+        members = list(self.ENUM)
+        r = Random(5 * 23 * 2022)
+        return [r.choice(members) for _ in range(self.SAMPLE_COUNT)]
+
+    @classproperty
+    def NATIVE_SIZE(self) -> int:
+        return self.BACKING.__typedef_native_size__
+
+    @classproperty
+    def ALIGN(self) -> int:
+        return self.NATIVE_SIZE
+
+    @classproperty
+    def DEFINITION(self) -> EnumDefinition:
+        return EnumDefinition(self.ENUM, self.BACKING)
+
+    @classproperty
+    def ENUM(self):
+        raise NotImplementedError
+
+    @classproperty
+    def BACKING(self) -> integer.IntegerDefinition:
+        raise NotImplementedError
+
+
+class TestColorUInt8(EnumTests):
+    @classproperty
+    def ENUM(self):
+        return Color
+
+    @classproperty
+    def BACKING(self) -> integer.IntegerDefinition:
+        return integer.UInt8
+
+
+class TestSizeInt16(EnumTests):
+    @classproperty
+    def ENUM(self):
+        return Size
+
+    @classproperty
+    def BACKING(self) -> integer.IntegerDefinition:
+        return integer.Int16
+
+
+def test_enum_iter_unpack():
+    definition = EnumDefinition(Size, integer.Int16)
+    samples = [Size.Large, Size.Small, Size.Medium, Size.Large]
+    packed = definition.iter_pack(*samples)
+    assert packed == integer.Int16.iter_pack(300, -1, 0, 300)
+    unpacked = definition.iter_unpack(packed, len(samples))
+    assert unpacked == tuple(samples)
+    assert all(l is r for l, r in zip(unpacked, samples))
+
+
+def test_enum_pack_raw_value():
+    definition = EnumDefinition(Color, integer.UInt8)
+    assert definition.prim_pack(4) == definition.prim_pack(Color.Blue)
+    with pytest.raises(ValueError):
+        definition.prim_pack(3)
+
+
+def test_enum_alias():
+    definition = EnumDefinition(Color, integer.UInt8)
+    assert definition.unpack_prim(definition.prim_pack(Color.Crimson)) is Color.Red
+
+
+def test_enum_unknown_value():
+    definition = EnumDefinition(Color, integer.UInt8)
+    with pytest.raises(ValueError):
+        definition.unpack_prim(bytes([3]))
+
+
+def test_enum_flag_combination():
+    definition = EnumDefinition(Access, integer.UInt8)
+    flags = Access.Read | Access.Execute
+    assert definition.unpack_prim(definition.prim_pack(flags)) == flags
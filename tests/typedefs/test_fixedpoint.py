@@ -0,0 +1,184 @@
+from random import Random
+from typing import List, Any
+
+import pytest
+
+from structlib.byteorder import ByteOrder, resolve_byteorder, NetworkEndian, LittleEndian, NativeEndian, BigEndian
+from structlib.protocols.packing import Packable
+from structlib.protocols.typedef import TypeDefAlignable, TypeDefByteOrder, byteorder_as, align_as
+from structlib.typedefs import integer, fixedpoint
+from structlib.typedefs.fixedpoint import ScaledIntegerDefinition, FixedPointDefinition, NormalizedDefinition
+from tests.typedefs.common_tests import AlignmentTests, DefinitionTests, ByteorderTests, PrimitiveTests, Sample2Bytes
+from tests.typedefs.util import classproperty
+
+
+# AVOID using test as prefix
+class ScaledIntegerTests(AlignmentTests, ByteorderTests, PrimitiveTests, DefinitionTests):
+    @classproperty
+    def EQUAL_DEFINITIONS(self) -> List[Any]:
+        if NativeEndian == "big":
+            return [*self.NATIVE_PACKABLE, *self.BIG_PACKABLE, *self.NETWORK_PACKABLE]
+        else:
+            return [*self.NATIVE_PACKABLE, *self.LITTLE_PACKABLE]
+
+    @classproperty
+    def INEQUAL_DEFINITIONS(self) -> List[Any]:
+        if NativeEndian == "little":
+            return [*self.BIG_PACKABLE, *self.NETWORK_PACKABLE]
+        else:
+            return self.LITTLE_PACKABLE
+
+    @classproperty
+    def NATIVE_PACKABLE(self) -> List[Packable]:
+        return [byteorder_as(self.DEFINITION, NativeEndian)]
+
+    @classproperty
+    def BIG_PACKABLE(self) -> List[Packable]:
+        return [byteorder_as(self.DEFINITION, BigEndian)]
+
+    @classproperty
+    def LITTLE_PACKABLE(self) -> List[Packable]:
+        return [byteorder_as(self.DEFINITION, LittleEndian)]
+
+    @classproperty
+    def NETWORK_PACKABLE(self) -> List[Packable]:
+        return [byteorder_as(self.DEFINITION, NetworkEndian)]
+
+    @classproperty
+    def ALIGNABLE_TYPEDEFS(self) -> List[TypeDefAlignable]:
+        return [*self.NATIVE_PACKABLE, *self.BIG_PACKABLE, *self.LITTLE_PACKABLE, *self.NETWORK_PACKABLE]
+
+    @classproperty
+    def BYTEORDER_TYPEDEFS(self) -> List[TypeDefByteOrder]:
+        return [*self.NATIVE_PACKABLE, *self.BIG_PACKABLE, *self.LITTLE_PACKABLE, *self.NETWORK_PACKABLE]
+
+    @classmethod
+    def get_sample2bytes(cls, byteorder: ByteOrder = None, alignment: int = None) -> Sample2Bytes:
+        definition: ScaledIntegerDefinition = cls.DEFINITION
+        size = cls.NATIVE_SIZE
+        byteorder = resolve_byteorder(byteorder)
+        signed = definition._backing._signed
+        scale = definition._scale
+
+        def s2b(s: float) -> bytes:
+            return int.to_bytes(round(s / scale), size, byteorder, signed=signed)
+
+        return s2b
+
+    @classproperty
+    def OFFSETS(self) -> List[int]:
+        return [0, 1, 2, 4, 8]  # Normal power sequence
+
+    @classproperty
+    def ALIGNMENTS(self) -> List[int]:
+        return [1, 2, 4, 8]  # 0 not acceptable alignment
+
+    @classproperty
+    def ORIGINS(self) -> List[int]:
+        return [0, 1, 2, 4, 8]
+
+    @classproperty
+    def SAMPLE_COUNT(self) -> int:
+        # Keep it low for faster; less comprehensive, tests
+        return 16
+
+    @classproperty
+    def SAMPLES(self) -> List[float]:
+        # Samples must be representable; so they are generated from the integers
+        definition: ScaledIntegerDefinition = self.DEFINITION
+        lo, hi = definition._int_range
+        if isinstance(definition, NormalizedDefinition):
+            lo = max(lo, -hi)  # The minimum SNorm is clamped; so it cannot be represented
+        r = Random(5 * 23 * 2022)
+        return [r.randint(lo, hi) * definition._scale for _ in range(self.SAMPLE_COUNT)]
+
+    @classproperty
+    def NATIVE_SIZE(self) -> int:
+        return self.DEFINITION.__typedef_native_size__
+
+    @classproperty
+    def ALIGN(self) -> int:
+        return self.NATIVE_SIZE
+
+
+class TestUNorm8(ScaledIntegerTests):
+    @classproperty
+    def DEFINITION(self) -> ScaledIntegerDefinition:
+        return fixedpoint.UNorm8
+
+
+class TestSNorm16(ScaledIntegerTests):
+    @classproperty
+    def DEFINITION(self) -> ScaledIntegerDefinition:
+        return fixedpoint.SNorm16
+
+
+class TestQ16_16(ScaledIntegerTests):
+    @classproperty
+    def DEFINITION(self) -> ScaledIntegerDefinition:
+        return fixedpoint.Q16_16
+
+
+def test_normalized_range():
+    assert fixedpoint.UNorm8.iter_unpack(bytes([0, 255]), 2) == (0.0, 1.0)
+    assert fixedpoint.SNorm8.iter_unpack(integer.Int8.iter_pack(-128, -127, 127), 3) == (-1.0, -1.0, 1.0)
+
+
+def test_normalized_saturates():
+    assert fixedpoint.UNorm8.iter_pack(-0.5, 2.0) == bytes([0, 255])
+
+
+def test_fixed_point_iter():
+    q8_8 = FixedPointDefinition(integer.Int16, 8)
+    samples = (1.5, -2.25, 127.99609375)
+    packed = q8_8.iter_pack(*samples)
+    assert packed == integer.Int16.iter_pack(384, -576, 32767)
+    assert q8_8.iter_unpack(packed, len(samples)) == samples
+
+
+def test_over_aligned_iter():
+    aligned = align_as(fixedpoint.UNorm16, 4)
+    samples = (0.0, 1.0, 0.5000076295109483)
+    packed = aligned.iter_pack(*samples)
+    assert len(packed) == 4 * len(samples)
+    assert aligned.iter_unpack(packed, len(samples)) == samples
+
+
+def test_fixed_point_str():
+    assert str(fixedpoint.Q16_16) == "Q16.16"
+    assert str(fixedpoint.UNorm16) == "UNorm16"
+
+
+@pytest.fixture(params=["numpy", "array"])
+def conversion(request, monkeypatch):
+    if request.param == "array":
+        monkeypatch.setattr(fixedpoint, "numpy", None)  # Force the array module fallback
+    elif fixedpoint.numpy is None:
+        pytest.skip("numpy is not installed")
+    return request.param
+
+
+def test_64_bit_saturation(conversion):
+    unorm64 = NormalizedDefinition(integer.UInt64)
+    snorm64 = NormalizedDefinition(integer.Int64)
+    assert unorm64.prim_pack(1.0) == integer.UInt64.prim_pack((1 << 64) - 1)
+    assert unorm64.iter_unpack(unorm64.iter_pack(0.0, 1.0, 2.0, -1.0), 4) == (0.0, 1.0, 1.0, 0.0)
+    assert snorm64.prim_pack(1.0) == integer.Int64.prim_pack((1 << 63) - 1)
+    assert snorm64.iter_unpack(snorm64.iter_pack(-1.0, 1.0, -2.0, 2.0), 4) == (-1.0, 1.0, -1.0, 1.0)
+    q64 = FixedPointDefinition(integer.Int64, 0)
+    assert q64.iter_pack(-2.0 ** 63, 2.0 ** 63) == integer.Int64.iter_pack(-(1 << 63), (1 << 63) - 1)
+
+
+def test_conversion_paths_agree(conversion):
+    samples = (-1.0, -0.25, 0.0, 0.5, 1.0, 3.0)
+    assert fixedpoint.SNorm16.iter_pack(*samples) == integer.Int16.iter_pack(-32767, -8192, 0, 16384, 32767, 32767)
+    assert fixedpoint.UNorm8.iter_unpack(bytes([0, 51, 255]), 3) == (0.0, 0.2, 1.0)
+    assert fixedpoint.Q16_16.iter_unpack(fixedpoint.Q16_16.iter_pack(*samples), len(samples)) == samples
+
+
+def test_non_finite_rejected(conversion):
+    for value in [float("nan"), float("inf"), -float("inf")]:
+        with pytest.raises(ValueError):
+            fixedpoint.UNorm16.iter_pack(value, 0.5)
+        with pytest.raises(ValueError):
+            fixedpoint.Q16_16.prim_pack(value)
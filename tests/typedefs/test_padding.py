@@ -0,0 +1,84 @@
+from io import BytesIO
+
+from structlib.protocols.typedef import align_as, size_of
+from structlib.typedefs import integer
+from structlib.typedefs.datastruct import DataStruct
+from structlib.typedefs.padding import Padding
+from structlib.typedefs.strings import PascalString
+from structlib.typedefs.structure import Struct
+
+
+class ReadCountingStream(BytesIO):
+    """
+    A stream which tracks how many bytes were read; skipped bytes should never be read.
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+class PaddedRecord(DataStruct):
+    a: integer.UInt8
+    _reserved: Padding(7)
+    b: integer.UInt32
+
+
+def test_padding_pack():
+    assert Padding(4).const_pack() == bytes(4)
+
+
+def test_padding_unpack_buffer():
+    read, result = Padding(4).const_unpack_buffer(bytes(8), offset=1, origin=0)
+    assert read == 4 and result is None
+    read, _ = Padding(3, alignment=4).const_unpack_buffer(bytes(8), offset=1, origin=0)
+    assert read == 3 + 4  # prefix padding & over-aligned size
+
+
+def test_padding_unpack_stream_seeks():
+    with ReadCountingStream(bytes(4096)) as stream:
+        read, result = Padding(4000).const_unpack_stream(stream, origin=0)
+        assert read == 4000 and result is None
+        assert stream.tell() == 4000
+        assert stream.bytes_read == 0
+
+
+def test_struct_padding():
+    s = Struct(integer.UInt8, Padding(3), integer.UInt32)
+    assert size_of(s) == 8
+    packed = s.struct_pack(1, 2)
+    assert packed == b"\x01\x00\x00\x00" + integer.UInt32.prim_pack(2)
+    assert s.struct_unpack(packed) == (1, 2)
+
+
+def test_struct_padding_stream_seeks():
+    s = Struct(integer.UInt8, Padding(1000), integer.UInt8)
+    packed = s.struct_pack(1, 2)
+    with ReadCountingStream(packed) as stream:
+        read, result = s.struct_unpack_stream(stream, origin=0)
+        assert result == (1, 2)
+        assert read == len(packed) == stream.tell()
+        assert stream.bytes_read == 2
+
+
+def test_var_size_struct_stream():
+    s = Struct(PascalString(align_as(integer.UInt32, 1)), Padding(3), integer.UInt8)
+    packed = s.struct_pack("hello", 3)
+    with BytesIO(packed) as stream:
+        read, result = s.struct_unpack_stream(stream, origin=0)
+        assert result == ("hello", 3)
+        assert read == len(packed)
+
+
+def test_datastruct_padding():
+    record = PaddedRecord.__typedef_tuple2dclass__(5, 7)
+    packed = record.dclass_pack()
+    assert len(packed) == 12
+    unpacked = PaddedRecord.dclass_unpack(packed)
+    assert (unpacked.a, unpacked.b) == (5, 7)
+    assert PaddedRecord.__typedef_dclass_name_order__ == ("a", "b")
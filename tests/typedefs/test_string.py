@@ -1,12 +1,17 @@
+import pickle
 from typing import List, Any
 
+import pytest
+
+from structlib.errors import PackError
 from tests import rng
 from tests.typedefs.common_tests import AlignmentTests, DefinitionTests, ByteorderTests, PrimitiveTests, Sample2Bytes
 from tests.typedefs.util import classproperty
 from structlib.byteorder import ByteOrder
 from structlib.protocols.packing import PrimitivePackable
 from structlib.protocols.typedef import TypeDefAlignable
-from structlib.typedefs.strings import StringBuffer, CStringBuffer
+from structlib.typedefs.integer import UInt8
+from structlib.typedefs.strings import StringBuffer, CStringBuffer, StringCache, PascalString, CString
 
 
 class TestString(PrimitiveTests, DefinitionTests, AlignmentTests):
@@ -148,3 +153,53 @@ class TestCString(TestString):
     @classproperty
     def ALIGNABLE_TYPEDEFS(self) -> List[TypeDefAlignable]:
         return [CStringBuffer(self.ARR_SIZE, encoding=self.ENCODING)]
+
+
+def test_string_iter():
+    samples = list(rng.generate_strings(32, 5 * 23 * 2022, 16))
+    for t in [StringBuffer(16), CStringBuffer(16), CStringBuffer(16, alignment=8)]:
+        packed = t.iter_pack(*samples)
+        unpacked = t.iter_unpack(packed, len(samples))
+        assert [s.rstrip("\0") for s in unpacked] == samples
+        assert t.iter_unpack(memoryview(packed), len(samples)) == unpacked
+
+
+def test_string_pack_too_large():
+    with pytest.raises(PackError):
+        StringBuffer(4).prim_pack("too large")
+
+
+def test_cstring_buffer_terminator():
+    t = CStringBuffer(8)
+    assert t.unpack_prim(b"abc\0def\0") == "abc"
+    assert t.unpack_prim(b"abcdefgh") == "abcdefgh"
+    assert t.iter_unpack(b"abc\0def\0abcdefgh", 2) == ("abc", "abcdefgh")
+    assert t.unpack_prim(memoryview(b"abc\0def\0")) == "abc"
+    assert t.iter_unpack(memoryview(b"abc\0def\0abcdefgh"), 2) == ("abc", "abcdefgh")
+
+
+def test_cstring_buffer_multibyte_null():
+    t = CStringBuffer(8, encoding="utf-16-le")
+    assert t.unpack_prim(t.prim_pack("AB")) == "AB"
+    assert t.unpack_prim(t.prim_pack("\u0100\u0200")) == "\u0100\u0200"  # Contains null bytes, but no null characters
+    assert t.iter_unpack(t.iter_pack("AB", "CDE"), 2) == ("AB", "CDE")
+
+
+def test_string_cache():
+    cache = StringCache(maxsize=2)
+    names = ["alpha", "beta", "alpha", "alpha", "gamma", "beta"]
+    for t in [StringBuffer(8, cache=cache), CStringBuffer(8, cache=cache), PascalString(UInt8, cache=cache), CString(cache=cache)]:
+        cache.clear()
+        packed = t.iter_pack(*names)
+        unpacked = t.iter_unpack(packed, len(names))
+        assert [s.rstrip("\0") for s in unpacked] == names
+        assert unpacked[0] is unpacked[2] is unpacked[3]
+        assert (cache.hits, cache.misses) == (2, 4)  # `beta` was evicted by `gamma`
+        assert cache.size == 2
+
+
+def test_string_cache_pickle():
+    t = CStringBuffer(8, cache=StringCache(16))
+    clone = pickle.loads(pickle.dumps(t))
+    assert clone._cache.maxsize == 16
+    assert clone.unpack_prim(b"abc\0\0\0\0\0") == "abc"
@@ -1,11 +1,17 @@
 from abc import ABC
 from typing import List, Any, Tuple
 
+import pytest
+
 from structlib.byteorder import ByteOrder, NativeEndian
+from structlib.errors import UnpackBufferSizeError, VarSizeError
 from structlib.protocols.packing import Packable
-from structlib.protocols.typedef import TypeDefAlignable, native_size_of, align_of
+from structlib.protocols.typedef import TypeDefAlignable, native_size_of, align_of, align_as, byteorder_as, size_of
 from structlib.typedefs import integer, floating
+from structlib.typedefs.boolean import Boolean
 from structlib.typedefs.floating import FloatDefinition
+from structlib.typedefs.padding import Padding
+from structlib.typedefs.strings import PascalString, StringBuffer
 from structlib.typedefs.structure import Struct
 from tests import rng
 from tests.typedefs.common_tests import AlignmentTests, StructureTests, Sample2Bytes
@@ -148,3 +154,61 @@ class TestStructFloat16Float32Float64(StructTests):
             return buf
 
         return s2b
+
+
+def test_var_size_struct_pack():
+    s = Struct(integer.UInt8, PascalString(align_as(integer.UInt16, 1)), integer.UInt32)
+    packed = s.struct_pack(1, "hello", 2)
+    expected = b"\x01" + integer.UInt16.prim_pack(5) + b"hello" + integer.UInt32.prim_pack(2)
+    assert packed == expected
+    assert s.struct_unpack(packed) == (1, "hello", 2)
+
+
+def test_var_size_struct_pack_buffer():
+    s = Struct(integer.UInt8, PascalString(align_as(integer.UInt8, 1)), integer.UInt16)
+    samples = [(1, "a", 2), (3, "bcd", 4), (5, "", 6)]
+    buffer = bytearray(b"?")
+    written = 0
+    for sample in samples:
+        written += s.struct_pack_buffer(buffer, *sample, offset=1 + written, origin=0)
+    assert len(buffer) == 1 + written
+    expected = bytearray(b"?")
+    for sample in samples:
+        expected.extend(bytes(-len(expected) % align_of(s)))
+        expected.extend(s.struct_pack(*sample))
+    expected.extend(bytes(-len(expected) % align_of(s)))
+    assert buffer == expected
+
+
+def test_fixed_size_struct_unpack_fast_path():
+    name = StringBuffer(3)
+    s = Struct(integer.UInt8, Padding(2), byteorder_as(integer.UInt16, "big"), name, floating.Float64, Boolean)
+    packed = s.struct_pack(1, 2, "abc", 0.5, True)
+    assert s.struct_unpack(packed) == (1, 2, "abc", 0.5, True)
+    assert s.struct_unpack_buffer(bytes(8) + packed, offset=1, origin=0) == (size_of(s) + 7, (1, 2, "abc", 0.5, True))  # offset 1 is aligned to 8
+    mixed = Struct(byteorder_as(integer.UInt16, "big"), byteorder_as(integer.UInt16, "little"))
+    assert mixed.struct_unpack(mixed.struct_pack(1, 2)) == (1, 2)
+
+
+def test_unpack_member():
+    s = Struct(integer.UInt8, Padding(3), floating.Float32, StringBuffer(4))
+    packed = b"??" + s.struct_pack(7, 1.5, "abcd")
+    assert s.unpack_member(packed, 0, offset=2) == 7
+    assert s.unpack_member(packed, 1, offset=2) == 1.5
+    assert s.unpack_member(packed, 2, offset=2) == "abcd"
+    with pytest.raises(UnpackBufferSizeError):
+        s.unpack_member(packed[:-1], 2, offset=2)
+    with pytest.raises(VarSizeError):
+        Struct(PascalString(integer.UInt8)).unpack_member(b"\x00", 0)
+
+
+@pytest.mark.parametrize("origin", [1, 3, 5])
+def test_fixed_size_struct_unpack_unaligned_origin(origin: int):
+    # Members without a struct module mapping are aligned relative to the struct; not the buffer
+    s = Struct(integer.UInt8, StringBuffer(4, alignment=4))
+    packed = bytes(origin) + s.struct_pack(7, "abcd")
+    assert s.struct_unpack_buffer(packed, offset=0, origin=origin) == (8, (7, "abcd"))
+    assert s.unpack_member(packed, 1, offset=origin) == "abcd"
+    nested = Struct(integer.UInt8, Struct(integer.UInt8, integer.UInt32))
+    packed = bytes(origin) + nested.struct_pack(1, (2, 3))
+    assert nested.struct_unpack_buffer(packed, offset=0, origin=origin) == (12, (1, (2, 3)))
@@ -0,0 +1,94 @@
+from structlib.protocols.typedef import align_as
+from structlib.typedefs import integer
+from structlib.typedefs.strings import PascalString
+from structlib.typedefs.varlen import LengthPrefixedBytes, LengthPrefixedSequence, pack_offset_index, unpack_offset_index
+from tests import rng
+
+SAMPLES = list(rng.generate_strings(64, 5 * 23 * 2022, 32))
+
+TYPEDEFS = [
+    PascalString(integer.UInt8),
+    PascalString(align_as(integer.UInt32, 1)),
+    PascalString(align_as(integer.Int16, 1), block_size=1),
+]
+
+
+def test_build_offset_index():
+    for t in TYPEDEFS:
+        for offset in [0, 3]:
+            buffer = bytearray(offset)
+            written = t.iter_pack_buffer(buffer, *SAMPLES, offset=offset, origin=0)
+            read, index = t.build_offset_index(buffer, len(SAMPLES), offset=offset)
+            expected_read, _ = t.iter_unpack_buffer(buffer, len(SAMPLES), offset=offset)
+            assert read == expected_read == written  # Unaligned prefixes; nothing to pad
+            assert len(index) == len(SAMPLES)
+            assert index[0] == offset
+            for i, sample in enumerate(SAMPLES):
+                assert t.unpack_prim_buffer(buffer, offset=index[i])[1] == sample
+
+
+def test_lazy_sequence():
+    for t in TYPEDEFS:
+        packed = t.iter_pack(*SAMPLES)
+        read, sequence = t.iter_unpack_buffer_lazy(packed, len(SAMPLES))
+        assert isinstance(sequence, LengthPrefixedSequence)
+        assert len(sequence) == len(SAMPLES)
+        assert list(sequence) == SAMPLES
+        assert sequence[-1] == SAMPLES[-1]
+        assert list(sequence[5:20:3]) == SAMPLES[5:20:3]
+        assert list(sequence[::-1]) == SAMPLES[::-1]
+
+
+def test_lazy_sequence_origin():
+    t = LengthPrefixedBytes(integer.UInt8)
+    samples = [b"a", b"bc", b"", b"def"]
+    buffer = bytearray(b"header")
+    t.iter_pack_buffer(buffer, *samples, offset=0, origin=len(buffer))
+    _, sequence = t.iter_unpack_buffer_lazy(buffer, len(samples), origin=6)
+    assert list(sequence) == samples
+
+
+def test_offset_index_persistence():
+    t = PascalString(align_as(integer.UInt16, 1))
+    packed = t.iter_pack(*SAMPLES)
+    _, index = t.build_offset_index(packed, len(SAMPLES))
+    stored = pack_offset_index(index)
+    read, loaded = unpack_offset_index(b"??" + stored, offset=2)
+    assert read == len(stored)
+    assert loaded == index
+    sequence = LengthPrefixedSequence(t, packed, loaded)
+    assert sequence[40] == SAMPLES[40]
+
+
+def _unpack_each(t, buffer, count, offset=0):
+    results, total_read = [], 0
+    for _ in range(count):
+        read, result = t.unpack_prim_buffer(buffer, offset=offset + total_read, origin=0)
+        total_read += read
+        results.append(result)
+    return total_read, tuple(results)
+
+
+def test_iter_unpack_buffer_fast_path():
+    for t in TYPEDEFS:
+        assert t._prefix_struct() is not None
+        for offset in [0, 3]:
+            buffer = bytearray(offset)
+            t.iter_pack_buffer(buffer, *SAMPLES, offset=offset, origin=0)
+            assert t.iter_unpack_buffer(buffer, len(SAMPLES), offset=offset) == _unpack_each(t, buffer, len(SAMPLES), offset)
+
+
+def test_iter_unpack_buffer_aligned_prefix():
+    # Unpacking aligns the prefix; build the buffer by hand to match
+    t = PascalString(integer.UInt32)
+    buffer = bytearray(b"?")
+    for sample in SAMPLES:
+        encoded = sample.encode()
+        buffer.extend(bytes(-len(buffer) % 4))
+        buffer.extend(integer.UInt32.prim_pack(len(encoded)))
+        buffer.extend(encoded)
+    read, result = t.iter_unpack_buffer(buffer, len(SAMPLES), offset=1)
+    assert result == tuple(SAMPLES)
+    assert (read, result) == _unpack_each(t, buffer, len(SAMPLES), offset=1)
+    _, index = t.build_offset_index(buffer, len(SAMPLES), offset=1)
+    assert [t.unpack_prim_buffer(buffer, offset=i)[1] for i in index] == SAMPLES